@@ -0,0 +1,118 @@
+"""이동 거리와 작동 상태에 따라 플릿 전체 배터리를 틱마다 일괄 계산하는 배터리/충전 모델
+
+소모량 (%) = 역할별 m당 소모 × 이동 거리 + 역할/작동 상태별 초당 소모 × dt
+CHARGING 상태는 charge_rate (%/초)로 충전되고, 다 차면 (full_level) IDLE로 돌아갑니다.
+IDLE / MOVING / WORKING 로봇은 charge_level 미만이면 CHARGING으로, 나머지 상태 (PREPARE, PAUSE, STOP)는
+충전하러 갈 수 없으므로 error_level 이하로 떨어지면 ERROR로 바뀝니다.
+
+모든 계산은 역할 × 상태 표를 인덱싱하는 배열 연산이므로 로봇 수와 관계없이 틱당 NumPy 호출 몇 번입니다.
+"""
+import numpy as np
+
+from robot_enums import ROLES, OPERATIONAL_STATUSES, OPERATIONAL_STATUS_CODES
+
+IDLE = OPERATIONAL_STATUS_CODES["IDLE"]
+MOVING = OPERATIONAL_STATUS_CODES["MOVING"]
+WORKING = OPERATIONAL_STATUS_CODES["WORKING"]
+CHARGING = OPERATIONAL_STATUS_CODES["CHARGING"]
+ERROR = OPERATIONAL_STATUS_CODES["ERROR"]
+
+# 배터리가 부족하면 스스로 충전하러 가는 상태
+_AUTO_CHARGE_STATUSES = (IDLE, MOVING, WORKING)
+
+
+class DrainProfile:
+    """역할 하나의 소모량 (per_meter: %/m, idle / working: %/초)"""
+
+    def __init__(self, per_meter=0.02, idle=0.001, working=0.007):
+        self.per_meter = per_meter
+        self.idle = idle
+        self.working = working
+
+    def per_second(self, status):
+        if status == "WORKING":
+            return self.working
+        if status in ("CHARGING", "ERROR"):
+            return 0.0
+        return self.idle
+
+
+# 기본 역할별 소모량 (물/비료/수확물을 싣는 역할은 이동과 작업 소모가 큼)
+DEFAULT_PROFILES = {
+    "EMPTY": DrainProfile(per_meter=0.015, working=0.0),
+    "CLEANING": DrainProfile(per_meter=0.02, working=0.008),
+    "WATERING": DrainProfile(per_meter=0.03, working=0.01),
+    "MONITORING": DrainProfile(per_meter=0.015, working=0.003),
+    "FERTILIZING": DrainProfile(per_meter=0.03, working=0.009),
+    "TRANSPLANTING": DrainProfile(per_meter=0.025, working=0.012),
+    "HARVESTING": DrainProfile(per_meter=0.035, working=0.012),
+}
+
+
+class BatteryModel:
+    """profiles: 역할 이름 -> DrainProfile (주지 않은 역할은 DEFAULT_PROFILES)
+
+    charge_level을 None으로 주면 자동 충전 전환을 끔
+    """
+
+    def __init__(self, profiles=None, charge_rate=0.03, charge_level=20.0, full_level=100.0, error_level=5.0):
+        profiles = dict(DEFAULT_PROFILES, **(profiles or {}))
+        self.charge_rate = charge_rate
+        self.charge_level = charge_level
+        self.full_level = full_level
+        self.error_level = error_level
+
+        # 역할 코드 -> m당 소모, (역할 코드, 상태 코드) -> 초당 소모
+        default = DrainProfile()
+        self.per_meter = np.array([profiles.get(role, default).per_meter for role in ROLES])
+        self.per_second = np.array([[profiles.get(role, default).per_second(status) for status in OPERATIONAL_STATUSES]
+                                    for role in ROLES])
+        # 2차원 인덱싱보다 빠른 1차원 take용 (역할 코드 × 상태 수 + 상태 코드)
+        self._per_second_flat = self.per_second.ravel()
+        self.auto_charge = np.zeros(len(OPERATIONAL_STATUSES), dtype=bool)
+        self.auto_charge[list(_AUTO_CHARGE_STATUSES)] = True
+
+        # 통계
+        self.charging_started = 0
+        self.charging_finished = 0
+        self.errors = 0
+
+    def step(self, battery, roles, statuses, distances, dt):
+        """battery (%)와 statuses를 제자리에서 갱신하고 상태가 바뀐 인덱스 배열을 반환
+
+        battery, roles, statuses, distances는 같은 길이의 배열 (RobotRegistry 열의 [:n] 뷰 등),
+        distances는 이번 틱에 이동한 거리 (m)입니다.
+        """
+        charging = statuses == CHARGING
+        index = roles.astype(np.intp)
+        index *= len(OPERATIONAL_STATUSES)
+        index += statuses
+        delta = self.per_meter.take(roles) * distances
+        delta += self._per_second_flat.take(index) * dt
+        delta[charging] = -self.charge_rate * dt
+        battery -= delta
+        np.clip(battery, 0.0, 100.0, out=battery)
+
+        full = charging & (battery >= self.full_level)
+        if self.charge_level is not None:
+            low = self.auto_charge[statuses] & (battery < self.charge_level)
+        else:
+            low = np.zeros(len(statuses), dtype=bool)
+        error = (battery <= self.error_level) & (statuses != ERROR) & ~charging & ~low
+
+        statuses[full] = IDLE
+        statuses[low] = CHARGING
+        statuses[error] = ERROR
+        changed = np.flatnonzero(full | low | error)
+        if changed.size:
+            self.charging_finished += int(full.sum())
+            self.charging_started += int(low.sum())
+            self.errors += int(error.sum())
+        return changed
+
+    def stats(self):
+        return {
+            "charging_started": self.charging_started,
+            "charging_finished": self.charging_finished,
+            "errors": self.errors,
+        }
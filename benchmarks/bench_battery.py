@@ -0,0 +1,48 @@
+"""배터리 모델 틱 비용 (로봇 수에 따른 로봇당 시간과 엔진 step 대비 비율)
+
+실행: python -m benchmarks.bench_battery
+"""
+import time
+
+import numpy as np
+
+from battery_model import MOVING, BatteryModel
+from fleet_engine import FleetEngine
+from robot_enums import ROLES
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'robots':>8}{'battery us/tick':>17}{'ns/robot':>10}{'engine us/tick':>16}")
+    for n in (1000, 10000, 100000):
+        engine = FleetEngine(capacity=n)
+        for i, (x, y) in enumerate(rng.uniform(0, 100, (n, 2)).tolist()):
+            engine.add_robot(f"ROBOT-{i:06d}", x, y)
+        for i, (x, y) in enumerate(rng.uniform(0, 100, (n, 2)).tolist()):
+            engine.start_mission(engine.robot_ids[i], *engine.positions[i].tolist(), x, y, 1.0)
+
+        model = BatteryModel()
+        battery = rng.uniform(20, 100, n)
+        roles = rng.integers(0, len(ROLES), n).astype(np.uint8)
+        statuses = np.full(n, MOVING, dtype=np.uint8)
+
+        ticks = 50
+        engine_time = battery_time = 0.0
+        for _ in range(ticks):
+            before = engine.positions[:n].copy()
+            start = time.perf_counter()
+            engine.step(0.5)
+            engine_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            moved = engine.positions[:n] - before
+            distances = np.hypot(moved[:, 0], moved[:, 1])
+            model.step(battery, roles, statuses, distances, 0.5)
+            battery_time += time.perf_counter() - start
+
+        per_tick = battery_time / ticks
+        print(f"{n:>8}{per_tick * 1e6:>17.1f}{per_tick / n * 1e9:>10.1f}{engine_time / ticks * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
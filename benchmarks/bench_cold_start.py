@@ -0,0 +1,72 @@
+"""프로세스 실행부터 첫 발송까지 걸리는 시간 (콜드 스타트)과 tkinter 로드 여부
+
+새 인터프리터를 띄워 코어 (simulator_core) / 부하 생성기 (loadgen, 샤드 워커와 같은 경로)로 첫 메시지를
+발송할 때까지의 시간을 잽니다. 중앙값이 COLD_START_BUDGET을 넘거나 tkinter가 로드되면 종료 코드 1.
+
+실행: python -m benchmarks.bench_cold_start
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 실행부터 첫 발송까지 허용하는 시간 (초, 중앙값 기준)
+COLD_START_BUDGET = 0.5
+RUNS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스는 첫 발송 시각 (time.time())과 tkinter 로드 여부를 출력하고 바로 종료
+_FIRST_PUBLISH = """
+import os, sys, time
+from transport import NullTransport
+
+class FirstPublish(NullTransport):
+    def publish(self, topic, payload, qos=0):
+        print(time.time(), 'tkinter' in sys.modules, flush=True)
+        os._exit(0)
+"""
+
+CASES = {
+    "simulator_core": _FIRST_PUBLISH + """
+from simulator_core import SimulatorCore
+core = SimulatorCore(metrics_file=None)
+core.connect(FirstPublish())
+core.start_mission('ROBOT-001', (0, 0), (10, 0), 1.0, 0.01)
+time.sleep(5)
+""",
+    "loadgen": _FIRST_PUBLISH + """
+from loadgen import LoadGenerator
+LoadGenerator(FirstPublish(), robots=100, hz=100.0, duration=5.0).run()
+""",
+}
+
+
+def cold_start(code):
+    """(실행부터 첫 발송까지 초, tkinter 로드 여부)"""
+    start = time.time()
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=30,
+                            check=True).stdout.split()
+    return float(output[0]) - start, output[1] == "True"
+
+
+def main():
+    baseline = statistics.median(cold_start("import time; print(time.time(), False)")[0] for _ in range(RUNS))
+    print(f"interpreter only: {baseline * 1000:.0f} ms")
+    print(f"{'entry':>16}{'median ms':>11}{'min ms':>8}{'tkinter':>9}{'budget':>9}")
+    failed = False
+    for name, code in CASES.items():
+        results = [cold_start(code) for _ in range(RUNS)]
+        times = [seconds for seconds, _ in results]
+        tkinter_loaded = any(loaded for _, loaded in results)
+        median = statistics.median(times)
+        ok = median <= COLD_START_BUDGET and not tkinter_loaded
+        failed |= not ok
+        print(f"{name:>16}{median * 1000:>11.0f}{min(times) * 1000:>8.0f}{str(tkinter_loaded):>9}"
+              f"{'ok' if ok else 'OVER':>9}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""명령 구독 처리량과 명령 -> 첫 위치 발송 지연
+
+루프백 브로커에 별도 스레드 (네트워크 스레드 역할)가 초당 rate개의 명령을 보내는 동안
+LoadGenerator가 위치를 제대로 발송하는지 (발송 수, 틱 지연)와 명령이 적용된 뒤 첫 위치가 나갈 때까지의 지연을 잽니다.
+
+실행: python -m benchmarks.bench_commands
+"""
+import json
+import threading
+import time
+
+import numpy as np
+
+from loadgen import LoadGenerator
+from transport import LoopbackTransport
+
+ROBOTS = 2000
+HZ = 5.0
+DURATION = 5.0
+BATCH_INTERVAL = 0.01
+
+
+def command_payloads(rng, count):
+    payloads = []
+    for i in range(count):
+        # 직선 이동 2 : 경유점 경로 1 : 상태 변경 1
+        if i % 4 == 3:
+            payloads.append(json.dumps({"type": "status", "status": "WORKING"}).encode())
+        else:
+            waypoints = rng.uniform(0, 100, (2 if i % 4 == 2 else 1, 2)).round(2).tolist()
+            payloads.append(json.dumps({"type": "mission", "speed": 1.0, "waypoints": waypoints}).encode())
+    return payloads
+
+
+def send_commands(transport, generator, rate, stop):
+    """BATCH_INTERVAL마다 rate × BATCH_INTERVAL개의 명령을 임의의 로봇에게 발송"""
+    rng = np.random.default_rng(1)
+    payloads = command_payloads(rng, 1000)
+    topics = [f"robot/{robot_id}/command" for robot_id in generator.robot_ids]
+    per_batch = max(1, int(rate * BATCH_INTERVAL))
+    deadline = time.perf_counter()
+    i = 0
+    while not stop.is_set():
+        for _ in range(per_batch):
+            transport.publish(topics[i % len(topics)], payloads[i % len(payloads)])
+            i += 7
+        deadline += BATCH_INTERVAL
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def main():
+    print(f"robots {ROBOTS}, position {HZ} Hz, {DURATION}s, loopback")
+    print(f"{'cmd/s':>7}{'applied':>9}{'applied/s':>11}{'positions':>11}{'expected':>10}"
+          f"{'tick p99 ms':>13}{'cmd p50 ms':>12}{'cmd p99 ms':>12}")
+    for rate in (0, 1000, 5000, 10000):
+        transport = LoopbackTransport()
+        generator = LoadGenerator(transport, robots=ROBOTS, hz=HZ, duration=DURATION, commands=True)
+        stop = threading.Event()
+        sender = threading.Thread(target=send_commands, args=(transport, generator, rate, stop), daemon=True)
+        if rate:
+            sender.start()
+        generator.run()
+        stop.set()
+        if rate:
+            sender.join()
+
+        commands = generator.commands.stats()
+        latency = np.frombuffer(generator.command_latency, dtype=np.float64) * 1000
+        lateness = np.frombuffer(generator.tick_lateness, dtype=np.float64) * 1000
+        p50, p99 = np.percentile(latency, [50, 99]) if latency.size else (0.0, 0.0)
+        print(f"{rate:>7}{commands['applied']:>9}{commands['applied'] / generator.elapsed:>11.0f}"
+              f"{generator.sent:>11}{int(ROBOTS * HZ * DURATION):>10}{np.percentile(lateness, 99):>13.1f}"
+              f"{p50:>12.1f}{p99:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
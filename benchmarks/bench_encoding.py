@@ -0,0 +1,87 @@
+"""기존 메시지 생성 경로와 TelemetryEncoder 비교
+
+실행: python -m benchmarks.bench_encoding
+"""
+import json
+import timeit
+from datetime import datetime
+
+from telemetry_encoder import TelemetryEncoder
+
+ROBOT_IDS = [f"ROBOT-{i:03d}" for i in range(100)]
+NUMBER = 200
+
+
+def legacy_position(robot_id, x, y, heading):
+    """기존 run_simulation 방식 (dict 생성 + 발송/로그용 json.dumps 두 번)"""
+    message = {
+        "robot_id": robot_id,
+        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "position": {
+            "x": round(x, 2),
+            "y": round(y, 2),
+            "z": 0
+        },
+        "heading": heading
+    }
+    payload = json.dumps(message)
+    log_line = json.dumps(message, ensure_ascii=False)
+    return payload, log_line
+
+
+def legacy_status(robot_id, battery_level, role, operational_status):
+    """기존 run_status_publishing 방식"""
+    message = {
+        "robot_id": robot_id,
+        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "battery_level": battery_level,
+        "role": role,
+        "operational_status": operational_status
+    }
+    payload = json.dumps(message)
+    log_line = json.dumps(message, ensure_ascii=False)
+    return payload, log_line
+
+
+def main():
+    encoder = TelemetryEncoder()
+
+    def encoded_position(robot_id, x, y, heading):
+        payload = encoder.position(robot_id, x, y, heading)
+        return payload, payload.decode()
+
+    def encoded_status(robot_id, battery_level, role, operational_status):
+        payload = encoder.status(robot_id, battery_level, role, operational_status)
+        return payload, payload.decode()
+
+    # 같은 초 안에서는 바이트 단위로 동일한 결과인지 확인
+    timestamp = encoder.timestamps.get()
+    for i, robot_id in enumerate(ROBOT_IDS):
+        x, y, heading = i * 1.337, i * 0.25 - 7.0, round(i * 3.6, 2)
+        expected = json.loads(legacy_position(robot_id, x, y, heading)[0])
+        expected["timestamp"] = timestamp
+        assert encoder.position(robot_id, x, y, heading, timestamp).decode() == json.dumps(expected)
+
+        expected = json.loads(legacy_status(robot_id, 80 - i % 50, "WATERING", "MOVING")[0])
+        expected["timestamp"] = timestamp
+        assert encoder.status(robot_id, 80 - i % 50, "WATERING", "MOVING", timestamp).decode() == json.dumps(expected)
+
+    cases = [
+        ("position", legacy_position, encoded_position,
+         lambda: [(robot_id, i * 1.337, i * 0.25, 26.57) for i, robot_id in enumerate(ROBOT_IDS)]),
+        ("status", legacy_status, encoded_status,
+         lambda: [(robot_id, 80, "WATERING", "MOVING") for robot_id in ROBOT_IDS]),
+    ]
+
+    print(f"{'message':<10}{'legacy us/msg':>16}{'encoder us/msg':>16}{'speedup':>10}")
+    for name, legacy, encoded, make_args in cases:
+        args = make_args()
+        legacy_time = min(timeit.repeat(lambda: [legacy(*a) for a in args], number=NUMBER, repeat=5))
+        encoded_time = min(timeit.repeat(lambda: [encoded(*a) for a in args], number=NUMBER, repeat=5))
+        messages = NUMBER * len(args)
+        print(f"{name:<10}{legacy_time / messages * 1e6:>16.2f}{encoded_time / messages * 1e6:>16.2f}"
+              f"{legacy_time / encoded_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""플릿 지도 프레임 시간: 로봇 5,000대를 10 FPS로 그릴 때 프레임마다 걸리는 시간
+
+FleetEngine으로 로봇을 움직이며 (프레임 사이 0.1초) 다음 경우를 FleetMap.draw()로 그립니다.
+
+- 정지: 모든 로봇이 멈춰 있음 (바뀐 항목 없음)
+- 10% 이동: 500대만 이동 (나머지 항목은 건드리지 않음)
+- 전체 이동: 5,000대가 모두 이동 (프레임 상한까지 갱신)
+- 상태 변경: 멈춘 채 프레임마다 1%의 작동 상태가 바뀜 (색만 바꿈)
+
+화면 (DISPLAY)이 있으면 실제 tk.Canvas에 그리고 화면 갱신 (update)까지 시간에 넣습니다.
+화면이 없으면 캔버스 호출 수만 세는 캔버스로 스냅샷과 바뀐 항목 계산 비용을 잽니다.
+
+실행: python -m benchmarks.bench_fleet_map
+"""
+import statistics
+import time
+
+import numpy as np
+
+from battery_model import IDLE, MOVING, WORKING
+from fleet_engine import FleetEngine
+from fleet_map import MAP_FPS, FleetMap
+from loadgen import FARM_SIZE
+
+ROBOTS = 5000
+FRAMES = 100
+CANVAS_SIZE = 800
+
+
+class CountingCanvas:
+    """tk.Canvas 대신 호출 수만 세는 캔버스 (화면이 없을 때)"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.calls = 0
+        self._next = 0
+
+    def create_polygon(self, *points, **options):
+        self.calls += 1
+        self._next += 1
+        return self._next
+
+    def coords(self, item, *points):
+        self.calls += 1
+
+    def itemconfigure(self, item, **options):
+        self.calls += 1
+
+    def delete(self, item):
+        self.calls += 1
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def after(self, ms, callback):
+        pass
+
+    def update(self):
+        pass
+
+
+def make_canvas():
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return CountingCanvas(CANVAS_SIZE, CANVAS_SIZE), "counting canvas (no display)"
+    canvas = tk.Canvas(root, width=CANVAS_SIZE, height=CANVAS_SIZE, background="white")
+    canvas.pack()
+    root.update()
+    return canvas, "tk.Canvas"
+
+
+def run(canvas, rng, moving_fraction, status_changes):
+    engine = FleetEngine(capacity=ROBOTS)
+    for i in range(ROBOTS):
+        x, y = rng.uniform(0, FARM_SIZE, 2).tolist()
+        engine.add_robot(f"ROBOT-{i:05d}", x, y)
+    statuses = np.full(ROBOTS, IDLE, dtype=np.uint8)
+    movers = np.flatnonzero(rng.random(ROBOTS) < moving_fraction)
+
+    def snapshot():
+        count = engine.count
+        return engine.positions[:count].copy(), engine.headings[:count].copy(), statuses[:count].copy()
+
+    fleet_map = FleetMap(canvas, snapshot, bounds=(0.0, 0.0, FARM_SIZE, FARM_SIZE))
+    fleet_map.clear()
+    started = time.perf_counter()
+    fleet_map.draw()
+    canvas.update()
+    first = time.perf_counter() - started
+
+    frame_times = []
+    updates = []
+    dt = 1.0 / MAP_FPS
+    for _ in range(FRAMES):
+        # 도착한 로봇은 새 목적지로 계속 이동
+        idle = movers[~engine.moving[movers]]
+        if idle.size:
+            engine.start_missions(idle, rng.uniform(0, FARM_SIZE, (idle.size, 2)), 1.0)
+            statuses[idle] = MOVING
+        engine.step(dt)
+        if status_changes:
+            changed = rng.choice(ROBOTS, status_changes, replace=False)
+            statuses[changed] = np.where(statuses[changed] == WORKING, IDLE, WORKING)
+
+        started = time.perf_counter()
+        updates.append(fleet_map.draw())
+        canvas.update()
+        frame_times.append(time.perf_counter() - started)
+    fleet_map.clear()
+    return first, frame_times, updates
+
+
+def main():
+    canvas, kind = make_canvas()
+    rng = np.random.default_rng(0)
+    print(f"{ROBOTS} robots, {FRAMES} frames at {MAP_FPS} FPS on {kind} ({CANVAS_SIZE}x{CANVAS_SIZE})")
+    print(f"{'case':<14}{'first ms':>10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'updates':>9}")
+    for name, moving_fraction, status_changes in (
+            ("static", 0.0, 0),
+            ("10% moving", 0.1, 0),
+            ("all moving", 1.0, 0),
+            ("status 1%", 0.0, ROBOTS // 100)):
+        first, frame_times, updates = run(canvas, rng, moving_fraction, status_changes)
+        frame_times.sort()
+        p99 = frame_times[min(len(frame_times) - 1, int(len(frame_times) * 0.99))]
+        print(f"{name:<14}{first * 1e3:>10.1f}{statistics.median(frame_times) * 1e3:>9.2f}{p99 * 1e3:>9.2f}"
+              f"{frame_times[-1] * 1e3:>9.2f}{statistics.mean(updates):>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""경로 계획 처리량 (큰 온실 격자, 초당 경로 수)
+
+100 m × 100 m 온실을 0.1 m 칸 (1000 × 1000칸)으로 나누고 가운데 통로를 둔 재배대 줄을 깐 뒤,
+임의의 출발점 -> 도착점 경로를 다음 세 가지로 계획합니다.
+
+- A*: 목적지마다 탐색 (캐시 없음)
+- 거리장: 충전기 / 이랑 끝 8곳의 거리장을 만들어 둔 뒤 그곳으로 가는 경로 (탐색 없음)
+- 혼합: 80%는 그 8곳, 20%는 임의의 목적지 (반복되는 목적지만 거리장을 만듦)
+
+실행: python -m benchmarks.bench_path_planner
+"""
+import time
+
+import numpy as np
+
+from path_planner import OccupancyGrid, PathPlanner
+
+SIZE = 1000
+RESOLUTION = 0.1
+BED_WIDTH = 12
+BED_PITCH = 30
+SEARCHES = 10
+FIELD_PATHS = 500
+MIXED_PATHS = 200
+
+
+def greenhouse():
+    """재배대 줄 (남북으로 긴 줄을 가운데 통로가 가로지름)과 충전기 / 이랑 끝 좌표"""
+    blocked = np.zeros((SIZE, SIZE), dtype=bool)
+    for x in range(50, SIZE - 50, BED_PITCH):
+        blocked[50:SIZE // 2 - 30, x:x + BED_WIDTH] = True
+        blocked[SIZE // 2 + 30:SIZE - 50, x:x + BED_WIDTH] = True
+    farm = SIZE * RESOLUTION
+    landmarks = {
+        "CHARGER-1": (1.0, 1.0),
+        "CHARGER-2": (farm - 1.0, 1.0),
+        "CHARGER-3": (1.0, farm - 1.0),
+        "CHARGER-4": (farm - 1.0, farm - 1.0),
+    }
+    for i, x in enumerate((10.0, 35.0, 65.0, 90.0)):
+        landmarks[f"ROW-END-{i + 1}"] = (x + BED_WIDTH * RESOLUTION + 0.5, farm / 2)
+    return OccupancyGrid(blocked, RESOLUTION, landmarks=landmarks)
+
+
+def free_points(grid, rng, count):
+    points = []
+    while len(points) < count:
+        x, y = rng.uniform(0, SIZE * RESOLUTION, 2).tolist()
+        if grid.is_free(x, y):
+            points.append((x, y))
+    return points
+
+
+def run(planner, pairs):
+    waypoints = 0
+    started = time.perf_counter()
+    for start, goal in pairs:
+        waypoints += len(planner.plan(start, goal)) - 2
+    elapsed = time.perf_counter() - started
+    return elapsed, waypoints / len(pairs)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    grid = greenhouse()
+    goals = list(grid.landmarks.values())
+    print(f"grid {grid.width}x{grid.height} cells ({grid.resolution} m), {int(grid.blocked.sum())} blocked")
+    print(f"{'case':<12}{'paths':>7}{'paths/s':>10}{'ms/path':>10}{'waypoints':>11}  planner")
+
+    # 임의의 목적지로 가는 경로는 매번 탐색 (field_threshold를 넘지 않게 함)
+    starts = free_points(grid, rng, SEARCHES)
+    targets = free_points(grid, rng, SEARCHES)
+    planner = PathPlanner(grid, field_threshold=SEARCHES + 1)
+    elapsed, waypoints = run(planner, list(zip(starts, targets)))
+    print(f"{'A*':<12}{SEARCHES:>7}{SEARCHES / elapsed:>10.1f}{elapsed / SEARCHES * 1e3:>10.1f}{waypoints:>11.1f}"
+          f"  {planner.stats()}")
+
+    planner = PathPlanner(grid)
+    started = time.perf_counter()
+    for goal in goals:
+        planner.distance_field(goal)
+    build = time.perf_counter() - started
+    print(f"{'field build':<12}{len(goals):>7}{'':>10}{build / len(goals) * 1e3:>10.1f}")
+    pairs = [(start, goals[i % len(goals)]) for i, start in enumerate(free_points(grid, rng, FIELD_PATHS))]
+    elapsed, waypoints = run(planner, pairs)
+    print(f"{'field':<12}{FIELD_PATHS:>7}{FIELD_PATHS / elapsed:>10.1f}{elapsed / FIELD_PATHS * 1e3:>10.1f}"
+          f"{waypoints:>11.1f}  {planner.stats()}")
+
+    planner = PathPlanner(grid)
+    starts = free_points(grid, rng, MIXED_PATHS)
+    others = free_points(grid, rng, MIXED_PATHS)
+    pairs = [(start, goals[i % len(goals)] if i % 5 else others[i]) for i, start in enumerate(starts)]
+    elapsed, waypoints = run(planner, pairs)
+    print(f"{'mixed':<12}{MIXED_PATHS:>7}{MIXED_PATHS / elapsed:>10.1f}{elapsed / MIXED_PATHS * 1e3:>10.1f}"
+          f"{waypoints:>11.1f}  {planner.stats()}")
+
+
+if __name__ == "__main__":
+    main()
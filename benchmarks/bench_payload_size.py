@@ -0,0 +1,44 @@
+"""JSON / 바이너리 페이로드 크기와 인코딩 시간 비교 (왕복 변환은 tests/test_binary_codec.py)
+
+실행: python -m benchmarks.bench_payload_size
+"""
+import json
+import random
+import timeit
+
+import binary_codec
+from robot_enums import ROLES, OPERATIONAL_STATUSES
+from telemetry_encoder import TelemetryEncoder
+
+SAMPLES = 1000
+
+
+def main():
+    rng = random.Random(0)
+    json_encoder = TelemetryEncoder()
+    binary_encoder = binary_codec.BinaryTelemetryEncoder()
+
+    position_args = [("ROBOT-001", rng.uniform(0, 100), rng.uniform(0, 100), round(rng.uniform(0, 360), 2))
+                     for _ in range(SAMPLES)]
+    status_args = [("ROBOT-001", rng.randrange(0, 101), rng.choice(ROLES), rng.choice(OPERATIONAL_STATUSES))
+                   for _ in range(SAMPLES)]
+
+    print(f"{'message':<10}{'json B':>10}{'binary B':>10}{'reduction':>11}{'json us':>10}{'binary us':>11}")
+    for name, args, method in (("position", position_args, "position"), ("status", status_args, "status")):
+        json_encode = getattr(json_encoder, method)
+        binary_encode = getattr(binary_encoder, method)
+        json_size = sum(len(json_encode(*a)) for a in args) / len(args)
+        binary_size = sum(len(binary_encode(*a)) for a in args) / len(args)
+        json_time = min(timeit.repeat(lambda: [json_encode(*a) for a in args], number=20, repeat=3))
+        binary_time = min(timeit.repeat(lambda: [binary_encode(*a) for a in args], number=20, repeat=3))
+        per_call = 1e6 / (20 * len(args))
+        print(f"{name:<10}{json_size:>10.1f}{binary_size:>10.1f}{(1 - binary_size / json_size) * 100:>10.1f}%"
+              f"{json_time * per_call:>10.2f}{binary_time * per_call:>11.2f}")
+
+    # 참고: 바이너리 디코딩 결과도 JSON으로 직렬화 가능
+    sample = binary_codec.decode(binary_encoder.position(*position_args[0]), "ROBOT-001")
+    print("decoded:", json.dumps(sample))
+
+
+if __name__ == "__main__":
+    main()
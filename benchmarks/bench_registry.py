@@ -0,0 +1,63 @@
+"""로봇 레지스트리의 로봇당 메모리와 일괄 등록/조회 비용 (기존 dict-of-dict 방식과 비교)
+
+실행: python -m benchmarks.bench_registry
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from robot_registry import RobotRegistry
+
+
+def measure(build):
+    """build()가 새로 할당한 메모리 (tracemalloc은 느리므로 시간은 따로 잼)"""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'robots':>8}{'registry B/robot':>18}{'dicts B/robot':>15}{'add ms':>9}{'query us':>10}{'remove ms':>11}")
+    for n in (1000, 10000, 100000):
+        robot_ids = [f"ROBOT-{i:06d}" for i in range(n)]
+        batteries = rng.integers(0, 101, n)
+
+        def build_registry():
+            registry = RobotRegistry()
+            registry.add_many(robot_ids, x=rng.uniform(0, 100, n), y=rng.uniform(0, 100, n), battery=batteries)
+            return registry
+
+        def build_dicts():
+            positions = {robot_id: {'x': 0.0, 'y': 0.0} for robot_id in robot_ids}
+            states = {robot_id: {'battery': int(battery), 'role': 'EMPTY', 'operational_status': 'IDLE'}
+                      for robot_id, battery in zip(robot_ids, batteries.tolist())}
+            return positions, states
+
+        # ID 문자열은 양쪽이 공유하므로 미리 만든 뒤 측정
+        _, registry_bytes = measure(build_registry)
+        _, dict_bytes = measure(build_dicts)
+
+        start = time.perf_counter()
+        registry = build_registry()
+        add_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        low = registry.select(battery_below=20)
+        query_time = time.perf_counter() - start
+        assert len(low) == int((batteries < 20).sum())
+
+        start = time.perf_counter()
+        registry.remove_many(robot_ids[::2])
+        remove_time = time.perf_counter() - start
+        assert len(registry) == n - len(robot_ids[::2])
+
+        print(f"{n:>8}{registry_bytes / n:>18.1f}{dict_bytes / n:>15.1f}{add_time * 1000:>9.2f}"
+              f"{query_time * 1e6:>10.1f}{remove_time * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
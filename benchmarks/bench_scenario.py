@@ -0,0 +1,73 @@
+"""시나리오 파일로 대규모 플릿을 띄우는 시작 시간 (첫 발송까지 / 전체 로드까지)
+
+실행: python -m benchmarks.bench_scenario
+"""
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from loadgen import LoadGenerator
+from robot_enums import ROLES
+from scenario import open_scenario
+from sim_clock import SimClock
+from transport import NullTransport
+
+
+class TimingTransport(NullTransport):
+    """첫 발송 시각을 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self.first_publish = None
+
+    def publish(self, topic, payload, qos=0):
+        if self.first_publish is None:
+            self.first_publish = time.perf_counter()
+        return super().publish(topic, payload, qos)
+
+
+def write_scenario(path, robots, rng):
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, (x, y) in enumerate(rng.uniform(0, 100, (robots, 2)).tolist()):
+            f.write(json.dumps({"type": "robot", "id": f"ROBOT-{i:05d}", "x": round(x, 2), "y": round(y, 2),
+                                "battery": int(rng.integers(30, 101)), "role": ROLES[i % len(ROLES)]}) + "\n")
+            waypoints = rng.uniform(0, 100, (3, 2)).round(2).tolist()
+            f.write(json.dumps({"type": "mission", "robot": f"ROBOT-{i:05d}", "at": round(float(rng.uniform(0, 5)), 2),
+                                "speed": 1.0, "waypoints": waypoints, "then": "WORKING"}) + "\n")
+            f.write(json.dumps({"type": "status", "robot": f"ROBOT-{i:05d}", "at": 30, "status": "IDLE"}) + "\n")
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'robots':>8}{'file KiB':>10}{'parse ms':>10}{'first msg ms':>14}{'loaded ms':>11}{'records/s':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for robots in (1000, 5000, 10000):
+            path = os.path.join(directory, f"fleet_{robots}.jsonl")
+            write_scenario(path, robots, rng)
+
+            start = time.perf_counter()
+            records = sum(1 for _ in open_scenario(path))
+            parse_time = time.perf_counter() - start
+
+            # 파일을 다 읽을 때까지만 (가상 시간으로) 실행해서 시작 비용만 측정
+            transport = TimingTransport()
+            generator = LoadGenerator(transport, robots=0, hz=10.0, clock=SimClock(), scenario=open_scenario(path))
+            scheduler = generator.scheduler
+            start = time.perf_counter()
+            generator.scenario.start(scheduler)
+            scheduler.schedule(1.0 / generator.hz, generator.position_tick)
+            while not generator.scenario.finished:
+                scheduler.run_virtual(until=generator.clock() + generator.scenario.interval)
+            loaded = time.perf_counter()
+            assert generator.robots == robots
+
+            print(f"{robots:>8}{os.path.getsize(path) / 1024:>10.0f}{parse_time * 1000:>10.1f}"
+                  f"{(transport.first_publish - start) * 1000:>14.1f}{(loaded - start) * 1000:>11.1f}"
+                  f"{records / parse_time:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""샤드 수에 따른 최대 발송 처리량 (null 백엔드, 한 프로세스로는 따라갈 수 없는 부하)
+
+실행: python -m benchmarks.bench_sharding
+"""
+import os
+
+from sharding import ShardCoordinator
+
+ROBOTS = 20000
+HZ = 20.0
+DURATION = 3.0
+
+
+def main():
+    cores = os.cpu_count() or 1
+    print(f"cores {cores}, robots {ROBOTS}, {HZ} Hz (demand {ROBOTS * HZ:.0f} msg/s)")
+    print(f"{'shards':>8}{'msg/s':>10}{'scaling':>9}{'dropped':>10}")
+    baseline = None
+    shards = 1
+    while shards <= max(4, cores):
+        coordinator = ShardCoordinator(shards, robots=ROBOTS, hz=HZ, duration=DURATION, transport="null")
+        coordinator.start()
+        metrics = coordinator.join()
+        throughput = metrics["sent"] / metrics["elapsed"]
+        baseline = baseline or throughput
+        print(f"{shards:>8}{throughput:>10.0f}{throughput / baseline:>8.2f}x{metrics['skipped_messages']:>10}")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
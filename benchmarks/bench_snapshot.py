@@ -0,0 +1,70 @@
+"""로봇별 위치 토픽과 fleet/snapshot 프레임의 초당 패킷 수 / 바이트 / 인코딩 비용 비교
+
+실행: python -m benchmarks.bench_snapshot
+"""
+import time
+
+import numpy as np
+
+from fleet_engine import FleetEngine
+from fleet_snapshot import FleetSnapshotDecoder, FleetSnapshotEncoder
+from telemetry_encoder import TelemetryEncoder
+
+HZ = 2.0
+TICKS = 40
+FARM_SIZE = 100.0
+# 틱마다 움직이는 로봇 비율 (나머지는 작업 중이라 정지)
+MOVING_RATIO = 0.3
+
+
+def make_fleet(n, rng):
+    engine = FleetEngine(capacity=n)
+    for i in range(n):
+        x, y = rng.uniform(0, FARM_SIZE, 2)
+        engine.add_robot(f"ROBOT-{i:05d}", float(x), float(y))
+    for slot in rng.choice(n, int(n * MOVING_RATIO), replace=False).tolist():
+        x, y = engine.positions[slot]
+        end_x, end_y = rng.uniform(0, FARM_SIZE, 2)
+        engine.start_mission(engine.robot_ids[slot], float(x), float(y), float(end_x), float(end_y), 1.0)
+    return engine
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{HZ} Hz, {MOVING_RATIO:.0%} moving")
+    print(f"{'robots':>8}{'mode':>10}{'pkt/s':>9}{'KiB/s':>10}{'encode ms/tick':>16}")
+    for n in (100, 1000, 10000):
+        engine = make_fleet(n, rng)
+        encoder = TelemetryEncoder()
+        snapshot = FleetSnapshotEncoder(engine.robot_ids)
+        decoder = FleetSnapshotDecoder()
+        per_robot_bytes = per_robot_time = 0
+        snapshot_bytes = snapshot_time = 0
+
+        for _ in range(TICKS):
+            engine.step(1.0 / HZ)
+            positions = engine.positions[:n]
+            headings = engine.headings[:n]
+
+            start = time.perf_counter()
+            for robot_id, (x, y), heading in zip(engine.robot_ids, positions.tolist(), headings.tolist()):
+                per_robot_bytes += len(encoder.position(robot_id, x, y, heading))
+            per_robot_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            frame = snapshot.encode(positions, headings)
+            snapshot_time += time.perf_counter() - start
+            snapshot_bytes += len(frame)
+
+            decoder.decode(frame)
+            assert np.abs(decoder.positions - positions).max() <= 0.01 + 1e-6
+
+        seconds = TICKS / HZ
+        print(f"{n:>8}{'robot':>10}{n * HZ:>9.0f}{per_robot_bytes / seconds / 1024:>10.1f}"
+              f"{per_robot_time / TICKS * 1000:>16.2f}")
+        print(f"{'':>8}{'snapshot':>10}{HZ:>9.0f}{snapshot_bytes / seconds / 1024:>10.1f}"
+              f"{snapshot_time / TICKS * 1000:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
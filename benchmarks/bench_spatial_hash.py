@@ -0,0 +1,62 @@
+"""공간 해시 기반 근접 검사의 틱당 비용 (로봇 밀도 일정)
+
+실행: python -m benchmarks.bench_spatial_hash
+"""
+import time
+
+import numpy as np
+
+from spatial_hash import SpatialHash, ProximityMonitor
+
+# 로봇 1대당 면적 (m^2) - 좁은 온실 통로 수준의 밀도
+AREA_PER_ROBOT = 20.0
+TICKS = 20
+NEAR_MISS_RADIUS = 1.5
+
+
+def naive_pairs(positions, radius):
+    deltas = positions[:, None, :] - positions[None, :, :]
+    distances = np.sqrt((deltas ** 2).sum(-1))
+    return np.nonzero(np.triu(distances <= radius, 1))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'robots':>8}{'update ms':>11}{'pairs ms':>10}{'tick ms':>9}{'us/robot':>10}{'naive ms':>10}{'pairs':>8}")
+    for n in (1000, 2000, 5000, 10000):
+        side = np.sqrt(n * AREA_PER_ROBOT)
+        positions = rng.uniform(0, side, (n, 2))
+        velocities = rng.normal(0, 0.5, (n, 2))
+        slots = np.arange(n)
+
+        spatial_hash = SpatialHash(cell_size=NEAR_MISS_RADIUS, capacity=n)
+        spatial_hash.update(slots, positions)
+        monitor = ProximityMonitor(spatial_hash, [f"ROBOT-{i:05d}" for i in range(n)],
+                                   near_miss_radius=NEAR_MISS_RADIUS)
+
+        update_time = pairs_time = 0.0
+        for _ in range(TICKS):
+            positions += velocities * 0.5
+            start = time.perf_counter()
+            spatial_hash.update(slots, positions)
+            update_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            monitor.check()
+            pairs_time += time.perf_counter() - start
+
+        a, _, _ = spatial_hash.close_pairs(NEAR_MISS_RADIUS)
+        naive = ""
+        if n <= 5000:
+            start = time.perf_counter()
+            naive_a, _ = naive_pairs(positions, NEAR_MISS_RADIUS)
+            naive = f"{(time.perf_counter() - start) * 1000:.1f}"
+            assert len(naive_a) == len(a)
+
+        tick = (update_time + pairs_time) / TICKS
+        print(f"{n:>8}{update_time / TICKS * 1000:>11.2f}{pairs_time / TICKS * 1000:>10.2f}"
+              f"{tick * 1000:>9.2f}{tick / n * 1e6:>10.2f}{naive:>10}{len(a):>8}")
+
+
+if __name__ == "__main__":
+    main()
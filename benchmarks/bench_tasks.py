@@ -0,0 +1,84 @@
+"""작업 배정 지연: 로봇 10,000대 중 IDLE 로봇에게 한 틱에 몰린 작업 1,000개 배정
+
+TaskAllocator.allocate() 한 번 (KD 트리 생성 포함)의 소요 시간과 작업당 시간, 평균 이동 거리를
+작업마다 전체 로봇과의 거리를 계산하는 전수 탐색과 비교합니다.
+
+실행: python -m benchmarks.bench_tasks
+"""
+import statistics
+import time
+
+import numpy as np
+
+from battery_model import IDLE, MOVING
+from kd_tree import KDTree
+from loadgen import FARM_SIZE
+from task_allocator import MODES, Task, TaskAllocator
+
+ROBOTS = 10000
+TASKS = 1000
+RUNS = 5
+
+
+def fleet(rng):
+    positions = rng.uniform(0, FARM_SIZE, (ROBOTS, 2))
+    # 절반은 IDLE, 나머지는 이동 중 / 배터리 부족
+    statuses = np.where(rng.random(ROBOTS) < 0.5, IDLE, MOVING).astype(np.uint8)
+    battery = rng.uniform(10, 100, ROBOTS)
+    return positions, statuses, battery
+
+
+def brute_force(tasks, positions, statuses, battery, min_battery=30.0):
+    """작업마다 남은 로봇 전체와의 거리를 계산해서 가장 가까운 로봇 (비교 기준)"""
+    available = (statuses == IDLE) & (battery >= min_battery)
+    xs = positions[:, 0]
+    ys = positions[:, 1]
+    total = 0.0
+    for task in tasks:
+        d2 = np.where(available, (xs - task.x) ** 2 + (ys - task.y) ** 2, np.inf)
+        slot = int(d2.argmin())
+        available[slot] = False
+        total += float(np.sqrt(d2[slot]))
+    return total
+
+
+def main():
+    rng = np.random.default_rng(0)
+    positions, statuses, battery = fleet(rng)
+    targets = rng.uniform(0, FARM_SIZE, (TASKS, 2)).tolist()
+    eligible = int(((statuses == IDLE) & (battery >= 30.0)).sum())
+    print(f"robots {ROBOTS} ({eligible} idle with battery >= 30%), tasks {TASKS}, median of {RUNS} runs")
+
+    build = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        KDTree(positions[(statuses == IDLE) & (battery >= 30.0)])
+        build.append(time.perf_counter() - started)
+    print(f"kd-tree build    {statistics.median(build) * 1e3:8.1f} ms")
+    print(f"{'mode':<14}{'allocate ms':>12}{'us/task':>10}{'mean dist m':>13}")
+
+    for mode in MODES:
+        times = []
+        for _ in range(RUNS):
+            allocator = TaskAllocator(mode=mode)
+            for i, (x, y) in enumerate(targets):
+                allocator.submit(Task(i, x, y))
+            started = time.perf_counter()
+            assigned = allocator.allocate(positions, statuses, battery)
+            times.append(time.perf_counter() - started)
+            assert len(assigned) == TASKS
+        elapsed = statistics.median(times)
+        print(f"{mode:<14}{elapsed * 1e3:>12.1f}{elapsed / TASKS * 1e6:>10.1f}{allocator.distance / TASKS:>13.2f}")
+
+    tasks = [Task(i, x, y) for i, (x, y) in enumerate(targets)]
+    times = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        total = brute_force(tasks, positions, statuses, battery)
+        times.append(time.perf_counter() - started)
+    elapsed = statistics.median(times)
+    print(f"{'brute force':<14}{elapsed * 1e3:>12.1f}{elapsed / TASKS * 1e6:>10.1f}{total / TASKS:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
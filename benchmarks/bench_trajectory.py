@@ -0,0 +1,55 @@
+"""경유점 경로 위치 계산 성능
+
+실행: python -m benchmarks.bench_trajectory
+"""
+import time
+
+import numpy as np
+
+from fleet_engine import FleetEngine
+from trajectory import Trajectory
+
+
+def crop_rows(rows, row_length=50.0, row_spacing=1.5):
+    """작물 이랑을 지그재그로 도는 경로"""
+    points = []
+    for row in range(rows):
+        y = row * row_spacing
+        xs = (0.0, row_length) if row % 2 == 0 else (row_length, 0.0)
+        points.extend([(xs[0], y), (xs[1], y)])
+    return points
+
+
+def main():
+    print(f"{'waypoints':>10}{'sample us':>12}{'sample_many ns/robot':>22}")
+    for rows in (10, 100, 1000, 10000):
+        trajectory = Trajectory(crop_rows(rows))
+        distances = np.random.default_rng(0).uniform(0, trajectory.length, 10000)
+
+        scalar = distances[:1000].tolist()
+        start = time.perf_counter()
+        for distance in scalar:
+            trajectory.sample(distance)
+        sample_time = (time.perf_counter() - start) / len(scalar)
+
+        start = time.perf_counter()
+        for _ in range(10):
+            trajectory.sample_many(distances)
+        batch_time = (time.perf_counter() - start) / (10 * len(distances))
+
+        print(f"{len(trajectory.points):>10}{sample_time * 1e6:>12.2f}{batch_time * 1e9:>22.1f}")
+
+    # 같은 경로를 도는 로봇 1만 대를 엔진으로 한 번에 이동
+    trajectory = Trajectory(crop_rows(100))
+    engine = FleetEngine(capacity=10000)
+    for i in range(10000):
+        engine.start_route(f"ROBOT-{i:05d}", trajectory, speed=1.0, start_distance=i * 0.5)
+    start = time.perf_counter()
+    for _ in range(100):
+        engine.step(0.5)
+    print(f"engine step (10000 robots, {len(trajectory.points)} waypoints): "
+          f"{(time.perf_counter() - start) / 100 * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""위치/상태 토픽용 고정 길이 바이너리 페이로드 인코더/디코더
+
+로봇 ID는 토픽(robot/{robot_id}/...)에 이미 들어 있으므로 페이로드에 넣지 않습니다.
+
+    헤더 (10바이트): version(u8) kind(u8) timestamp_ms(u64)
+    위치 (+10바이트): x(f32) y(f32) heading(u16, 0.01도 단위)
+    상태 (+3바이트): battery_level(u8) role(u8) operational_status(u8)
+
+모든 필드는 리틀 엔디언입니다.
+"""
+import struct
+import time
+
+from robot_enums import ROLES, OPERATIONAL_STATUSES, ROLE_CODES, OPERATIONAL_STATUS_CODES
+from telemetry_encoder import format_timestamp_ms
+
+WIRE_VERSION = 1
+
+KIND_POSITION = 1
+KIND_STATUS = 2
+
+# 목록에 없는 역할/상태 값
+UNKNOWN_CODE = 0xFF
+
+_HEADER = struct.Struct('<BBQ')
+_POSITION = struct.Struct('<BBQffH')
+_STATUS = struct.Struct('<BBQBBB')
+
+POSITION_SIZE = _POSITION.size
+STATUS_SIZE = _STATUS.size
+
+
+class DecodeError(ValueError):
+    pass
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def encode_position(x, y, heading, timestamp_ms=None):
+    if timestamp_ms is None:
+        timestamp_ms = _now_ms()
+    heading_code = int(round(heading * 100)) % 36000
+    return _POSITION.pack(WIRE_VERSION, KIND_POSITION, timestamp_ms, x, y, heading_code)
+
+
+def encode_status(battery_level, role, operational_status, timestamp_ms=None):
+    if timestamp_ms is None:
+        timestamp_ms = _now_ms()
+    return _STATUS.pack(
+        WIRE_VERSION, KIND_STATUS, timestamp_ms,
+        max(0, min(100, int(battery_level))),
+        ROLE_CODES.get(role, UNKNOWN_CODE),
+        OPERATIONAL_STATUS_CODES.get(operational_status, UNKNOWN_CODE),
+    )
+
+
+def _enum_name(names, code):
+    return names[code] if code < len(names) else "UNKNOWN"
+
+
+def decode(payload, robot_id=None):
+    """바이너리 페이로드를 JSON 메시지와 같은 형태의 dict로 변환"""
+    if len(payload) < _HEADER.size:
+        raise DecodeError(f"payload too short: {len(payload)} bytes")
+
+    version, kind, timestamp_ms = _HEADER.unpack_from(payload)
+    if version != WIRE_VERSION:
+        raise DecodeError(f"unsupported wire version: {version}")
+
+    message = {"robot_id": robot_id, "timestamp": format_timestamp_ms(timestamp_ms)}
+
+    if kind == KIND_POSITION:
+        if len(payload) != POSITION_SIZE:
+            raise DecodeError(f"position payload must be {POSITION_SIZE} bytes, got {len(payload)}")
+        _, _, _, x, y, heading_code = _POSITION.unpack(payload)
+        message["position"] = {"x": round(x, 2), "y": round(y, 2), "z": 0}
+        message["heading"] = heading_code / 100
+    elif kind == KIND_STATUS:
+        if len(payload) != STATUS_SIZE:
+            raise DecodeError(f"status payload must be {STATUS_SIZE} bytes, got {len(payload)}")
+        _, _, _, battery_level, role, operational_status = _STATUS.unpack(payload)
+        message["battery_level"] = battery_level
+        message["role"] = _enum_name(ROLES, role)
+        message["operational_status"] = _enum_name(OPERATIONAL_STATUSES, operational_status)
+    else:
+        raise DecodeError(f"unknown message kind: {kind}")
+
+    return message
+
+
+class BinaryTelemetryEncoder:
+    """TelemetryEncoder와 같은 인터페이스의 바이너리 인코더 (clock: 타임스탬프용 epoch 초, 시뮬레이션 시계 등)"""
+
+    def __init__(self, clock=None):
+        self.clock = clock
+
+    def _timestamp(self, timestamp):
+        if timestamp is None and self.clock is not None:
+            return int(round(self.clock() * 1000))
+        return timestamp
+
+    def position(self, robot_id, x, y, heading, timestamp=None):
+        return encode_position(x, y, heading, self._timestamp(timestamp))
+
+    def status(self, robot_id, battery_level, role, operational_status, timestamp=None):
+        return encode_status(battery_level, role, operational_status, self._timestamp(timestamp))
+
+    def format_log(self, payload):
+        message = decode(payload)
+        del message["robot_id"]
+        return f"[{len(payload)}B] {message}"
@@ -0,0 +1,96 @@
+"""robot/{id}/command 토픽으로 받은 명령을 로봇 슬롯으로 라우팅
+
+와일드카드 구독 하나 (robot/+/command)로 모든 로봇의 명령을 받습니다. 네트워크 스레드는 토픽에서 로봇 ID를 잘라
+슬롯 dict로 찾고 (O(1)) 페이로드를 검증해서 대기열 (deque, 잠금 없음)에 넣기만 하고,
+실제 적용은 다음 위치 틱에 스케줄러 스레드가 drain()으로 한꺼번에 가져가서 합니다 (LoadGenerator.apply_commands).
+
+페이로드는 시나리오 파일의 mission / status 레코드와 같은 형식이며 robot은 토픽에서, at은 무시합니다.
+
+    robot/ROBOT-00001/command  {"type": "mission", "speed": 1.0, "waypoints": [[10, 0], [10, 20]], "then": "WORKING"}
+    robot/ROBOT-00001/command  {"type": "status", "status": "CHARGING"}
+    robot/ROBOT-00001/command  {"type": "status", "role": "WATERING", "battery": 90}
+"""
+import collections
+import json
+import time
+
+from scenario import parse_event
+
+COMMAND_TOPIC = "robot/+/command"
+# 명령 종류 (페이로드의 type)
+MISSION = "mission"
+STATUS = "status"
+# 적용을 기다리는 명령 최대 수 (넘으면 새 명령을 버림)
+MAX_QUEUED_COMMANDS = 100000
+
+_PREFIX = len("robot/")
+_SUFFIX = len("/command")
+
+
+class CommandRouter:
+    """slots: 로봇 ID -> 슬롯 dict (FleetEngine.slots 등, 발송 중에 로봇이 추가돼도 그대로 씀)"""
+
+    def __init__(self, slots, max_queued=MAX_QUEUED_COMMANDS, clock=time.perf_counter):
+        self.slots = slots
+        self.max_queued = max_queued
+        self.clock = clock
+        # (슬롯, 종류, 레코드, 받은 시각) - append와 popleft는 각각 한 스레드만 호출
+        self._queue = collections.deque()
+
+        # 통계 (네트워크 스레드가 올림)
+        self.received = 0
+        self.unknown = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.last_error = None
+        # 통계 (스케줄러 스레드가 올림)
+        self.applied = 0
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    def subscribe(self, transport):
+        transport.subscribe(COMMAND_TOPIC, self.receive)
+
+    def receive(self, topic, payload):
+        """명령 하나 수신 (네트워크 스레드, 루프백은 발송한 스레드)"""
+        self.received += 1
+        robot_id = topic[_PREFIX:-_SUFFIX]
+        slot = self.slots.get(robot_id)
+        if slot is None:
+            # 샤드 모드에서는 다른 샤드의 로봇
+            self.unknown += 1
+            return
+        try:
+            data = json.loads(payload)
+            if isinstance(data, dict):
+                data["robot"] = robot_id
+            record = parse_event(data, self.slots)
+        except ValueError as e:
+            self.rejected += 1
+            self.last_error = f"{robot_id}: {e}"
+            return
+        if len(self._queue) >= self.max_queued:
+            self.dropped += 1
+            return
+        self._queue.append((slot, data["type"], record, self.clock()))
+
+    def drain(self, limit=None):
+        """지금까지 받은 명령을 받은 순서대로 꺼냄 (스케줄러 스레드)"""
+        count = len(self._queue)
+        if limit is not None:
+            count = min(count, limit)
+        popleft = self._queue.popleft
+        commands = [popleft() for _ in range(count)]
+        self.applied += count
+        return commands
+
+    def stats(self):
+        return {
+            "received": self.received,
+            "applied": self.applied,
+            "unknown": self.unknown,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,239 @@
+"""여러 로봇의 이동을 NumPy 배열로 한 번에 계산하는 헤드리스 플릿 엔진
+
+위치는 매 스텝 더해 가지 않고 출발점으로부터의 이동 거리로 다시 계산하므로 오차가 쌓이지 않습니다.
+"""
+import numpy as np
+
+from trajectory import Trajectory
+
+# 남은 거리가 이보다 작으면 도착으로 판정 (부동소수점 누적 오차 보정)
+ARRIVAL_TOLERANCE = 1e-9
+
+
+class FleetEngine:
+    def __init__(self, capacity=64, spatial_index=None):
+        # 로봇 ID <-> 슬롯 매핑
+        self.robot_ids = []
+        self.slots = {}
+
+        # 로봇별 상태 배열 (슬롯 순서)
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.origins = np.zeros((capacity, 2), dtype=np.float64)
+        self.targets = np.zeros((capacity, 2), dtype=np.float64)
+        self.directions = np.zeros((capacity, 2), dtype=np.float64)
+        self.speeds = np.zeros(capacity, dtype=np.float64)
+        self.travelled = np.zeros(capacity, dtype=np.float64)
+        self.total_distances = np.zeros(capacity, dtype=np.float64)
+        self.headings = np.zeros(capacity, dtype=np.float64)
+        self.moving = np.zeros(capacity, dtype=bool)
+        # 등록 후 실제로 이동한 누적 거리 (m, step에서만 늘어남 - 미션 시작점으로 옮기는 것은 포함하지 않음)
+        self.odometer = np.zeros(capacity, dtype=np.float64)
+        # 위치가 정해진 로봇 (좌표를 주고 등록했거나 한 번이라도 미션 / 이동을 한 로봇)
+        # 좌표 없이 등록만 한 로봇은 (0, 0)에 있는 것으로 계산하지만 공간 인덱스에는 넣지 않음
+        self.placed = np.zeros(capacity, dtype=bool)
+
+        # 경유점 경로를 따라가는 로봇 (경로 객체 -> 슬롯 목록, 같은 경로는 한 번에 계산)
+        self.routes = {}
+        self._route_of = {}
+
+        # 위치가 바뀐 로봇을 알려 줄 공간 인덱스 (SpatialHash, 선택)
+        self.spatial_index = spatial_index
+
+    @property
+    def count(self):
+        return len(self.robot_ids)
+
+    @property
+    def remaining(self):
+        return self.total_distances - self.travelled
+
+    def _grow(self, capacity):
+        """배열 용량을 늘림 (기존 값 유지)"""
+        for name in ('positions', 'origins', 'targets', 'directions', 'speeds', 'travelled',
+                     'total_distances', 'headings', 'moving', 'placed', 'odometer'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add_robot(self, robot_id, x=None, y=None):
+        """로봇을 등록하고 슬롯 번호를 반환 (이미 있으면 기존 슬롯)
+
+        좌표를 주지 않으면 위치가 정해지지 않은 로봇으로 (0, 0)에 두고 공간 인덱스에는 넣지 않습니다.
+        """
+        if robot_id in self.slots:
+            return self.slots[robot_id]
+
+        slot = len(self.robot_ids)
+        if slot >= len(self.speeds):
+            self._grow(max(1, len(self.speeds)) * 2)
+
+        self.robot_ids.append(robot_id)
+        self.slots[robot_id] = slot
+        if x is None or y is None:
+            return slot
+        self.positions[slot] = (x, y)
+        self.origins[slot] = (x, y)
+        self.targets[slot] = (x, y)
+        self._moved(slot)
+        return slot
+
+    def _moved(self, slots):
+        self.placed[slots] = True
+        if self.spatial_index is not None:
+            self.spatial_index.update(slots, self.positions[slots])
+
+    def _detach_route(self, slot):
+        trajectory = self._route_of.pop(slot, None)
+        if trajectory is not None:
+            slots = self.routes[trajectory]
+            slots.remove(slot)
+            if not slots:
+                del self.routes[trajectory]
+
+    def start_mission(self, robot_id, start_x, start_y, end_x, end_y, speed):
+        """시작점에서 도착점까지의 직선 이동을 설정하고 슬롯 번호를 반환"""
+        slot = self.add_robot(robot_id, start_x, start_y)
+        self._detach_route(slot)
+
+        dx = end_x - start_x
+        dy = end_y - start_y
+        total_distance = float(np.hypot(dx, dy))
+
+        self.positions[slot] = (start_x, start_y)
+        self.origins[slot] = (start_x, start_y)
+        self.targets[slot] = (end_x, end_y)
+        self.speeds[slot] = speed
+        self.total_distances[slot] = total_distance
+        self.travelled[slot] = 0.0
+
+        if total_distance > 0:
+            self.directions[slot] = (dx / total_distance, dy / total_distance)
+            self.moving[slot] = True
+        else:
+            self.directions[slot] = (0.0, 0.0)
+            self.moving[slot] = False
+
+        self._update_headings(np.array([slot]))
+        self._moved(slot)
+        return slot
+
+    def start_missions(self, slots, targets, speeds):
+        """여러 로봇의 현재 위치에서 targets (N, 2)까지의 직선 이동을 한 번에 설정 (slots에 중복 없음)"""
+        slots = np.asarray(slots, dtype=np.intp)
+        if self._route_of:
+            for slot in slots.tolist():
+                self._detach_route(slot)
+
+        starts = self.positions[slots]
+        deltas = np.asarray(targets, dtype=np.float64).reshape(-1, 2) - starts
+        total_distances = np.hypot(deltas[:, 0], deltas[:, 1])
+        moving = total_distances > 0
+        directions = np.zeros_like(deltas)
+        np.divide(deltas, total_distances[:, None], out=directions, where=moving[:, None])
+
+        self.origins[slots] = starts
+        self.targets[slots] = starts + deltas
+        self.speeds[slots] = speeds
+        self.total_distances[slots] = total_distances
+        self.travelled[slots] = 0.0
+        self.directions[slots] = directions
+        self.moving[slots] = moving
+        self._update_headings(slots)
+
+    def start_route(self, robot_id, trajectory, speed, start_distance=0.0):
+        """경유점 경로(Trajectory 또는 점 목록)를 따라가는 이동을 설정하고 슬롯 번호를 반환"""
+        if not isinstance(trajectory, Trajectory):
+            trajectory = Trajectory(trajectory)
+
+        x, y, heading = trajectory.sample(start_distance)
+        slot = self.add_robot(robot_id, x, y)
+        self._detach_route(slot)
+
+        self.positions[slot] = (x, y)
+        self.origins[slot] = trajectory.start
+        self.targets[slot] = trajectory.end
+        self.directions[slot] = (0.0, 0.0)
+        self.headings[slot] = heading
+        self.speeds[slot] = speed
+        self.total_distances[slot] = trajectory.length
+        self.travelled[slot] = min(start_distance, trajectory.length)
+        self.moving[slot] = self.travelled[slot] < trajectory.length
+
+        self.routes.setdefault(trajectory, []).append(slot)
+        self._route_of[slot] = trajectory
+        self._moved(slot)
+        return slot
+
+    def stop_mission(self, robot_id):
+        """로봇을 현재 위치에 정지"""
+        slot = self.slots[robot_id]
+        self.moving[slot] = False
+        self._detach_route(slot)
+
+        # 이후 직선 이동 기준점을 현재 위치로 맞춤
+        self.origins[slot] = self.positions[slot]
+        self.targets[slot] = self.positions[slot]
+        self.travelled[slot] = 0.0
+        self.total_distances[slot] = 0.0
+
+    def _update_headings(self, slots):
+        """방향 벡터로부터 방향각 계산 (0-360도, 도 단위)"""
+        directions = self.directions[slots]
+        angles = np.degrees(np.arctan2(directions[:, 1], directions[:, 0]))
+        self.headings[slots] = np.round(np.mod(angles, 360.0), 2)
+
+    def step(self, dt, slots=None):
+        """이동 중인 로봇을 dt초만큼 이동시키고 이번 스텝에 도착한 슬롯 배열을 반환
+
+        slots를 지정하면 해당 로봇만 이동합니다.
+        """
+        n = self.count
+        moving = self.moving[:n]
+        if slots is not None:
+            mask = np.zeros(n, dtype=bool)
+            mask[slots] = True
+            moving = moving & mask
+
+        active = np.flatnonzero(moving)
+        if active.size == 0:
+            return active
+
+        total_distances = self.total_distances[active]
+        travelled = self.travelled[active] + self.speeds[active] * dt
+        arrived = travelled >= total_distances - ARRIVAL_TOLERANCE
+        travelled[arrived] = total_distances[arrived]
+        self.odometer[active] += travelled - self.travelled[active]
+        self.travelled[active] = travelled
+
+        # 직선 이동: 출발점 + 방향 * 이동 거리
+        self.positions[active] = self.origins[active] + self.directions[active] * travelled[:, None]
+
+        # 경유점 경로: 경로별로 묶어서 누적 거리 테이블로 계산
+        if self.routes:
+            for trajectory, route_slots in self.routes.items():
+                route_slots = np.asarray(route_slots)
+                route_slots = route_slots[moving[route_slots]]
+                if route_slots.size:
+                    positions, headings = trajectory.sample_many(self.travelled[route_slots])
+                    self.positions[route_slots] = positions
+                    self.headings[route_slots] = headings
+
+        # 도착한 로봇은 도착점으로 정확히 맞춤
+        arrived_slots = active[arrived]
+        self.positions[arrived_slots] = self.targets[arrived_slots]
+        self.moving[arrived_slots] = False
+        self._moved(active)
+        return arrived_slots
+
+    def progress(self, slot):
+        """진행률 (0-100%)"""
+        total = self.total_distances[slot]
+        if total <= 0:
+            return 100.0
+        return float(self.travelled[slot] / total * 100)
+
+    def position(self, robot_id):
+        """로봇의 현재 위치 (x, y)"""
+        x, y = self.positions[self.slots[robot_id]]
+        return float(x), float(y)
@@ -0,0 +1,201 @@
+"""플릿 지도: Canvas에 모든 로봇을 방향 삼각형 + 작동 상태 색으로 그림
+
+화면은 메시지마다가 아니라 고정 주기 (fps) after() 루프에서 엔진 상태 스냅샷으로 갱신합니다.
+지난 프레임에 그린 화면 좌표 (픽셀), 방향 (HEADING_STEP도 단위), 작동 상태와 비교해서 바뀐 로봇의 항목만
+옮기거나 (coords) 색을 바꾸므로 (itemconfigure) 대부분 멈춰 있는 큰 플릿은 프레임 비용이 거의 들지 않습니다.
+로봇 하나는 캔버스 항목 하나 (삼각형)라 위치와 방향을 한 번의 coords로 바꿉니다.
+
+이 모듈은 tkinter를 가져오지 않습니다. canvas는 tk.Canvas처럼 create_polygon, coords, itemconfigure, delete,
+winfo_width, winfo_height, after 메서드를 가진 객체면 됩니다.
+"""
+import collections
+import math
+import time
+
+import numpy as np
+
+from robot_enums import OPERATIONAL_STATUSES
+
+# 초당 프레임 수
+MAP_FPS = 10
+# 한 프레임에 옮기거나 색을 바꾸는 최대 로봇 수 (넘으면 나머지는 다음 프레임에 이어서)
+MAX_UPDATES_PER_FRAME = 5000
+# 로봇 삼각형 크기 (픽셀)와 방향 단위 (도)
+ROBOT_SIZE = 5
+HEADING_STEP = 15
+# 처음 보여 주는 농장 범위 (x0, y0, x1, y1, m) - 로봇이 밖으로 나가면 넓힘
+DEFAULT_BOUNDS = (0.0, 0.0, 100.0, 100.0)
+# 지도 가장자리 여백 (픽셀)
+MARGIN = 10
+# 프레임 시간 통계를 내는 최근 프레임 수
+FRAME_WINDOW = 50
+
+STATUS_COLORS = {
+    "IDLE": "#9e9e9e",
+    "PREPARE": "#fbc02d",
+    "MOVING": "#1e88e5",
+    "WORKING": "#43a047",
+    "CHARGING": "#fb8c00",
+    "PAUSE": "#8e24aa",
+    "STOP": "#424242",
+    "ERROR": "#e53935",
+}
+_COLORS = [STATUS_COLORS[status] for status in OPERATIONAL_STATUSES]
+
+
+def _triangles():
+    """방향 단위별 삼각형 꼭짓점 오프셋 (화면 좌표, y는 아래쪽이 +)"""
+    shapes = []
+    for step in range(360 // HEADING_STEP):
+        angle = math.radians(step * HEADING_STEP)
+        points = []
+        for offset, length in ((0.0, ROBOT_SIZE * 1.6), (2.5, ROBOT_SIZE), (-2.5, ROBOT_SIZE)):
+            points.extend((math.cos(angle + offset) * length, -math.sin(angle + offset) * length))
+        shapes.append(points)
+    return np.array(shapes)
+
+
+class FleetMap:
+    """snapshot(): (positions (N, 2), headings (N,), 작동 상태 코드 (N,)) 복사본을 반환하는 함수 (엔진 슬롯 순서)
+
+    is_visible(): 지도가 보일 때만 그림 (다른 탭이 열려 있으면 프레임을 건너뜀)
+    on_frame(frame_seconds, updated, robots): 그린 프레임마다 호출
+    """
+
+    def __init__(self, canvas, snapshot, bounds=DEFAULT_BOUNDS, fps=MAP_FPS, max_updates=MAX_UPDATES_PER_FRAME,
+                 is_visible=None, on_frame=None):
+        self.canvas = canvas
+        self.snapshot = snapshot
+        self.interval = 1.0 / fps
+        self.max_updates = max_updates
+        self.is_visible = is_visible
+        self.on_frame = on_frame
+        self.bounds = tuple(float(value) for value in bounds)
+        self._triangles = _triangles()
+        self._running = False
+        self._deadline = 0.0
+
+        # 슬롯별 캔버스 항목과 마지막으로 그린 화면 좌표 / 방향 단위 / 작동 상태
+        self.items = []
+        self._x = np.empty(0, dtype=np.int32)
+        self._y = np.empty(0, dtype=np.int32)
+        self._heading = np.empty(0, dtype=np.int32)
+        self._status = np.empty(0, dtype=np.uint8)
+        self._size = (0, 0)
+        self._cursor = 0
+
+        # 최근 프레임 시간 (초)
+        self.frame_times = collections.deque(maxlen=FRAME_WINDOW)
+        self.frames = 0
+
+    def start(self):
+        self._running = True
+        self._deadline = time.perf_counter()
+        self._tick()
+
+    def stop(self):
+        self._running = False
+
+    def set_bounds(self, bounds):
+        """보여 줄 농장 범위를 바꾸고 다음 프레임에 전부 다시 그림"""
+        self.bounds = tuple(float(value) for value in bounds)
+        self._size = (0, 0)
+
+    def _tick(self):
+        if not self._running:
+            return
+        if self.is_visible is None or self.is_visible():
+            self.draw()
+        # 고정 주기: 그리는 데 걸린 시간만큼 다음 대기를 줄임 (밀리면 바로 다음 프레임)
+        self._deadline += self.interval
+        now = time.perf_counter()
+        if self._deadline < now:
+            self._deadline = now
+        self.canvas.after(max(1, int((self._deadline - now) * 1000)), self._tick)
+
+    def clear(self):
+        for item in self.items:
+            self.canvas.delete(item)
+        self.items = []
+        self._x = np.empty(0, dtype=np.int32)
+        self._y = np.empty(0, dtype=np.int32)
+        self._heading = np.empty(0, dtype=np.int32)
+        self._status = np.empty(0, dtype=np.uint8)
+
+    def _fit(self, positions):
+        """로봇이 보이는 범위를 벗어나면 범위를 넓힘 (넓히면 True)"""
+        if not len(positions):
+            return False
+        low = positions.min(axis=0)
+        high = positions.max(axis=0)
+        x0, y0, x1, y1 = self.bounds
+        if low[0] >= x0 and low[1] >= y0 and high[0] <= x1 and high[1] <= y1:
+            return False
+        # 넓힐 때는 여유를 두어 조금씩 나갈 때마다 다시 그리지 않게 함
+        pad = 0.1 * max(high[0] - low[0], high[1] - low[1], x1 - x0, y1 - y0)
+        self.bounds = (min(x0, float(low[0]) - pad), min(y0, float(low[1]) - pad),
+                       max(x1, float(high[0]) + pad), max(y1, float(high[1]) + pad))
+        return True
+
+    def draw(self):
+        """스냅샷을 받아 바뀐 로봇만 다시 그림 (갱신한 로봇 수 반환)"""
+        started = time.perf_counter()
+        positions, headings, statuses = self.snapshot()
+        size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        if self._fit(positions) or size != self._size:
+            # 범위나 캔버스 크기가 바뀌면 모든 항목을 새 배율로 다시 그림
+            self._size = size
+            self.clear()
+
+        width, height = self._size
+        x0, y0, x1, y1 = self.bounds
+        scale = min((width - 2 * MARGIN) / (x1 - x0), (height - 2 * MARGIN) / (y1 - y0))
+        scale = max(scale, 1e-6)
+        xs = np.rint(MARGIN + (positions[:, 0] - x0) * scale).astype(np.int32)
+        ys = np.rint(height - MARGIN - (positions[:, 1] - y0) * scale).astype(np.int32)
+        steps = np.rint(headings / HEADING_STEP).astype(np.int32) % len(self._triangles)
+        statuses = np.asarray(statuses, dtype=np.uint8)
+
+        drawn = len(self.items)
+        moved = (xs[:drawn] != self._x) | (ys[:drawn] != self._y) | (steps[:drawn] != self._heading)
+        recolored = statuses[:drawn] != self._status
+        changed = np.flatnonzero(moved | recolored)
+        if len(changed) > self.max_updates:
+            # 많이 바뀌었으면 지난번에 멈춘 곳부터 이어서 (모든 로봇이 돌아가며 갱신됨)
+            start = int(np.searchsorted(changed, self._cursor))
+            changed = np.roll(changed, -start)[:self.max_updates]
+            self._cursor = int(changed[-1]) + 1
+
+        canvas = self.canvas
+        if len(changed):
+            coords = (self._triangles[steps[changed]] + np.repeat(
+                np.stack((xs[changed], ys[changed]), axis=1), 3, axis=0).reshape(-1, 6)).tolist()
+            items = self.items
+            for slot, points, recolor in zip(changed.tolist(), coords, recolored[changed].tolist()):
+                canvas.coords(items[slot], *points)
+                if recolor:
+                    canvas.itemconfigure(items[slot], fill=_COLORS[statuses[slot]])
+            self._x[changed] = xs[changed]
+            self._y[changed] = ys[changed]
+            self._heading[changed] = steps[changed]
+            self._status[changed] = statuses[changed]
+
+        # 새로 나타난 로봇 항목 만들기
+        new = range(drawn, len(positions))
+        if len(new):
+            shapes = (self._triangles[steps[drawn:]] + np.repeat(
+                np.stack((xs[drawn:], ys[drawn:]), axis=1), 3, axis=0).reshape(-1, 6)).tolist()
+            for points, status in zip(shapes, statuses[drawn:].tolist()):
+                self.items.append(canvas.create_polygon(*points, fill=_COLORS[status], outline=""))
+            self._x = np.concatenate((self._x, xs[drawn:]))
+            self._y = np.concatenate((self._y, ys[drawn:]))
+            self._heading = np.concatenate((self._heading, steps[drawn:]))
+            self._status = np.concatenate((self._status, statuses[drawn:]))
+
+        updated = len(changed) + len(new)
+        elapsed = time.perf_counter() - started
+        self.frame_times.append(elapsed)
+        self.frames += 1
+        if self.on_frame:
+            self.on_frame(elapsed, updated, len(positions))
+        return updated
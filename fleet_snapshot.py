@@ -0,0 +1,266 @@
+"""플릿 전체 위치를 틱마다 한 프레임으로 묶어 발송하는 스냅샷 토픽
+
+로봇마다 robot/{id}/position으로 보내면 1000대 × 2Hz = 초당 2000개의 작은 패킷이 되고
+비용 대부분이 패킷당 브로커/TCP 오버헤드입니다. 스냅샷 모드는 틱마다 fleet/snapshot 에 프레임 하나만 보냅니다.
+
+    헤더 (20바이트): version(u8) kind(u8) 예약(2바이트) sequence(u32) timestamp_ms(u64) count(u32)
+    키프레임 (kind 1): 로봇 ID 표 (count × [길이(u8) + UTF-8]) + count × [x(f32) y(f32) heading(u16)]
+    델타 (kind 2): 바뀐 로봇만 count × [slot(u32) dx(i16) dy(i16) heading(u16)]
+        dx, dy는 직전 프레임까지 복원한 위치와의 차이 (cm 단위)
+
+heading은 0.01도 단위이며 모든 필드는 리틀 엔디언입니다.
+델타는 직전 프레임을 받았을 때만 적용할 수 있으므로, 순번이 빠지면 다음 키프레임까지 기다립니다.
+
+실행 (스냅샷을 로봇별 토픽으로 다시 풀어 주는 호환 브리지):
+    python fleet_snapshot.py --broker localhost --port 1883
+"""
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from binary_codec import DecodeError
+from telemetry_encoder import TIMESTAMP_FORMAT, TelemetryEncoder
+
+FLEET_SNAPSHOT_TOPIC = "fleet/snapshot"
+SNAPSHOT_VERSION = 1
+
+KIND_KEYFRAME = 1
+KIND_DELTA = 2
+
+_HEADER = struct.Struct('<BBxxIQI')
+_KEYFRAME_ENTRY = np.dtype([('x', '<f4'), ('y', '<f4'), ('heading', '<u2')])
+_DELTA_ENTRY = np.dtype([('slot', '<u4'), ('dx', '<i2'), ('dy', '<i2'), ('heading', '<u2')])
+_DELTA_LIMIT = np.iinfo(np.int16).max
+
+
+def _heading_codes(headings):
+    return np.mod(np.round(np.asarray(headings, dtype=np.float64) * 100), 36000).astype(np.uint16)
+
+
+class FleetSnapshotEncoder:
+    """robot_ids 순서(슬롯)대로 넘겨받은 위치로 키프레임/델타 프레임을 만듦
+
+    keyframe_interval 프레임마다, 그리고 로봇 수가 바뀌거나 델타로 표현할 수 없을 만큼 움직이면 키프레임을 보냅니다.
+    dead_band (m)보다 적게 움직이고 방향도 그대로인 로봇은 델타에서 빠집니다.
+    """
+
+    def __init__(self, robot_ids, keyframe_interval=10, dead_band=0.01):
+        self.robot_ids = robot_ids
+        self.keyframe_interval = keyframe_interval
+        self.dead_band_cm = max(1, int(round(dead_band * 100)))
+        self.sequence = 0
+        self.keyframes = 0
+        self.deltas = 0
+        # 수신 측이 복원하게 될 위치/방향 (델타 기준값)
+        self._reference = None
+        self._reference_headings = None
+        self._since_keyframe = 0
+
+    def request_keyframe(self):
+        """다음 프레임을 키프레임으로 (새 구독자가 붙었을 때 등)"""
+        self._reference = None
+
+    def encode(self, positions, headings, timestamp_ms=None):
+        """positions (N, 2), headings (N,)로 다음 프레임 바이트를 만듦"""
+        if timestamp_ms is None:
+            timestamp_ms = int(time.time() * 1000)
+        positions = np.asarray(positions, dtype=np.float64)
+        heading_codes = _heading_codes(headings)
+
+        frame = None
+        if (self._reference is not None and len(self._reference) == len(positions)
+                and self._since_keyframe < self.keyframe_interval):
+            frame = self._delta(positions, heading_codes, timestamp_ms)
+        if frame is None:
+            frame = self._keyframe(positions, heading_codes, timestamp_ms)
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        return frame
+
+    def _keyframe(self, positions, heading_codes, timestamp_ms):
+        count = len(positions)
+        entries = np.empty(count, dtype=_KEYFRAME_ENTRY)
+        entries['x'] = positions[:, 0]
+        entries['y'] = positions[:, 1]
+        entries['heading'] = heading_codes
+
+        names = bytearray()
+        for robot_id in self.robot_ids[:count]:
+            encoded = robot_id.encode()
+            names.append(len(encoded))
+            names += encoded
+
+        self._reference = np.column_stack((entries['x'], entries['y'])).astype(np.float64)
+        self._reference_headings = heading_codes.copy()
+        self._since_keyframe = 1
+        self.keyframes += 1
+        return _HEADER.pack(SNAPSHOT_VERSION, KIND_KEYFRAME, self.sequence, timestamp_ms, count) \
+            + bytes(names) + entries.tobytes()
+
+    def _delta(self, positions, heading_codes, timestamp_ms):
+        """바뀐 로봇만 담은 델타 프레임 (차이가 i16 범위를 넘으면 None)"""
+        offsets = np.round((positions - self._reference) * 100)
+        changed = np.flatnonzero((np.abs(offsets) >= self.dead_band_cm).any(axis=1)
+                                 | (heading_codes != self._reference_headings))
+        offsets = offsets[changed]
+        if offsets.size and np.abs(offsets).max() > _DELTA_LIMIT:
+            return None
+
+        entries = np.empty(changed.size, dtype=_DELTA_ENTRY)
+        entries['slot'] = changed
+        entries['dx'] = offsets[:, 0]
+        entries['dy'] = offsets[:, 1]
+        entries['heading'] = heading_codes[changed]
+
+        # 수신 측과 같은 계산으로 기준값을 옮겨서 오차가 쌓이지 않게 함
+        self._reference[changed] += np.column_stack((entries['dx'], entries['dy'])) / 100
+        self._reference_headings[changed] = entries['heading']
+        self._since_keyframe += 1
+        self.deltas += 1
+        return _HEADER.pack(SNAPSHOT_VERSION, KIND_DELTA, self.sequence, timestamp_ms, changed.size) \
+            + entries.tobytes()
+
+
+class FleetSnapshotDecoder:
+    """프레임을 받아 플릿 전체 위치를 복원 (robot_ids, positions, headings)"""
+
+    def __init__(self):
+        self.robot_ids = []
+        self.positions = np.empty((0, 2), dtype=np.float64)
+        self.headings = np.empty(0, dtype=np.uint16)
+        self.timestamp_ms = None
+        self._sequence = None
+        # 순번이 빠져서 다음 키프레임까지 버린 델타 수
+        self.skipped = 0
+
+    def decode(self, payload):
+        """프레임을 적용하고 이번에 바뀐 슬롯 배열을 반환 (키프레임이면 전체)"""
+        payload = memoryview(payload)
+        if len(payload) < _HEADER.size:
+            raise DecodeError(f"snapshot frame too short: {len(payload)} bytes")
+        version, kind, sequence, timestamp_ms, count = _HEADER.unpack_from(payload)
+        if version != SNAPSHOT_VERSION:
+            raise DecodeError(f"unsupported snapshot version: {version}")
+
+        if kind == KIND_KEYFRAME:
+            slots = self._apply_keyframe(payload, count)
+        elif kind == KIND_DELTA:
+            if self._sequence is None or sequence != (self._sequence + 1) & 0xFFFFFFFF:
+                self.skipped += 1
+                self._sequence = None
+                return np.empty(0, dtype=np.int64)
+            slots = self._apply_delta(payload, count)
+        else:
+            raise DecodeError(f"unknown snapshot kind: {kind}")
+
+        self._sequence = sequence
+        self.timestamp_ms = timestamp_ms
+        return slots
+
+    def _apply_keyframe(self, payload, count):
+        position = _HEADER.size
+        robot_ids = []
+        for _ in range(count):
+            if position >= len(payload):
+                raise DecodeError("truncated robot id table")
+            length = payload[position]
+            try:
+                robot_ids.append(bytes(payload[position + 1:position + 1 + length]).decode())
+            except UnicodeDecodeError:
+                raise DecodeError("robot id is not valid UTF-8") from None
+            position += 1 + length
+
+        if len(payload) - position != count * _KEYFRAME_ENTRY.itemsize:
+            raise DecodeError(f"keyframe must carry {count} entries")
+        entries = np.frombuffer(payload, dtype=_KEYFRAME_ENTRY, count=count, offset=position)
+        self.robot_ids = robot_ids
+        self.positions = np.column_stack((entries['x'], entries['y'])).astype(np.float64)
+        self.headings = entries['heading'].copy()
+        return np.arange(count)
+
+    def _apply_delta(self, payload, count):
+        if len(payload) - _HEADER.size != count * _DELTA_ENTRY.itemsize:
+            raise DecodeError(f"delta frame must carry {count} entries")
+        entries = np.frombuffer(payload, dtype=_DELTA_ENTRY, count=count, offset=_HEADER.size)
+        slots = entries['slot'].astype(np.int64)
+        if count and slots.max() >= len(self.robot_ids):
+            raise DecodeError(f"delta refers to unknown slot {int(slots.max())}")
+        self.positions[slots] += np.column_stack((entries['dx'], entries['dy'])) / 100
+        self.headings[slots] = entries['heading']
+        return slots
+
+    def entries(self, slots):
+        """(robot_id, x, y, heading) 목록"""
+        robot_ids = self.robot_ids
+        positions = self.positions[slots].tolist()
+        headings = (self.headings[slots] / 100).tolist()
+        return [(robot_ids[slot], x, y, heading)
+                for slot, (x, y), heading in zip(np.asarray(slots).tolist(), positions, headings)]
+
+
+class SnapshotFanout:
+    """스냅샷 프레임을 받아 바뀐 로봇마다 기존 robot/{id}/position JSON 메시지로 다시 발송 (호환 브리지)
+
+    토픽별로 디코더를 따로 두므로 샤드마다 fleet/snapshot/{n}으로 보내도 함께 받을 수 있습니다.
+    """
+
+    def __init__(self, transport, pattern=FLEET_SNAPSHOT_TOPIC + "/#", encoder=None):
+        self.transport = transport
+        self.pattern = pattern
+        self.encoder = encoder or TelemetryEncoder()
+        self.decoders = {}
+        self.frames = 0
+        self.messages = 0
+        # 디코딩할 수 없어 버린 프레임 수
+        self.errors = 0
+
+    def start(self):
+        self.transport.subscribe(self.pattern, self.on_frame)
+
+    def on_frame(self, topic, payload):
+        """구독 콜백 (paho 네트워크 스레드) - 잘못된 프레임은 세고 버림"""
+        decoder = self.decoders.get(topic)
+        if decoder is None:
+            decoder = self.decoders[topic] = FleetSnapshotDecoder()
+        try:
+            slots = decoder.decode(payload)
+        except DecodeError:
+            self.errors += 1
+            return
+        self.frames += 1
+        if slots.size == 0:
+            return
+
+        timestamp = time.strftime(TIMESTAMP_FORMAT, time.gmtime(decoder.timestamp_ms // 1000))
+        encode = self.encoder.position
+        publish = self.transport.publish
+        for robot_id, x, y, heading in decoder.entries(slots):
+            publish(f"robot/{robot_id}/position", encode(robot_id, x, y, heading, timestamp))
+        self.messages += len(slots)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fleet/snapshot 프레임을 로봇별 위치 토픽으로 다시 발송")
+    parser.add_argument("--broker", default="localhost")
+    parser.add_argument("--port", type=int, default=1883)
+    args = parser.parse_args()
+
+    from transport import PahoTransport
+
+    transport = PahoTransport(args.broker, args.port)
+    fanout = SnapshotFanout(transport)
+    fanout.start()
+    transport.connect()
+    try:
+        while True:
+            time.sleep(10)
+            print(f"frames {fanout.frames}, messages {fanout.messages}, errors {fanout.errors}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transport.disconnect()
+
+
+if __name__ == "__main__":
+    main()
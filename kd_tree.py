@@ -0,0 +1,138 @@
+"""2차원 점 집합의 KD 트리 (최근접 / k-최근접 검색, 점 제외)
+
+트리는 NumPy로 한 번에 만들고 (축별 중앙값 분할, 잎마다 leaf_size개 이하), 잎의 점들은 연속된 배열 구간에
+있으므로 잎 하나를 배열 연산 한 번으로 검사합니다. 이미 배정한 로봇처럼 빠진 점은 remove()로 표시하며,
+점이 모두 빠진 가지는 검색에서 건너뜁니다. 점이 움직이면 다시 만듭니다 (로봇 1만 대에 약 20 ms).
+"""
+import heapq
+import math
+
+import numpy as np
+
+
+class KDTree:
+    def __init__(self, points, leaf_size=32):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.leaf_size = leaf_size
+        order = np.arange(len(points))
+
+        # 노드별 점 구간 [start, end), 자식 (잎은 -1), 부모, 경계 상자, 남은 점 수
+        self._start = []
+        self._end = []
+        self._left = []
+        self._right = []
+        self._parent = []
+        self._bounds = []
+        if len(points):
+            self._build(points, order, 0, len(points), -1)
+
+        # 트리 순서로 정렬한 점 (order[i] = 원래 인덱스)
+        self.order = order
+        self.points = points[order]
+        self._xs = np.ascontiguousarray(self.points[:, 0])
+        self._ys = np.ascontiguousarray(self.points[:, 1])
+        self.removed = np.zeros(len(points), dtype=bool)
+        self._available = [end - start for start, end in zip(self._start, self._end)]
+        # 트리 순서 -> 그 점이 속한 잎 노드
+        self._leaf_of = np.empty(len(points), dtype=np.int64)
+        for node, left in enumerate(self._left):
+            if left < 0:
+                self._leaf_of[self._start[node]:self._end[node]] = node
+        self._position = np.empty(len(points), dtype=np.int64)
+        self._position[order] = np.arange(len(points))
+
+    def __len__(self):
+        # 빠지지 않은 점 수
+        return self._available[0] if self._start else 0
+
+    def _build(self, points, order, start, end, parent):
+        node = len(self._start)
+        block = points[order[start:end]]
+        low = block.min(axis=0)
+        high = block.max(axis=0)
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(parent)
+        self._bounds.append((float(low[0]), float(low[1]), float(high[0]), float(high[1])))
+        if end - start > self.leaf_size:
+            # 퍼진 쪽 축의 중앙값으로 나눔
+            axis = int(np.argmax(high - low))
+            middle = (start + end) // 2
+            part = np.argpartition(block[:, axis], middle - start)
+            order[start:end] = order[start:end][part]
+            self._left[node] = self._build(points, order, start, middle, node)
+            self._right[node] = self._build(points, order, middle, end, node)
+        return node
+
+    def remove(self, index):
+        """원래 인덱스 index의 점을 이후 검색에서 제외"""
+        position = self._position[index]
+        if self.removed[position]:
+            return
+        self.removed[position] = True
+        node = int(self._leaf_of[position])
+        while node >= 0:
+            self._available[node] -= 1
+            node = self._parent[node]
+
+    def _bound(self, node, x, y):
+        """(x, y)에서 node의 경계 상자까지 거리의 제곱 (안에 있으면 0)"""
+        low_x, low_y, high_x, high_y = self._bounds[node]
+        dx = low_x - x if x < low_x else (x - high_x if x > high_x else 0.0)
+        dy = low_y - y if y < low_y else (y - high_y if y > high_y else 0.0)
+        return dx * dx + dy * dy
+
+    def nearest(self, x, y, k=1):
+        """(x, y)에서 가까운 순서로 최대 k개의 (원래 인덱스 배열, 거리 배열)"""
+        # 후보: (-거리 제곱, 트리 순서 위치) 최대 힙 (가장 먼 후보가 맨 앞)
+        best = []
+        limit = math.inf
+        if self._start and self._available[0]:
+            heap = [(0.0, 0)]
+        else:
+            heap = []
+        xs, ys = self._xs, self._ys
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if bound > limit:
+                break
+            left = self._left[node]
+            if left >= 0:
+                for child in (left, self._right[node]):
+                    if self._available[child]:
+                        child_bound = self._bound(child, x, y)
+                        if child_bound <= limit:
+                            heapq.heappush(heap, (child_bound, child))
+                continue
+
+            # 잎: 남은 점과의 거리를 한 번에 계산
+            start, end = self._start[node], self._end[node]
+            dx = xs[start:end] - x
+            dy = ys[start:end] - y
+            d2 = dx * dx + dy * dy
+            if self._available[node] < end - start:
+                d2[self.removed[start:end]] = math.inf
+            if k == 1:
+                i = int(d2.argmin())
+                distance = float(d2[i])
+                if distance < limit:
+                    best = [(-distance, start + i)]
+                    limit = distance
+                continue
+            local = np.argpartition(d2, k - 1)[:k] if end - start > k else np.arange(end - start)
+            for i, distance in zip(local.tolist(), d2[local].tolist()):
+                if distance == math.inf:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, start + i))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, start + i))
+            if len(best) == k:
+                limit = -best[0][0]
+
+        best.sort(reverse=True)
+        positions = np.array([position for _, position in best], dtype=np.int64)
+        distances = np.sqrt(np.array([-d2 for d2, _ in best], dtype=np.float64))
+        return self.order[positions], distances
@@ -0,0 +1,651 @@
+"""GUI 없이 N대의 로봇을 M Hz로 T초 동안 발송하는 부하 생성기
+
+실행 예:
+    python loadgen.py --robots 1000 --hz 2 --duration 30
+    python loadgen.py --robots 1000 --hz 2 --duration 30 --transport null
+    python loadgen.py --robots 200 --hz 5 --duration 10 --transport paho --broker localhost:1883
+    python loadgen.py --robots 20000 --hz 5 --duration 30 --transport null --shards 4
+    python loadgen.py --robots 1000 --hz 2 --duration 30 --snapshot
+    python loadgen.py --robots 100 --hz 1 --duration 86400 --virtual --output day.rec
+    python loadgen.py --robots 100 --hz 2 --duration 600 --virtual --pace 10 --transport paho
+    python loadgen.py --scenario fleet.jsonl --hz 2 --duration 60
+    python loadgen.py --robots 10000 --hz 1 --duration 60 --task-rate 50 --assign optimal
+"""
+import itertools
+import math
+import sys
+import time
+from array import array
+
+import numpy as np
+
+from battery_model import CHARGING, ERROR, IDLE, MOVING, WORKING, BatteryModel
+from fleet_engine import FleetEngine
+from fleet_snapshot import FLEET_SNAPSHOT_TOPIC, FleetSnapshotEncoder
+from publish_control import PublishController
+from robot_enums import ROLES, OPERATIONAL_STATUSES, ROLE_CODES, OPERATIONAL_STATUS_CODES, check_robot_id
+from scheduler import TickScheduler
+from telemetry_encoder import MillisecondTimestampCache, TelemetryEncoder
+from transport import TRANSPORTS, create_transport
+
+# 로봇이 돌아다니는 농장 크기 (m)
+FARM_SIZE = 100.0
+# 작업 배정 모드: 작업 위치로 가는 속도 (m/s), 임의 작업 생성 주기 (초)
+TASK_SPEED = 1.0
+TASK_INTERVAL = 0.1
+
+
+class LoadGenerator:
+    def __init__(self, transport, robots=100, hz=2.0, duration=10.0, status_hz=0.0, binary=False, seed=0,
+                 first_id=0, max_pending=0, snapshot=False, snapshot_topic=FLEET_SNAPSHOT_TOPIC, clock=None,
+                 scenario=None, commands=False, tasks=None, task_rate=0.0, task_duration=30.0):
+        self.transport = transport
+        # clock (SimClock)이 있으면 가상 시간 모드: 기다리지 않고 시뮬레이션 시간을 진행하고 그 시각을 밀리초로 찍음
+        self.clock = clock
+        # max_pending > 0이면 클라이언트 대기열에 맞춰 발송 속도를 낮추고 밀린 위치를 합침
+        self.controller = None
+        if max_pending > 0:
+            self.controller = PublishController(transport, max_pending=max_pending, clock=clock or time.monotonic)
+        self.robots = 0
+        self.hz = hz
+        self.duration = duration
+        self.status_hz = status_hz
+        if binary:
+            from binary_codec import BinaryTelemetryEncoder
+
+            self.encoder = BinaryTelemetryEncoder(clock=clock.time if clock else None)
+        elif clock:
+            self.encoder = TelemetryEncoder(MillisecondTimestampCache(clock.time))
+        else:
+            self.encoder = TelemetryEncoder()
+        self.rng = np.random.default_rng(seed)
+        # 로봇별 역할 / 작동 상태 코드와 배터리 (위치 틱마다 이동 거리에 따라 일괄 계산)
+        self.battery_model = BatteryModel()
+        self.roles = np.empty(0, dtype=np.uint8)
+        self.statuses = np.empty(0, dtype=np.uint8)
+        self.battery = np.empty(0)
+        # 도착하면 임의의 새 목적지로 계속 돌아다니는 로봇 (시나리오 로봇은 미션이 끝나면 멈춤)
+        self.wandering = np.empty(0, dtype=bool)
+        # 시나리오 미션 중인 슬롯 -> 도착 후 작동 상태 코드
+        self.arrival_statuses = {}
+
+        self.engine = FleetEngine(capacity=max(robots, 1))
+        self.robot_ids = []
+        self.position_topics = []
+        self.status_topics = []
+        # snapshot이면 위치를 로봇별 토픽 대신 틱마다 프레임 하나로 묶어서 발송
+        self.snapshot_encoder = FleetSnapshotEncoder(self.robot_ids) if snapshot else None
+        self.snapshot_topic = snapshot_topic
+        # commands면 robot/+/command를 구독하고 받은 명령을 다음 위치 틱에 한꺼번에 적용
+        self.commands = None
+        if commands:
+            from command_router import CommandRouter
+
+            self.commands = CommandRouter(self.engine.slots)
+        # tasks (TaskAllocator)가 있으면 로봇은 IDLE로 대기하다가 위치 틱마다 배정된 작업 위치로 가서 WORKING
+        # task_rate > 0이면 초당 평균 task_rate개의 작업을 임의의 농장 좌표에 생성
+        self.tasks = tasks
+        self.task_rate = task_rate
+        self.task_duration = task_duration
+        self._task_ids = itertools.count()
+        # 작업 위치로 가는 슬롯 -> 작업 시간, 작업 중인 로봇이 IDLE로 돌아갈 시각 (시뮬레이션 시간, 없으면 inf)
+        self.task_durations = {}
+        self.work_until = np.empty(0)
+        self.tasks_completed = 0
+        self.tasks_interrupted = 0
+        # 적용한 명령을 받은 시각 (그 뒤 첫 위치 발송까지의 지연 측정)
+        self._command_times = []
+        self.command_latency = array('d')
+        # scenario (시나리오 레코드)가 있으면 실행하면서 스트리밍으로 읽어 로봇과 미션을 추가
+        self.scenario = None
+        if scenario is not None:
+            from scenario import ScenarioPlayer
+
+            self.scenario = ScenarioPlayer(scenario, self)
+
+        robot_ids = [f"ROBOT-{i:05d}" for i in range(first_id, first_id + robots)]
+        self._add(robot_ids, self.rng.uniform(0, FARM_SIZE, (robots, 2)), self.rng.integers(0, len(ROLES), robots),
+                  np.full(robots, IDLE if tasks else MOVING), self.rng.uniform(20, 100, robots),
+                  wandering=tasks is None)
+
+        # 측정값
+        self.sent = 0
+        self.failed = 0
+        self.bytes_sent = 0
+        self.skipped_messages = 0
+        self.tick_lateness = array('d')
+        self.publish_latency = array('d')
+        self.scheduler = TickScheduler(clock=clock or time.monotonic, on_tick=self._on_tick)
+
+    def _new_mission(self, slot):
+        """도착한 로봇에게 새 목적지 지정"""
+        x, y = self.engine.positions[slot]
+        end_x, end_y = self.rng.uniform(0, FARM_SIZE, 2)
+        speed = self.rng.uniform(0.5, 1.5)
+        self.engine.start_mission(self.engine.robot_ids[slot], float(x), float(y), float(end_x), float(end_y), speed)
+
+    def _add(self, robot_ids, positions, roles, statuses, battery, wandering, headings=None):
+        # 스냅샷 키프레임에 넣을 수 없는 ID는 발송 틱이 아니라 등록할 때 거부
+        for robot_id in robot_ids:
+            check_robot_id(robot_id)
+        first = self.engine.count
+        self.robot_ids.extend(robot_ids)
+        self.position_topics.extend(f"robot/{robot_id}/position" for robot_id in robot_ids)
+        self.status_topics.extend(f"robot/{robot_id}/status" for robot_id in robot_ids)
+        self.roles = np.concatenate((self.roles, np.asarray(roles, dtype=np.uint8)))
+        self.statuses = np.concatenate((self.statuses, np.asarray(statuses, dtype=np.uint8)))
+        self.battery = np.concatenate((self.battery, np.asarray(battery, dtype=np.float64)))
+        self.wandering = np.concatenate((self.wandering, np.full(len(robot_ids), wandering)))
+        self.work_until = np.concatenate((self.work_until, np.full(len(robot_ids), np.inf)))
+        for robot_id, (x, y) in zip(robot_ids, np.asarray(positions).tolist()):
+            slot = self.engine.add_robot(robot_id, x, y)
+            if wandering:
+                self._new_mission(slot)
+        if headings is not None:
+            self.engine.headings[first:self.engine.count] = headings
+        self.robots = len(self.robot_ids)
+
+    def add_robots(self, robots):
+        """시나리오의 로봇 (ScenarioRobot 목록) 추가 (발송 중에도 가능)"""
+        self._add([robot.robot_id for robot in robots], [(robot.x, robot.y) for robot in robots],
+                  [ROLE_CODES[robot.role] for robot in robots],
+                  [OPERATIONAL_STATUS_CODES[robot.status] for robot in robots],
+                  [robot.battery for robot in robots], wandering=False,
+                  headings=[robot.heading for robot in robots])
+
+    def start_mission(self, mission):
+        """시나리오 / 명령 미션 시작 (현재 위치 -> 경유점)"""
+        slot = self.engine.slots[mission.robot_id]
+        # 시나리오나 명령으로 움직이는 로봇은 도착해도 임의의 새 목적지로 가지 않음
+        self.wandering[slot] = False
+        self._drop_task(slot)
+        if self.statuses[slot] in (CHARGING, ERROR):
+            return
+        x, y = self.engine.positions[slot].tolist()
+        route = [(x, y)] + mission.waypoints
+        if len(route) == 2:
+            self.engine.start_mission(mission.robot_id, x, y, *route[1], mission.speed)
+        else:
+            self.engine.start_route(mission.robot_id, route, mission.speed)
+        if self.engine.moving[slot]:
+            self.statuses[slot] = MOVING
+            self.arrival_statuses[slot] = OPERATIONAL_STATUS_CODES[mission.then]
+
+    def apply_status(self, status):
+        """시나리오 / 명령 상태 변경 적용"""
+        slot = self.engine.slots[status.robot_id]
+        self.wandering[slot] = False
+        if status.status is not None:
+            self._drop_task(slot)
+            self.statuses[slot] = OPERATIONAL_STATUS_CODES[status.status]
+            if self.statuses[slot] != MOVING:
+                self.engine.stop_mission(status.robot_id)
+                self.arrival_statuses.pop(slot, None)
+        if status.role is not None:
+            self.roles[slot] = ROLE_CODES[status.role]
+        if status.battery is not None:
+            self.battery[slot] = status.battery
+
+    def apply_commands(self):
+        """받은 명령을 한꺼번에 적용 (같은 로봇의 이동 명령은 마지막 것만, 직선 이동은 엔진에 일괄 설정)"""
+        from command_router import MISSION
+
+        missions = {}
+        for slot, kind, record, received_at in self.commands.drain():
+            self._command_times.append(received_at)
+            if kind == MISSION:
+                missions[slot] = record
+                continue
+            # 나중에 온 작동 상태 변경이 앞선 이동 명령을 대체
+            if record.status is not None:
+                missions.pop(slot, None)
+            self.apply_status(record)
+        if not missions:
+            return
+
+        self.wandering[list(missions)] = False
+        straight = []
+        for slot, mission in missions.items():
+            self._drop_task(slot)
+            if len(mission.waypoints) > 1:
+                self.start_mission(mission)
+            elif self.statuses[slot] not in (CHARGING, ERROR):
+                straight.append(slot)
+        if straight:
+            slots = np.array(straight)
+            self.engine.start_missions(slots, [missions[slot].waypoints[0] for slot in straight],
+                                       [missions[slot].speed for slot in straight])
+            moving = slots[self.engine.moving[slots]]
+            self.statuses[moving] = MOVING
+            for slot in moving.tolist():
+                self.arrival_statuses[slot] = OPERATIONAL_STATUS_CODES[missions[slot].then]
+
+    def submit_task(self, x, y, role, duration):
+        from task_allocator import Task
+
+        self.tasks.submit(Task(f"TASK-{next(self._task_ids):06d}", x, y, role, duration))
+
+    def task_tick(self):
+        """임의의 농장 좌표에 작업 생성 (평균 task_rate개/초, 역할은 EMPTY가 아닌 것 중 임의)"""
+        count = int(self.rng.poisson(self.task_rate * TASK_INTERVAL))
+        points = self.rng.uniform(0, FARM_SIZE, (count, 2)).tolist()
+        roles = self.rng.integers(1, len(ROLES), count).tolist()
+        for (x, y), role in zip(points, roles):
+            self.submit_task(x, y, ROLES[role], self.task_duration)
+
+    def dispatch_tasks(self):
+        """대기 중인 작업을 가까운 IDLE 로봇에게 배정하고 작업 위치로 출발시킴 (도착하면 WORKING)"""
+        n = self.engine.count
+        assignments = self.tasks.allocate(self.engine.positions[:n], self.statuses, self.battery)
+        if not assignments:
+            return
+        slots = np.array([slot for _, slot, _ in assignments])
+        self.wandering[slots] = False
+        self.roles[slots] = [ROLE_CODES[task.role] for task, _, _ in assignments]
+        self.engine.start_missions(slots, [(task.x, task.y) for task, _, _ in assignments], TASK_SPEED)
+        now = self.scheduler.clock()
+        for (task, slot, _), moving in zip(assignments, self.engine.moving[slots].tolist()):
+            if moving:
+                self.statuses[slot] = MOVING
+                self.arrival_statuses[slot] = WORKING
+                self.task_durations[slot] = task.duration
+            else:
+                # 이미 작업 위치에 있는 로봇은 바로 작업 시작
+                self.statuses[slot] = WORKING
+                self.work_until[slot] = now + task.duration
+
+    def _finish_tasks(self):
+        """작업 시간이 끝난 로봇을 IDLE로 되돌림 (다음 배정 대상)"""
+        done = np.flatnonzero(self.work_until <= self.scheduler.clock())
+        if done.size:
+            self.work_until[done] = np.inf
+            done = done[self.statuses[done] == WORKING]
+            self.statuses[done] = IDLE
+            self.tasks_completed += int(done.size)
+
+    def _drop_task(self, slot):
+        """충전 / 명령 등으로 작업을 그만둔 로봇의 작업 상태 제거"""
+        if self.task_durations.pop(slot, None) is not None or self.work_until[slot] != np.inf:
+            self.work_until[slot] = np.inf
+            self.tasks_interrupted += 1
+
+    @property
+    def operational_status(self):
+        return OPERATIONAL_STATUSES[self.statuses[0]] if self.robots else OPERATIONAL_STATUSES[MOVING]
+
+    @operational_status.setter
+    def operational_status(self, status):
+        """전체 로봇의 작동 상태 변경 (샤드 모드에서는 코디네이터가 바꿈)"""
+        self.statuses[:] = OPERATIONAL_STATUS_CODES[status]
+
+    def _on_tick(self, task, lateness):
+        self.tick_lateness.append(lateness)
+
+    def _publish(self, topic, payload):
+        if self.controller:
+            start = time.perf_counter()
+            self.controller.publish(topic, payload, key=topic)
+            self.publish_latency.append(time.perf_counter() - start)
+            return
+
+        start = time.perf_counter()
+        result = self.transport.publish(topic, payload)
+        self.publish_latency.append(time.perf_counter() - start)
+        if result.rc == 0:
+            self.sent += 1
+            self.bytes_sent += len(payload)
+        else:
+            self.failed += 1
+
+    def position_tick(self):
+        """받은 명령과 작업을 적용하고 전체 플릿을 한 번에 이동시킨 뒤 배터리를 계산해서 모든 로봇 위치 발송"""
+        if self.commands and self.commands.pending:
+            self.apply_commands()
+        if self.tasks:
+            self._finish_tasks()
+            if self.tasks.pending:
+                self.dispatch_tasks()
+        n = self.engine.count
+        dt = 1.0 / self.hz
+        before = self.engine.positions[:n].copy()
+        arrived = self.engine.step(dt)
+        moved = self.engine.positions[:n] - before
+        distances = np.hypot(moved[:, 0], moved[:, 1])
+        changed = self.battery_model.step(self.battery, self.roles, self.statuses, distances, dt)
+
+        # 충전하러 간 로봇은 멈추고, 다 충전된 로봇은 다시 이동
+        for slot in changed.tolist():
+            if self.statuses[slot] == IDLE:
+                if self.wandering[slot]:
+                    self.statuses[slot] = MOVING
+                    self._new_mission(slot)
+            else:
+                self.engine.stop_mission(self.robot_ids[slot])
+                self.arrival_statuses.pop(slot, None)
+                self._drop_task(slot)
+        for slot in arrived.tolist():
+            if self.statuses[slot] != MOVING:
+                continue
+            if self.wandering[slot]:
+                self._new_mission(slot)
+            else:
+                self.statuses[slot] = self.arrival_statuses.pop(slot, IDLE)
+                duration = self.task_durations.pop(slot, None)
+                if duration is not None:
+                    self.work_until[slot] = self.scheduler.clock() + duration
+        # 역압으로 발송 속도를 낮췄으면 이번 틱은 이동만 하고 발송 생략
+        if self.controller and not self.controller.admit("position", 1.0 / self.hz):
+            return
+
+        if self.snapshot_encoder:
+            frame = self.snapshot_encoder.encode(self.engine.positions[:n], self.engine.headings[:n],
+                                                 self.clock.time_ms() if self.clock else None)
+            self._publish(self.snapshot_topic, frame)
+            self._record_command_latency()
+            return
+
+        positions = self.engine.positions[:n].tolist()
+        headings = self.engine.headings[:n].tolist()
+        encode = self.encoder.position
+        timestamp = None
+        for robot_id, topic, (x, y), heading in zip(self.robot_ids, self.position_topics, positions, headings):
+            self._publish(topic, encode(robot_id, x, y, heading, timestamp))
+        self._record_command_latency()
+
+    def _record_command_latency(self):
+        if self._command_times:
+            now = time.perf_counter()
+            self.command_latency.extend(now - received_at for received_at in self._command_times)
+            self._command_times = []
+
+    def status_tick(self):
+        batteries = self.battery.astype(np.int64).tolist()
+        roles = self.roles.tolist()
+        statuses = self.statuses.tolist()
+        encode = self.encoder.status
+        for robot_id, topic, battery, role, status in zip(self.robot_ids, self.status_topics, batteries, roles,
+                                                          statuses):
+            self._publish(topic, encode(robot_id, battery, ROLES[role], OPERATIONAL_STATUSES[status]))
+
+    def run(self):
+        # 종료 작업을 먼저 등록해서 duration 시점의 틱보다 먼저 실행되게 함 ([0, duration) 구간만 발송)
+        self.scheduler.schedule(self.duration, self.scheduler.stop, delay=self.duration)
+        if self.commands:
+            self.commands.subscribe(self.transport)
+        # 시나리오 로봇을 첫 위치 틱보다 먼저 읽음
+        if self.scenario:
+            self.scenario.start(self.scheduler)
+        if self.tasks and self.task_rate > 0:
+            self.scheduler.schedule(TASK_INTERVAL, self.task_tick)
+        position_task = self.scheduler.schedule(1.0 / self.hz, self.position_tick)
+        status_task = None
+        if self.status_hz > 0:
+            status_task = self.scheduler.schedule(1.0 / self.status_hz, self.status_tick)
+
+        started = time.perf_counter()
+        if self.clock:
+            self.scheduler.run_virtual()
+        else:
+            self.scheduler.run()
+        self.elapsed = time.perf_counter() - started
+        if self.scenario and self.scenario.error:
+            raise self.scenario.error
+
+        self.skipped_messages = position_task.skipped * (1 if self.snapshot_encoder else self.robots)
+        if status_task:
+            self.skipped_messages += status_task.skipped * self.robots
+        if self.controller:
+            self.controller.flush()
+            self.sent = self.controller.sent
+            self.failed = self.controller.rejected
+            self.bytes_sent = self.transport.bytes
+        return self.report()
+
+    def metrics(self):
+        """측정값 (샤드별 결과를 merge_metrics로 합칠 수 있는 형태)"""
+        return {
+            "robots": self.robots,
+            "hz": self.hz,
+            "status_hz": self.status_hz,
+            "duration": self.duration,
+            "transport": type(self.transport).__name__,
+            "snapshot": self.snapshot_encoder is not None,
+            "virtual": self.clock is not None,
+            "sent": self.sent,
+            "failed": self.failed,
+            "bytes_sent": self.bytes_sent,
+            "skipped_messages": self.skipped_messages,
+            "elapsed": self.elapsed,
+            "tick_lateness": self.tick_lateness,
+            "publish_latency": self.publish_latency,
+            "throttle": self.controller.stats() if self.controller else None,
+            "battery": dict(self.battery_model.stats(), charging=int((self.statuses == CHARGING).sum()),
+                            mean=float(self.battery.mean()) if self.robots else 0.0),
+            "commands": dict(self.commands.stats(), latency=self.command_latency) if self.commands else None,
+            "tasks": dict(self.tasks.stats(), completed=self.tasks_completed, interrupted=self.tasks_interrupted,
+                          wait=self.tasks.wait, allocation=self.tasks.allocation_seconds) if self.tasks else None,
+        }
+
+    def report(self):
+        return format_report(self.metrics())
+
+
+def merge_metrics(results):
+    """여러 샤드의 metrics()를 하나로 합침 (경과 시간은 가장 긴 샤드 기준)"""
+    merged = dict(results[0])
+    for key in ("robots", "sent", "failed", "bytes_sent", "skipped_messages"):
+        merged[key] = sum(result[key] for result in results)
+    merged["elapsed"] = max(result["elapsed"] for result in results)
+    for key in ("tick_lateness", "publish_latency"):
+        merged[key] = array('d')
+        for result in results:
+            merged[key].extend(result[key])
+    throttles = [result["throttle"] for result in results if result["throttle"]]
+    if throttles:
+        merged["throttle"] = {key: sum(throttle[key] for throttle in throttles) for key in throttles[0]}
+        merged["throttle"]["rate"] = min(throttle["rate"] for throttle in throttles)
+    batteries = [result["battery"] for result in results]
+    merged["battery"] = {key: sum(battery[key] for battery in batteries) for key in batteries[0]}
+    merged["battery"]["mean"] = sum(battery["mean"] * result["robots"] for battery, result in zip(batteries, results)) \
+        / max(1, merged["robots"])
+    commands = [result["commands"] for result in results if result["commands"]]
+    if commands:
+        merged["commands"] = {key: sum(command[key] for command in commands) for key in commands[0] if key != "latency"}
+        merged["commands"]["latency"] = array('d')
+        for command in commands:
+            merged["commands"]["latency"].extend(command["latency"])
+    tasks = [result["tasks"] for result in results if result.get("tasks")]
+    if tasks:
+        merged["tasks"] = {}
+        for key in tasks[0]:
+            if key in ("wait", "allocation"):
+                merged["tasks"][key] = array('d')
+                for task in tasks:
+                    merged["tasks"][key].extend(task[key])
+            else:
+                merged["tasks"][key] = sum(task[key] for task in tasks)
+    merged["shards"] = len(results)
+    return merged
+
+
+def format_report(metrics):
+    def percentiles(values, scale):
+        if not values:
+            return "-"
+        p50, p90, p99 = np.percentile(np.frombuffer(values, dtype=np.float64), [50, 90, 99]) * scale
+        return f"p50 {p50:.1f}  p90 {p90:.1f}  p99 {p99:.1f}  max {max(values) * scale:.1f}"
+
+    robots = metrics["robots"]
+    elapsed = metrics["elapsed"]
+    # 스냅샷 모드는 위치 틱마다 (샤드마다) 프레임 하나
+    position_messages = metrics.get("shards", 1) if metrics["snapshot"] else robots
+    expected = math.ceil(metrics["duration"] * metrics["hz"]) * position_messages
+    if metrics["status_hz"] > 0:
+        expected += math.ceil(metrics["duration"] * metrics["status_hz"]) * robots
+    header = (f"robots {robots}, position {metrics['hz']} Hz, status {metrics['status_hz']} Hz, "
+              f"{metrics['duration']}s, transport {metrics['transport']}")
+    if "shards" in metrics:
+        header += f", shards {metrics['shards']}"
+    if metrics["snapshot"]:
+        header += ", snapshot frames"
+    if metrics.get("virtual"):
+        header += f", simulated clock ({metrics['duration'] / elapsed:.0f}x real time)"
+    lines = [
+        header,
+        f"messages         sent {metrics['sent']}  (expected {expected})  failed {metrics['failed']}  "
+        f"dropped {metrics['skipped_messages']}",
+        f"throughput       {metrics['sent'] / elapsed:.0f} msg/s  "
+        f"{metrics['bytes_sent'] / elapsed / 1024:.1f} KiB/s",
+        f"tick jitter ms   {percentiles(metrics['tick_lateness'], 1e3)}",
+        f"publish us       {percentiles(metrics['publish_latency'], 1e6)}",
+    ]
+    battery = metrics["battery"]
+    lines.append(f"battery          mean {battery['mean']:.1f}%  charging now {battery['charging']}  "
+                 f"charge cycles {battery['charging_started']}/{battery['charging_finished']}  "
+                 f"errors {battery['errors']}")
+    commands = metrics.get("commands")
+    if commands:
+        lines.append(f"commands         applied {commands['applied']}  received {commands['received']}  "
+                     f"other robots {commands['unknown']}  rejected {commands['rejected']}  "
+                     f"dropped {commands['dropped']}")
+        lines.append(f"command->pos ms  {percentiles(commands['latency'], 1e3)}")
+    tasks = metrics.get("tasks")
+    if tasks:
+        lines.append(f"tasks            assigned {tasks['assigned']}/{tasks['submitted']}  pending {tasks['pending']}  "
+                     f"completed {tasks['completed']}  interrupted {tasks['interrupted']}  "
+                     f"mean distance {tasks['distance'] / max(1, tasks['assigned']):.1f} m")
+        lines.append(f"task wait ms     {percentiles(tasks['wait'], 1e3)}")
+        lines.append(f"allocate ms      {percentiles(tasks['allocation'], 1e3)}")
+    throttle = metrics.get("throttle")
+    if throttle:
+        lines.append(f"backpressure     rate {throttle['rate'] * 100:.0f}%  throttled ticks {throttle['throttled']}  "
+                     f"deferred {throttle['deferred']}  coalesced {throttle['coalesced']}  "
+                     f"rejected {throttle['rejected']}  rate cuts {throttle['rate_decreases']}")
+    return "\n".join(lines)
+
+
+def transport_options(kind, broker, output=None, clock=None):
+    """create_transport에 넘길 옵션 (paho는 브로커 주소, file은 기록 파일 경로와 시계)"""
+    if kind == "file":
+        if clock is None:
+            return {"path": output}
+        return {"path": output, "clock": clock, "started_at": clock.start_time}
+    if kind != "paho":
+        return {}
+    host, _, port = broker.partition(':')
+    return {"host": host, "port": int(port or 1883)}
+
+
+def main():
+    # 샤드 워커도 이 모듈을 가져오므로 CLI에서만 쓰는 모듈은 여기서 가져옴
+    import argparse
+
+    from metrics import SamplingProfiler
+    from scenario import ScenarioError, open_scenario
+    from sim_clock import SimClock, parse_start_time
+
+    parser = argparse.ArgumentParser(description="헤드리스 로봇 텔레메트리 부하 생성기")
+    parser.add_argument("--robots", type=int, help="임의로 돌아다니는 로봇 수 (기본 100, --scenario가 있으면 0)")
+    parser.add_argument("--hz", type=float, default=2.0, help="로봇당 위치 발송 주기 (Hz)")
+    parser.add_argument("--duration", type=float, default=10.0, help="실행 시간 (초)")
+    parser.add_argument("--status-hz", type=float, default=0.0, help="로봇당 상태 발송 주기 (Hz, 0 = 발송 안 함)")
+    parser.add_argument("--binary", action="store_true", help="바이너리 페이로드 사용")
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default="loopback",
+                        help="발송 백엔드 (loopback = 프로세스 내부 브로커, null = 바이트만 셈)")
+    parser.add_argument("--broker", default="localhost:1883", help="paho 백엔드의 브로커 host:port")
+    parser.add_argument("--snapshot", action="store_true", help="위치를 fleet/snapshot 프레임 하나로 묶어서 발송")
+    parser.add_argument("--shards", type=int, default=1, help="로봇을 나눠 맡을 워커 프로세스 수")
+    parser.add_argument("--max-pending", type=int, default=0,
+                        help="클라이언트에 쌓일 수 있는 최대 메시지 수 (0 = 역압 제어 안 함)")
+    parser.add_argument("--profile", metavar="PATH", help="실행하는 동안 샘플링 프로파일을 접힌 스택 파일로 저장")
+    parser.add_argument("--max-inflight", type=int, default=20, help="paho QoS 1/2 인플라이트 제한")
+    parser.add_argument("--max-queued", type=int, default=0, help="paho QoS 1/2 대기열 제한 (0 = 제한 없음)")
+    parser.add_argument("--output", metavar="PATH", help="브로커 대신 기록 파일(.rec)에 씀 (--transport file)")
+    parser.add_argument("--virtual", action="store_true",
+                        help="가상 시간 모드: 실제 시간을 기다리지 않고 시뮬레이션 시간으로 진행")
+    parser.add_argument("--pace", type=float, default=0.0,
+                        help="가상 시간 모드에서 실제 시간의 N배속으로 맞춤 (0 = 최대한 빠르게)")
+    parser.add_argument("--start-time", help="가상 시간 모드의 시작 시각 (ISO 8601 UTC, 기본 현재 시각)")
+    parser.add_argument("--scenario", metavar="PATH", help="로봇/미션/상태 변경을 정의한 시나리오 파일 (JSON Lines)")
+    parser.add_argument("--commands", action="store_true", help="robot/+/command를 구독해서 받은 명령 적용")
+    parser.add_argument("--task-rate", type=float, default=0.0,
+                        help="초당 임의 작업 수 (> 0이면 로봇은 IDLE로 대기하다가 가장 가까운 작업을 맡음)")
+    parser.add_argument("--task-duration", type=float, default=30.0, help="작업 위치에 도착한 뒤 작업 시간 (초)")
+    parser.add_argument("--assign", choices=("nearest", "optimal"), default="nearest",
+                        help="작업 배정 방식 (optimal = 틱마다 몰린 작업의 이동 거리 합 최소화)")
+    parser.add_argument("--min-battery", type=float, default=30.0, help="작업을 맡을 수 있는 최소 배터리 (%%)")
+    args = parser.parse_args()
+
+    if args.robots is None:
+        args.robots = 0 if args.scenario else 100
+    if args.scenario and args.shards > 1:
+        parser.error("--scenario is not supported with --shards")
+    if args.task_rate > 0 and args.shards > 1:
+        parser.error("--task-rate is not supported with --shards")
+
+    if args.output:
+        args.transport = "file"
+    if args.transport == "file" and not args.output:
+        parser.error("--transport file requires --output")
+    if (args.pace or args.start_time) and not args.virtual:
+        parser.error("--pace and --start-time require --virtual")
+    if args.shards > 1 and (args.virtual or args.transport == "file"):
+        parser.error("--virtual and --output are not supported with --shards")
+
+    clock = None
+    if args.virtual:
+        clock = SimClock(start_time=parse_start_time(args.start_time) if args.start_time else None,
+                         speed=args.pace or None)
+    options = transport_options(args.transport, args.broker, args.output, clock)
+    if args.transport == "paho":
+        options.update(max_inflight=args.max_inflight, max_queued=args.max_queued)
+    if args.shards > 1:
+        from sharding import ShardCoordinator
+
+        coordinator = ShardCoordinator(args.shards, robots=args.robots, hz=args.hz, duration=args.duration,
+                                       status_hz=args.status_hz, binary=args.binary, max_pending=args.max_pending,
+                                       snapshot=args.snapshot, commands=args.commands,
+                                       transport=args.transport, transport_options=options)
+        print(coordinator.run())
+        return
+
+    # 파일이 없으면 브로커에 연결하기 전에 바로 실패
+    scenario = None
+    if args.scenario:
+        try:
+            scenario = open_scenario(args.scenario)
+        except OSError as e:
+            sys.exit(f"{args.scenario}: {e.strerror or e}")
+
+    transport = create_transport(args.transport, **options)
+    transport.connect()
+
+    profiler = None
+    if args.profile:
+        profiler = SamplingProfiler()
+        profiler.start()
+
+    tasks = None
+    if args.task_rate > 0:
+        from task_allocator import TaskAllocator
+
+        tasks = TaskAllocator(mode=args.assign, min_battery=args.min_battery, clock=clock or time.monotonic)
+    generator = LoadGenerator(transport, robots=args.robots, hz=args.hz, duration=args.duration,
+                              status_hz=args.status_hz, binary=args.binary, max_pending=args.max_pending,
+                              snapshot=args.snapshot, clock=clock, commands=args.commands,
+                              scenario=scenario,
+                              tasks=tasks, task_rate=args.task_rate, task_duration=args.task_duration)
+    try:
+        print(generator.run())
+    except ScenarioError as e:
+        sys.exit(f"{args.scenario}: {e}")
+    finally:
+        transport.disconnect()
+        if profiler:
+            profiler.stop()
+            profiler.dump(args.profile)
+            print(f"profile: {args.profile} ({sum(profiler.samples.values())} samples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""워커 스레드가 막힘 없이 로그를 넣고 UI가 묶음으로 꺼내 가는 고정 크기 링 버퍼"""
+import itertools
+from collections import deque
+
+
+class LogSink:
+    def __init__(self, capacity=5000):
+        self.capacity = capacity
+        # 가득 차면 가장 오래된 줄이 밀려남 (append/popleft는 스레드 안전)
+        self._buffer = deque(maxlen=capacity)
+        self._appended = itertools.count()
+        self._appended_total = 0
+        self.drained = 0
+
+    def append(self, line):
+        """로그 한 줄 추가 (워커 스레드에서 호출, 블로킹 없음)"""
+        self._buffer.append(line)
+        self._appended_total = next(self._appended) + 1
+
+    def drain(self, max_lines=None):
+        """최대 max_lines 줄을 꺼내 리스트로 반환 (UI 스레드에서 호출)"""
+        lines = []
+        popleft = self._buffer.popleft
+        limit = len(self._buffer) if max_lines is None else min(max_lines, len(self._buffer))
+        try:
+            for _ in range(limit):
+                lines.append(popleft())
+        except IndexError:
+            pass
+        self.drained += len(lines)
+        return lines
+
+    @property
+    def appended(self):
+        return self._appended_total
+
+    @property
+    def pending(self):
+        return len(self._buffer)
+
+    @property
+    def dropped(self):
+        """버퍼가 가득 차서 화면에 표시되지 못하고 버려진 줄 수"""
+        return max(0, self._appended_total - self.drained - len(self._buffer))
@@ -0,0 +1,257 @@
+"""런타임 지표 (단계별 소요 시간, 틱 지연 히스토그램, 대기열 깊이)와 샘플링 프로파일러
+
+지표는 Prometheus 텍스트 형식 파일과 주기적인 MQTT 토픽(METRICS_TOPIC, JSON)으로 내보냅니다.
+브로커가 최상위 $SYS 토픽을 자기 통계용으로 예약하므로 simulator/$SYS 아래에 발송합니다.
+
+프로파일러는 다른 스레드의 호출 스택을 주기적으로 수집해서 flamegraph.pl / speedscope가 읽는
+접힌 스택(collapsed stack) 형식 ("스레드;함수;함수 횟수")으로 저장합니다.
+"""
+import bisect
+import collections
+import json
+import os
+import sys
+import threading
+import time
+
+METRICS_TOPIC = "simulator/$SYS/metrics"
+METRIC_PREFIX = "robot_simulator"
+
+# 소요 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+# 틱 지연 히스토그램 구간 (초)
+LATENESS_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Timer:
+    __slots__ = ('histogram', 'started')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        # 구간별 개수 (마지막 칸은 +Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        """with 블록의 소요 시간을 기록"""
+        return _Timer(self)
+
+    def _samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += count
+            yield "_bucket", self.labels + (("le", _format_value(bound)),), cumulative
+        yield "_sum", self.labels, self.sum
+        yield "_count", self.labels, self.count
+
+    def value(self):
+        return {"count": self.count, "sum": self.sum,
+                "buckets": dict(zip(map(_format_value, self.buckets + (float('inf'),)), self.counts))}
+
+
+class Counter:
+    """누적 값 (fn을 주면 내보낼 때마다 fn()으로 읽음)"""
+    kind = "counter"
+
+    def __init__(self, name, help, labels=(), fn=None):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.fn = fn
+        self._value = 0
+
+    def inc(self, amount=1):
+        self._value += amount
+
+    def value(self):
+        return self.fn() if self.fn else self._value
+
+    def _samples(self):
+        yield "", self.labels, self.value()
+
+
+class Gauge(Counter):
+    """현재 값 (대기열 깊이 등)"""
+    kind = "gauge"
+
+    def set(self, value):
+        self._value = value
+
+
+class MetricsRegistry:
+    def __init__(self, prefix=METRIC_PREFIX):
+        self.prefix = prefix
+        # (이름, 레이블) -> 지표 (등록 순서 유지)
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help, labels, **options):
+        labels = tuple(sorted((labels or {}).items()))
+        key = (name, labels)
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = cls(f"{self.prefix}_{name}", help, labels, **options)
+        return metric
+
+    def histogram(self, name, help, labels=None, buckets=DURATION_BUCKETS):
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def counter(self, name, help, labels=None, fn=None):
+        return self._get(Counter, name, help, labels, fn=fn)
+
+    def gauge(self, name, help, labels=None, fn=None):
+        return self._get(Gauge, name, help, labels, fn=fn)
+
+    def prometheus_text(self):
+        families = collections.OrderedDict()
+        for metric in list(self._metrics.values()):
+            families.setdefault(metric.name, []).append(metric)
+
+        lines = []
+        for name, metrics in families.items():
+            lines.append(f"# HELP {name} {metrics[0].help}")
+            lines.append(f"# TYPE {name} {metrics[0].kind}")
+            for metric in metrics:
+                for suffix, labels, value in metric._samples():
+                    lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """node_exporter textfile 수집기가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 바꿔치기"""
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(temporary, path)
+
+    def snapshot(self):
+        """JSON으로 보낼 {이름{레이블}: 값} dict"""
+        return {f"{metric.name}{_format_labels(metric.labels)}": metric.value()
+                for metric in list(self._metrics.values())}
+
+
+class MetricsExporter:
+    """registry를 파일(path)과 MQTT 토픽(publish(topic, payload))으로 내보냄 (주기 실행은 호출하는 쪽에서)"""
+
+    def __init__(self, registry, path=None, publish=None, topic=METRICS_TOPIC):
+        self.registry = registry
+        self.path = path
+        self.publish = publish
+        self.topic = topic
+        self.exports = 0
+
+    def export(self):
+        if self.path:
+            try:
+                self.registry.write_prometheus(self.path)
+            except OSError:
+                pass
+        if self.publish:
+            snapshot = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        "metrics": self.registry.snapshot()}
+            self.publish(self.topic, json.dumps(snapshot))
+        self.exports += 1
+
+
+class SamplingProfiler:
+    """interval초마다 다른 스레드의 호출 스택을 모아 접힌 스택 형식으로 저장"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.samples.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path):
+        """접힌 스택 파일 저장 (flamegraph.pl path > out.svg)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def profile_window(self, seconds, path, on_done=None):
+        """seconds초 동안 수집해서 path에 저장하고 on_done(path, 샘플 수) 호출"""
+        self.start()
+
+        def finish():
+            self.stop()
+            self.dump(path)
+            if on_done:
+                on_done(path, sum(self.samples.values()))
+
+        timer = threading.Timer(seconds, finish)
+        timer.daemon = True
+        timer.start()
+        return timer
@@ -0,0 +1,395 @@
+"""점유 격자 지도와 A* 경로 계획 (재배대 등 장애물을 돌아가는 경유점 경로)
+
+지도 파일은 텍스트입니다. 머리 줄 (선택) 다음에 격자 줄이 오며, 격자 줄은 '.' (빈 칸)과 '#' (막힌 칸)으로만
+이루어지고 맨 윗줄이 북쪽 (y가 가장 큰 쪽)입니다.
+
+    resolution 0.5              칸 한 변의 길이 (m, 기본 1)
+    origin 0 0                  왼쪽 아래 칸 모서리의 농장 좌표 (기본 0 0)
+    landmark CHARGER-1 1 1      자주 가는 목적지 (충전기, 이랑 끝 등) - 처음 갈 때 거리장을 만들어 둠
+    ....................
+    ..######..######....
+    ....................
+
+경로는 8방향 격자 (대각선은 양옆 칸이 모두 비어 있을 때만, 비용은 직선 2 / 대각선 3의 정수 근사)에서 찾고,
+보이는 점끼리 이어 (string pulling) 꺾이는 곳만 경유점으로 남깁니다.
+자주 가는 목적지는 그 칸에서 모든 칸까지의 거리장 (distance field)을 한 번 만들어 LRU 캐시에 두고,
+이후 그 목적지로 가는 경로는 탐색 없이 거리장을 따라 내려가기만 합니다.
+"""
+import collections
+import heapq
+import math
+
+import numpy as np
+
+# 격자 한 칸 이동 비용 (대각선 √2 ≈ 1.5의 정수 근사)
+ORTHOGONAL_COST = 2
+DIAGONAL_COST = 3
+# 거리장을 LRU 캐시에 둘 목적지 수
+DISTANCE_FIELD_CACHE_SIZE = 32
+# 같은 목적지로 이만큼 탐색하면 다음부터 거리장을 만들어 씀
+FIELD_THRESHOLD = 3
+# A*가 빈 칸의 1/SEARCH_LIMIT_DIVISOR (최소 MIN_SEARCH_LIMIT)보다 많이 펼치면 그만두고 거리장을 만듦
+# (1000 × 1000칸에서 거리장 하나를 만드는 시간과 A*가 그만큼 펼치는 시간이 비슷함)
+SEARCH_LIMIT_DIVISOR = 8
+MIN_SEARCH_LIMIT = 5000
+# 목적지별 탐색 횟수를 기억하는 최대 목적지 수 (넘으면 초기화)
+MAX_TRACKED_GOALS = 4096
+# 선분이 격자 꼭짓점 / 격자선 위를 지나는지 판정하는 허용 오차 (칸)
+SIGHT_EPSILON = 1e-9
+
+_UNREACHED = np.iinfo(np.int32).max
+
+FREE_CELL = '.'
+BLOCKED_CELL = '#'
+
+
+class PlanningError(ValueError):
+    pass
+
+
+class OccupancyGrid:
+    """blocked: (행 = y칸, 열 = x칸) bool 배열, 0행이 남쪽"""
+
+    def __init__(self, blocked, resolution=1.0, origin=(0.0, 0.0), landmarks=None):
+        blocked = np.asarray(blocked, dtype=bool)
+        if blocked.ndim != 2 or blocked.size == 0:
+            raise ValueError("occupancy grid must be a non-empty 2D array")
+        if resolution <= 0:
+            raise ValueError("grid resolution must be positive")
+        self.blocked = blocked
+        self.resolution = float(resolution)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.landmarks = dict(landmarks or {})
+        self.height, self.width = blocked.shape
+
+        # 가장자리에 막힌 칸을 한 줄씩 덧댄 1차원 배열 (이웃 칸 인덱스 = 인덱스 + 오프셋, 경계 검사 없음)
+        self.stride = self.width + 2
+        padded = np.zeros((self.height + 2, self.stride), dtype=bool)
+        padded[1:-1, 1:-1] = ~blocked
+        self.free = padded.ravel()
+        self._free_list = self.free.tolist()
+        # (오프셋, 비용, 대각선이면 지나가는 양옆 칸 오프셋 두 개)
+        self.moves = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                if dx and dy:
+                    self.moves.append((dy * self.stride + dx, DIAGONAL_COST, dx, dy * self.stride))
+                else:
+                    self.moves.append((dy * self.stride + dx, ORTHOGONAL_COST, 0, 0))
+
+    def index(self, x, y):
+        """농장 좌표의 칸 인덱스 (지도 밖이면 None)"""
+        cx = math.floor((x - self.origin[0]) / self.resolution)
+        cy = math.floor((y - self.origin[1]) / self.resolution)
+        if not (0 <= cx < self.width and 0 <= cy < self.height):
+            return None
+        return (cy + 1) * self.stride + cx + 1
+
+    def center(self, index):
+        """칸 인덱스의 중심 농장 좌표"""
+        cy, cx = divmod(index, self.stride)
+        return (self.origin[0] + (cx - 0.5) * self.resolution, self.origin[1] + (cy - 0.5) * self.resolution)
+
+    def is_free(self, x, y):
+        index = self.index(x, y)
+        return index is not None and self._free_list[index]
+
+    def line_of_sight(self, start, end):
+        """두 농장 좌표를 잇는 선분이 빈 칸만 지나는지 (선분이 지나는 칸을 빠짐없이 검사)
+
+        칸 경계를 넘는 지점마다 나눈 구간이 지나는 칸을 모두 보고, 칸 꼭짓점을 지나면 A*의 대각선 규칙처럼
+        꼭짓점을 둘러싼 네 칸이 모두 비어 있어야 합니다. 격자선을 따라 가면 양쪽 칸이 모두 비어 있어야 합니다.
+        """
+        x0 = (start[0] - self.origin[0]) / self.resolution
+        y0 = (start[1] - self.origin[1]) / self.resolution
+        x1 = (end[0] - self.origin[0]) / self.resolution
+        y1 = (end[1] - self.origin[1]) / self.resolution
+        if (min(x0, x1) < 0 or min(y0, y1) < 0 or math.floor(max(x0, x1)) >= self.width
+                or math.floor(max(y0, y1)) >= self.height):
+            return False
+        dx = x1 - x0
+        dy = y1 - y0
+
+        # 선분이 세로 / 가로 격자선을 넘는 위치 (0..1)
+        boundaries_x = np.arange(math.floor(min(x0, x1)) + 1, math.ceil(max(x0, x1)), dtype=np.float64)
+        boundaries_y = np.arange(math.floor(min(y0, y1)) + 1, math.ceil(max(y0, y1)), dtype=np.float64)
+        tx = (boundaries_x - x0) / dx if dx else boundaries_x
+        ty = (boundaries_y - y0) / dy if dy else boundaries_y
+        t = np.concatenate(([0.0], tx, ty, [1.0]))
+        t.sort()
+        # 넘는 위치 사이 구간의 가운데가 있는 칸 + 양 끝점 칸 (꼭짓점에서 겹친 위치는 꼭짓점 옆 칸을 가리킴)
+        t = np.concatenate((t[:1], (t[:-1] + t[1:]) / 2, t[-1:]))
+        cx = np.floor(x0 + dx * t).astype(np.int64)
+        cy = np.floor(y0 + dy * t).astype(np.int64)
+
+        if dx and dy and len(tx):
+            # 꼭짓점을 지나면 그 꼭짓점을 둘러싼 네 칸
+            crossing_y = y0 + dy * tx
+            corner = np.abs(crossing_y - np.rint(crossing_y)) < SIGHT_EPSILON
+            if corner.any():
+                vx = boundaries_x[corner].astype(np.int64)
+                vy = np.rint(crossing_y[corner]).astype(np.int64)
+                cx = np.concatenate((cx, vx - 1, vx, vx - 1, vx))
+                cy = np.concatenate((cy, vy - 1, vy - 1, vy, vy))
+        if not dx and abs(x0 - round(x0)) < SIGHT_EPSILON:
+            # 세로 격자선을 따라 가면 왼쪽 칸도 (지도 밖은 가장자리의 막힌 칸)
+            cx = np.concatenate((cx, np.full(len(cy), round(x0) - 1)))
+            cy = np.concatenate((cy, cy))
+        if not dy and abs(y0 - round(y0)) < SIGHT_EPSILON:
+            cy = np.concatenate((cy, np.full(len(cx), round(y0) - 1)))
+            cx = np.concatenate((cx, cx))
+        return bool(self.free[(cy + 1) * self.stride + cx + 1].all())
+
+
+def load_grid(path):
+    """지도 파일을 읽어 OccupancyGrid 반환 (형식이 잘못되면 ValueError)"""
+    resolution = 1.0
+    origin = (0.0, 0.0)
+    landmarks = {}
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if not line.strip(FREE_CELL + BLOCKED_CELL):
+                rows.append(line)
+                continue
+            if rows:
+                raise ValueError(f"line {number}: unexpected text inside the grid")
+            key, *values = line.split()
+            try:
+                if key == "resolution" and len(values) == 1:
+                    resolution = float(values[0])
+                elif key == "origin" and len(values) == 2:
+                    origin = (float(values[0]), float(values[1]))
+                elif key == "landmark" and len(values) == 3:
+                    landmarks[values[0]] = (float(values[1]), float(values[2]))
+                else:
+                    raise ValueError(f"unknown header: {line}")
+            except ValueError as e:
+                raise ValueError(f"line {number}: {e}") from None
+    if not rows:
+        raise ValueError("map has no grid rows")
+    if len({len(row) for row in rows}) != 1:
+        raise ValueError("grid rows must all have the same length")
+    # 파일은 북쪽 줄부터이므로 뒤집어서 0행이 남쪽이 되게 함
+    blocked = np.array([[cell == BLOCKED_CELL for cell in row] for row in reversed(rows)])
+    grid = OccupancyGrid(blocked, resolution, origin, landmarks)
+    for name, (x, y) in landmarks.items():
+        if not grid.is_free(x, y):
+            raise ValueError(f"landmark {name} ({x}, {y}) is outside the map or blocked")
+    return grid
+
+
+class PathPlanner:
+    def __init__(self, grid, cache_size=DISTANCE_FIELD_CACHE_SIZE, field_threshold=FIELD_THRESHOLD):
+        self.grid = grid
+        self.cache_size = cache_size
+        self.field_threshold = field_threshold
+        self.search_limit = max(MIN_SEARCH_LIMIT, int(grid.free.sum()) // SEARCH_LIMIT_DIVISOR)
+        # 목적지 칸 -> 거리장 (LRU, 가장 최근에 쓴 것이 뒤)
+        self._fields = collections.OrderedDict()
+        # 목적지 칸 -> 거리장 없이 탐색한 횟수
+        self._goal_searches = collections.Counter()
+        self._landmark_cells = {grid.index(x, y) for x, y in grid.landmarks.values()}
+        # A*용 이동 목록 (칸 좌표 변화 포함)
+        self._moves = [(offset, step, side_a, side_b, (offset + 1) % grid.stride - 1, (offset + 1) // grid.stride)
+                       for offset, step, side_a, side_b in grid.moves]
+
+        # 통계
+        self.direct = 0
+        self.searches = 0
+        self.abandoned = 0
+        self.field_hits = 0
+        self.fields_built = 0
+        self.evictions = 0
+
+    def _cell(self, point, name):
+        index = self.grid.index(*point)
+        if index is None:
+            raise PlanningError(f"{name} ({point[0]}, {point[1]}) is outside the map")
+        if not self.grid._free_list[index]:
+            raise PlanningError(f"{name} ({point[0]}, {point[1]}) is blocked")
+        return index
+
+    def plan(self, start, goal):
+        """start -> goal 경유점 경로 [(x, y), ...] (시작점과 도착점 포함, 갈 수 없으면 PlanningError)"""
+        start = (float(start[0]), float(start[1]))
+        goal = (float(goal[0]), float(goal[1]))
+        source = self._cell(start, "start")
+        target = self._cell(goal, "goal")
+        if source == target or self.grid.line_of_sight(start, goal):
+            self.direct += 1
+            return [start, goal]
+
+        use_field = (target in self._fields or target in self._landmark_cells
+                     or self._goal_searches[target] >= self.field_threshold)
+        if not use_field:
+            if len(self._goal_searches) >= MAX_TRACKED_GOALS:
+                self._goal_searches.clear()
+            self._goal_searches[target] += 1
+            self.searches += 1
+            cells = self._search(source, target, self.search_limit)
+            if cells is False:
+                # 멀리 돌아가는 경로는 탐색을 그만두고 거리장을 만들어 씀 (다음부터 이 목적지는 탐색 없음)
+                self.abandoned += 1
+                use_field = True
+        if use_field:
+            self.field_hits += 1
+            cells = self._descend(self.distance_field(goal), source)
+        if cells is None:
+            raise PlanningError(f"no path from ({start[0]}, {start[1]}) to ({goal[0]}, {goal[1]})")
+        return self._smooth(start, cells, goal)
+
+    def plan_route(self, points):
+        """경유점을 차례로 잇는 경로 (구간마다 plan)"""
+        route = [(float(points[0][0]), float(points[0][1]))]
+        for start, goal in zip(points, points[1:]):
+            route.extend(self.plan(start, goal)[1:])
+        return route
+
+    def distance_field(self, goal):
+        """goal 칸에서 모든 칸까지의 이동 비용 배열 (캐시에 없으면 만들고 LRU로 오래된 것을 버림)"""
+        target = self._cell(goal, "goal")
+        field = self._fields.get(target)
+        if field is not None:
+            self._fields.move_to_end(target)
+            return field
+
+        field = self._build_field(target)
+        self.fields_built += 1
+        self._goal_searches.pop(target, None)
+        self._fields[target] = field
+        if len(self._fields) > self.cache_size:
+            self._fields.popitem(last=False)
+            self.evictions += 1
+        return field
+
+    def _build_field(self, target):
+        # 비용이 정수이므로 비용별 버킷을 차례로 비우는 다익스트라 (버킷 하나를 배열 연산으로 한 번에 확장)
+        free = self.grid.free
+        field = np.full(len(free), _UNREACHED, dtype=np.int32)
+        field[target] = 0
+        buckets = {0: [np.array([target], dtype=np.int64)]}
+        while buckets:
+            cost = min(buckets)
+            cells = np.unique(np.concatenate(buckets.pop(cost)))
+            cells = cells[field[cells] == cost]
+            for offset, step, side_a, side_b in self.grid.moves:
+                neighbors = cells + offset
+                better = free[neighbors] & (field[neighbors] > cost + step)
+                if side_a:
+                    better &= free[cells + side_a] & free[cells + side_b]
+                neighbors = neighbors[better]
+                if neighbors.size:
+                    field[neighbors] = cost + step
+                    buckets.setdefault(cost + step, []).append(neighbors)
+        return field
+
+    def _descend(self, field, source):
+        """거리장을 따라 source에서 목적지까지 내려가는 칸 목록 (갈 수 없으면 None)"""
+        if field[source] == _UNREACHED:
+            return None
+        free = self.grid._free_list
+        moves = self.grid.moves
+        cells = [source]
+        current = source
+        remaining = int(field[source])
+        while remaining:
+            for offset, step, side_a, side_b in moves:
+                neighbor = current + offset
+                if side_a and not (free[current + side_a] and free[current + side_b]):
+                    continue
+                if free[neighbor] and field[neighbor] == remaining - step:
+                    break
+            current = neighbor
+            remaining -= step
+            cells.append(current)
+        return cells
+
+    def _search(self, source, target, limit):
+        """A* (8방향, 정수 비용, 옥타일 거리 휴리스틱)로 source -> target 칸 목록
+
+        갈 수 없으면 None, limit개보다 많은 칸을 펼치면 False를 반환합니다.
+        """
+        free = self.grid._free_list
+        stride = self.grid.stride
+        target_y, target_x = divmod(target, stride)
+        extra = DIAGONAL_COST - ORTHOGONAL_COST
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        costs = [_UNREACHED] * len(free)
+        parents = [-1] * len(free)
+        costs[source] = 0
+        # (f, h, 칸, x, y) - f가 같으면 목적지에 가까운 칸 먼저
+        y, x = divmod(source, stride)
+        dx, dy = abs(x - target_x), abs(y - target_y)
+        h = ORTHOGONAL_COST * max(dx, dy) + extra * min(dx, dy)
+        heap = [(h, h, source, x, y)]
+        expanded = 0
+        while heap:
+            estimate, h, current, x, y = pop(heap)
+            cost = costs[current]
+            if estimate > cost + h:
+                # 더 싼 비용으로 다시 넣은 칸의 오래된 항목
+                continue
+            if current == target:
+                cells = []
+                while current >= 0:
+                    cells.append(current)
+                    current = parents[current]
+                cells.reverse()
+                return cells
+            expanded += 1
+            if expanded > limit:
+                return False
+            for offset, step, side_a, side_b, move_x, move_y in self._moves:
+                neighbor = current + offset
+                if not free[neighbor]:
+                    continue
+                if side_a and not (free[current + side_a] and free[current + side_b]):
+                    continue
+                new_cost = cost + step
+                if new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current
+                    nx = x + move_x
+                    ny = y + move_y
+                    dx = nx - target_x if nx > target_x else target_x - nx
+                    dy = ny - target_y if ny > target_y else target_y - ny
+                    h = ORTHOGONAL_COST * dx + extra * dy if dx > dy else ORTHOGONAL_COST * dy + extra * dx
+                    push(heap, (new_cost + h, h, neighbor, nx, ny))
+        return None
+
+    def _smooth(self, start, cells, goal):
+        """칸 경로를 보이는 점끼리 이어 꺾이는 곳만 남긴 경유점 목록으로 바꿈"""
+        # 방향이 바뀌는 칸만 후보로 남김
+        corners = []
+        for previous, current, following in zip(cells, cells[1:], cells[2:]):
+            if current - previous != following - current:
+                corners.append(self.grid.center(current))
+        points = [start] + corners + [goal]
+
+        route = [start]
+        anchor = start
+        for point, following in zip(points[1:], points[2:]):
+            if not self.grid.line_of_sight(anchor, following):
+                route.append(point)
+                anchor = point
+        route.append(goal)
+        return route
+
+    def stats(self):
+        return {
+            "direct": self.direct,
+            "searches": self.searches,
+            "abandoned": self.abandoned,
+            "field_hits": self.field_hits,
+            "fields_built": self.fields_built,
+            "cached_fields": len(self._fields),
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,164 @@
+"""발송 역압 제어 (MQTT 클라이언트 대기열이 밀릴 때 발송 속도를 낮추고 오래된 위치를 합침)
+
+transport.pending (클라이언트가 받아 두고 아직 소켓에 쓰지 못한 / 응답을 못 받은 메시지 수)을
+max_pending과 비교해서
+
+- 대기열이 가득 차면 key가 있는 메시지는 보류했다가 여유가 생기면 보내고,
+  보류 중에 같은 key의 새 메시지가 오면 오래된 것을 버림 (coalesce)
+- 대기열이 high_water 이상이면 로봇별 발송 속도(rate)를 절반으로, low_water 이하이면 조금씩 되돌림
+"""
+import threading
+import time
+
+# 발송 속도를 다시 판단하는 최소 간격 (초)
+ADAPT_INTERVAL = 0.5
+# 대기열이 비었을 때 속도를 올리는 폭
+RATE_STEP_UP = 0.1
+
+
+class PublishController:
+    """on_publish(topic, payload): 실제로 발송한 메시지마다 호출 (보류했다가 나중에 보낸 것 포함)"""
+
+    def __init__(self, transport, max_pending=1000, high_water=0.75, low_water=0.25, min_rate=0.1,
+                 qos=0, on_publish=None, clock=time.monotonic):
+        self.transport = transport
+        self.on_publish = on_publish
+        self.max_pending = max_pending
+        self.high_water = high_water
+        self.low_water = low_water
+        self.min_rate = min_rate
+        self.qos = qos
+        self.clock = clock
+        # 1.0 = 요청한 주기대로, 0.5 = 두 번에 한 번 발송
+        self.rate = 1.0
+        self._next_adapt = 0.0
+        self._last_admit = {}
+        # key -> (topic, payload) 대기열이 가득 차서 보류한 최신 메시지
+        self._deferred = {}
+        # 거부되어 보류 중인 메시지의 key (다시 보내다 또 거부되어도 한 번만 셈)
+        self._rejected_keys = set()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.sent = 0
+        self.throttled = 0    # 낮춘 발송 속도 때문에 건너뛴 틱
+        self.deferred = 0     # 대기열이 가득 차서 보류한 메시지
+        self.coalesced = 0    # 보류 중에 더 새 메시지로 대체되어 버린 메시지
+        self.rejected = 0     # 클라이언트가 거부한 메시지 (rc != 0, 메시지당 한 번)
+        self.rate_decreases = 0
+
+    @property
+    def pending(self):
+        return self.transport.pending
+
+    @property
+    def held(self):
+        """지금 보류 중인 메시지 수"""
+        return len(self._deferred)
+
+    @property
+    def throttle_events(self):
+        return self.throttled + self.deferred + self.rejected
+
+    def admit(self, key, period, now=None, force=False):
+        """period 주기로 발송하는 key가 이번 틱에 발송해도 되는지 (rate에 맞춰 틱을 건너뜀)"""
+        if now is None:
+            now = self.clock()
+        self._adapt(now)
+        last = self._last_admit.get(key)
+        # 틱 지연으로 조금 일찍 온 틱도 통과하도록 주기 절반만큼 여유를 둠
+        if not force and last is not None and now - last < period / self.rate - period * 0.5:
+            self.throttled += 1
+            return False
+        self._last_admit[key] = now
+        return True
+
+    def publish(self, topic, payload, key=None):
+        """발송했으면 True, 보류했으면 False
+
+        key가 없는 메시지 (이벤트 등)는 합치거나 버리지 않고 항상 발송합니다.
+        """
+        with self._lock:
+            if self._deferred:
+                self._flush()
+            if key is not None:
+                if key in self._deferred:
+                    del self._deferred[key]
+                    self._rejected_keys.discard(key)
+                    self.coalesced += 1
+                if self.transport.pending >= self.max_pending:
+                    self._deferred[key] = (topic, payload)
+                    self.deferred += 1
+                    return False
+            return self._send(key, topic, payload)
+
+    def flush(self):
+        """여유가 생긴 만큼 보류한 메시지 발송 (남은 보류 건수 반환, 연결이 끊겨 있으면 보내 보지 않음)"""
+        with self._lock:
+            self._flush()
+            return len(self._deferred)
+
+    def _flush(self):
+        if not self.transport.connected:
+            return
+        while self._deferred and self.transport.pending < self.max_pending:
+            key = next(iter(self._deferred))
+            topic, payload = self._deferred.pop(key)
+            if not self._send(key, topic, payload):
+                break
+
+    def _send(self, key, topic, payload):
+        result = self.transport.publish(topic, payload, self.qos)
+        if result.rc != 0:
+            if key is None:
+                self.rejected += 1
+            else:
+                if key not in self._rejected_keys:
+                    self._rejected_keys.add(key)
+                    self.rejected += 1
+                self._deferred[key] = (topic, payload)
+            return False
+        if key is not None:
+            self._rejected_keys.discard(key)
+        self.sent += 1
+        if self.on_publish:
+            self.on_publish(topic, payload)
+        return True
+
+    def _adapt(self, now):
+        if now < self._next_adapt:
+            return
+        self._next_adapt = now + ADAPT_INTERVAL
+        pressure = self.transport.pending / self.max_pending
+        if pressure >= self.high_water:
+            rate = max(self.min_rate, self.rate * 0.5)
+            if rate < self.rate:
+                self.rate_decreases += 1
+            self.rate = rate
+        elif pressure <= self.low_water and not self._deferred:
+            self.rate = min(1.0, self.rate + RATE_STEP_UP)
+
+    def reset(self, key=None):
+        """key (없으면 전체)의 발송 속도 기록과 보류 메시지 삭제"""
+        with self._lock:
+            if key is None:
+                self._last_admit.clear()
+                self._deferred.clear()
+                self._rejected_keys.clear()
+            else:
+                self._last_admit.pop(key, None)
+                self._deferred.pop(key, None)
+                self._rejected_keys.discard(key)
+
+    def stats(self):
+        return {
+            "rate": self.rate,
+            "pending": self.transport.pending,
+            "deferred_now": self.held,
+            "sent": self.sent,
+            "throttled": self.throttled,
+            "deferred": self.deferred,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "rate_decreases": self.rate_decreases,
+        }
@@ -0,0 +1,76 @@
+"""변경 감지 / 데드밴드 / 하트비트 기반 발송 정책"""
+import time
+from collections import defaultdict
+
+
+class PublishPolicy:
+    def __init__(self, on_change=False, dead_bands=None, heartbeat=None):
+        # on_change: 값이 바뀌었을 때만 발송 (False면 매 틱 발송)
+        self.on_change = on_change
+        # dead_bands: {필드: 임계값} 숫자 필드는 마지막 발송 값과의 차이가 임계값을 넘어야 변경으로 봄
+        self.dead_bands = dict(dead_bands or {})
+        # heartbeat: 값이 그대로여도 이 시간(초)이 지나면 발송
+        self.heartbeat = heartbeat
+
+    @property
+    def enabled(self):
+        return self.on_change or bool(self.dead_bands)
+
+    def changed(self, last_values, values):
+        for field, value in values.items():
+            last = last_values.get(field)
+            dead_band = self.dead_bands.get(field)
+            if dead_band is None:
+                if value != last:
+                    return True
+            elif last is None or abs(value - last) > dead_band:
+                return True
+        return False
+
+
+# 매 틱 발송 (기존 동작)
+ALWAYS = PublishPolicy()
+
+
+class PublishGate:
+    """로봇별 마지막 발송 값을 기억하고 정책에 따라 발송 여부를 결정"""
+
+    def __init__(self, policy=ALWAYS, clock=time.monotonic):
+        self.policy = policy
+        self.clock = clock
+        self._last = {}
+        self.published = defaultdict(int)
+        self.suppressed = defaultdict(int)
+
+    def should_publish(self, robot_id, values, now=None, force=False):
+        """values(dict)를 발송해야 하면 True (발송한 값으로 기록)"""
+        if now is None:
+            now = self.clock()
+
+        policy = self.policy
+        last = self._last.get(robot_id)
+        publish = (
+            force
+            or last is None
+            or not policy.enabled
+            or (policy.heartbeat is not None and now - last[0] >= policy.heartbeat)
+            or policy.changed(last[1], values)
+        )
+
+        if publish:
+            self._last[robot_id] = (now, dict(values))
+            self.published[robot_id] += 1
+        else:
+            self.suppressed[robot_id] += 1
+        return publish
+
+    def reset(self, robot_id=None):
+        """마지막 발송 값을 지움 (다음 틱은 무조건 발송)"""
+        if robot_id is None:
+            self._last.clear()
+        else:
+            self._last.pop(robot_id, None)
+
+    @property
+    def total_suppressed(self):
+        return sum(self.suppressed.values())
@@ -0,0 +1,20 @@
+"""로봇 역할/작동 상태 목록과 바이너리 인코딩용 코드, 로봇 ID 길이 제한"""
+
+# 역할 (Role)
+ROLES = ["EMPTY", "CLEANING", "WATERING", "MONITORING", "FERTILIZING", "TRANSPLANTING", "HARVESTING"]
+
+# 작동 상태 (Operational Status)
+OPERATIONAL_STATUSES = ["IDLE", "PREPARE", "MOVING", "WORKING", "CHARGING", "PAUSE", "STOP", "ERROR"]
+
+# 이름 -> 코드 (목록 순서가 곧 코드이므로 새 값은 항상 뒤에 추가)
+ROLE_CODES = {name: code for code, name in enumerate(ROLES)}
+OPERATIONAL_STATUS_CODES = {name: code for code, name in enumerate(OPERATIONAL_STATUSES)}
+
+# 로봇 ID 최대 길이 (UTF-8 바이트, 스냅샷 키프레임의 로봇 ID 표가 1바이트 길이를 씀)
+MAX_ROBOT_ID_BYTES = 255
+
+
+def check_robot_id(robot_id):
+    """등록할 수 없는 로봇 ID면 ValueError"""
+    if not robot_id or len(robot_id.encode()) > MAX_ROBOT_ID_BYTES:
+        raise ValueError(f"robot id must be 1-{MAX_ROBOT_ID_BYTES} UTF-8 bytes: {robot_id[:32]!r}")
@@ -0,0 +1,197 @@
+"""로봇 ID <-> 정수 슬롯 매핑과 로봇별 상태를 NumPy 열(column)로 보관하는 레지스트리
+
+로봇 한 대당 열 데이터는 x, y, heading, battery (float32) + role, status 코드 (uint8) + active = 19바이트입니다.
+배터리는 틱마다 조금씩 줄어드는 값을 쌓을 수 있도록 실수 (%)로 보관합니다 (battery_model).
+ID 문자열과 dict/list 항목까지 포함한 실측 메모리는 benchmarks/bench_registry.py로 확인합니다.
+삭제한 로봇의 슬롯은 다음에 등록하는 로봇이 재사용합니다.
+"""
+import numpy as np
+
+from robot_enums import ROLES, OPERATIONAL_STATUSES, ROLE_CODES, OPERATIONAL_STATUS_CODES, check_robot_id
+
+DEFAULT_BATTERY = 80
+
+_COLUMNS = (
+    ('x', np.float32),
+    ('y', np.float32),
+    ('heading', np.float32),
+    ('battery', np.float32),
+    ('role', np.uint8),
+    ('status', np.uint8),
+    ('active', bool),
+)
+
+
+def _code(codes, name, kind):
+    try:
+        return codes[name]
+    except KeyError:
+        raise ValueError(f"unknown {kind}: {name}") from None
+
+
+class RobotRegistry:
+    def __init__(self, capacity=64):
+        # 슬롯 -> 로봇 ID (삭제된 슬롯은 None)
+        self.ids = []
+        self.slots = {}
+        self._free = []
+        for name, dtype in _COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, robot_id):
+        return robot_id in self.slots
+
+    @property
+    def robot_ids(self):
+        """등록된 로봇 ID 목록 (슬롯 순서)"""
+        return [robot_id for robot_id in self.ids if robot_id is not None]
+
+    @property
+    def capacity(self):
+        return len(self.active)
+
+    def _grow(self, size):
+        capacity = max(1, self.capacity)
+        while capacity < size:
+            capacity *= 2
+        for name, dtype in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _allocate(self, count):
+        """빈 슬롯을 먼저 재사용하고 모자라면 뒤에 새로 붙임"""
+        reused = [self._free.pop() for _ in range(min(count, len(self._free)))]
+        start = len(self.ids)
+        fresh = list(range(start, start + count - len(reused)))
+        if fresh:
+            self.ids.extend([None] * len(fresh))
+            if len(self.ids) > self.capacity:
+                self._grow(len(self.ids))
+        return np.array(reused + fresh, dtype=np.int64)
+
+    def add(self, robot_id, x=0.0, y=0.0, heading=0.0, battery=DEFAULT_BATTERY, role="EMPTY",
+            operational_status="IDLE"):
+        """로봇 한 대 등록 후 슬롯 반환 (이미 있으면 기존 슬롯)"""
+        return int(self.add_many([robot_id], x, y, heading, battery, role, operational_status)[0])
+
+    def add_many(self, robot_ids, x=0.0, y=0.0, heading=0.0, battery=DEFAULT_BATTERY, role="EMPTY",
+                 operational_status="IDLE"):
+        """여러 로봇을 한 번에 등록하고 입력 순서대로 슬롯 배열 반환
+
+        x, y, heading, battery는 스칼라 또는 로봇 수만큼의 배열입니다.
+        이미 등록된 로봇은 값을 바꾸지 않고 기존 슬롯을 돌려줍니다.
+        로봇 ID가 비었거나 MAX_ROBOT_ID_BYTES보다 길면 아무것도 등록하지 않고 ValueError를 냅니다.
+        """
+        robot_ids = list(robot_ids)
+        if len(set(robot_ids)) != len(robot_ids):
+            raise ValueError("duplicate robot ids")
+        role_code = _code(ROLE_CODES, role, "role")
+        status_code = _code(OPERATIONAL_STATUS_CODES, operational_status, "operational status")
+
+        result = np.empty(len(robot_ids), dtype=np.int64)
+        new = np.array([i for i, robot_id in enumerate(robot_ids) if robot_id not in self.slots], dtype=np.int64)
+        for i, robot_id in enumerate(robot_ids):
+            slot = self.slots.get(robot_id)
+            if slot is not None:
+                result[i] = slot
+        if new.size == 0:
+            return result
+        for i in new.tolist():
+            check_robot_id(robot_ids[i])
+
+        slots = self._allocate(new.size)
+        result[new] = slots
+        for slot, i in zip(slots.tolist(), new.tolist()):
+            robot_id = robot_ids[i]
+            self.ids[slot] = robot_id
+            self.slots[robot_id] = slot
+
+        def pick(value):
+            value = np.asarray(value)
+            return value[new] if value.ndim else value
+
+        self.x[slots] = pick(x)
+        self.y[slots] = pick(y)
+        self.heading[slots] = pick(heading)
+        self.battery[slots] = np.clip(pick(battery), 0, 100)
+        self.role[slots] = role_code
+        self.status[slots] = status_code
+        self.active[slots] = True
+        return result
+
+    def remove(self, robot_id):
+        self.remove_many([robot_id])
+
+    def remove_many(self, robot_ids):
+        """여러 로봇 삭제 (없는 ID는 무시), 삭제한 슬롯 배열 반환"""
+        slots = []
+        for robot_id in robot_ids:
+            slot = self.slots.pop(robot_id, None)
+            if slot is not None:
+                self.ids[slot] = None
+                slots.append(slot)
+        slots = np.array(slots, dtype=np.int64)
+        self.active[slots] = False
+        self._free.extend(slots.tolist())
+        return slots
+
+    def slot(self, robot_id):
+        try:
+            return self.slots[robot_id]
+        except KeyError:
+            raise KeyError(f"unknown robot: {robot_id}") from None
+
+    def get(self, robot_id):
+        """로봇 한 대의 상태 dict"""
+        slot = self.slot(robot_id)
+        return {
+            'x': float(self.x[slot]),
+            'y': float(self.y[slot]),
+            'heading': float(self.heading[slot]),
+            'battery': int(round(float(self.battery[slot]))),
+            'role': ROLES[self.role[slot]],
+            'operational_status': OPERATIONAL_STATUSES[self.status[slot]],
+        }
+
+    def update(self, robot_id, x=None, y=None, heading=None, battery=None, role=None, operational_status=None):
+        """주어진 필드만 변경"""
+        slot = self.slot(robot_id)
+        if x is not None:
+            self.x[slot] = x
+        if y is not None:
+            self.y[slot] = y
+        if heading is not None:
+            self.heading[slot] = heading
+        if battery is not None:
+            self.battery[slot] = max(0.0, min(100.0, float(battery)))
+        if role is not None:
+            self.role[slot] = _code(ROLE_CODES, role, "role")
+        if operational_status is not None:
+            self.status[slot] = _code(OPERATIONAL_STATUS_CODES, operational_status, "operational status")
+
+    def select(self, battery_below=None, battery_at_least=None, role=None, operational_status=None):
+        """조건을 모두 만족하는 로봇의 슬롯 배열 (예: select(battery_below=20))"""
+        n = len(self.ids)
+        mask = self.active[:n].copy()
+        if battery_below is not None:
+            mask &= self.battery[:n] < battery_below
+        if battery_at_least is not None:
+            mask &= self.battery[:n] >= battery_at_least
+        if role is not None:
+            mask &= self.role[:n] == _code(ROLE_CODES, role, "role")
+        if operational_status is not None:
+            mask &= self.status[:n] == _code(OPERATIONAL_STATUS_CODES, operational_status, "operational status")
+        return np.flatnonzero(mask)
+
+    def ids_of(self, slots):
+        ids = self.ids
+        return [ids[slot] for slot in np.asarray(slots).tolist()]
+
+    def column_bytes(self):
+        """열 데이터가 차지하는 바이트 (할당된 용량 기준)"""
+        return sum(getattr(self, name).nbytes for name, _ in _COLUMNS)
@@ -0,0 +1,294 @@
+"""대규모 플릿을 한 번에 띄우는 시나리오 파일 (JSON Lines)
+
+한 줄에 레코드 하나이며 type으로 종류를 구분합니다. 빈 줄과 #으로 시작하는 줄은 무시합니다.
+
+    {"type": "robot", "id": "ROBOT-0001", "x": 0, "y": 0, "battery": 80, "role": "WATERING", "status": "IDLE"}
+    {"type": "mission", "robot": "ROBOT-0001", "at": 5, "speed": 1.0, "waypoints": [[10, 0], [10, 20]], "then": "WORKING"}
+    {"type": "status", "robot": "ROBOT-0001", "at": 60, "status": "CHARGING"}
+
+- robot: id는 필수, 나머지는 선택 (heading, battery, role, status 기본값은 0, 80, EMPTY, IDLE)
+- mission: 시나리오 시작 후 at초 (기본 0)에 현재 위치에서 waypoints를 차례로 지나 이동, 도착하면 then 상태 (기본 IDLE)
+- status: at초에 작동 상태 (status) / 역할 (role) / 배터리 (battery) 중 준 값만 변경
+
+파일을 끝까지 읽지 않고 줄 단위로 검증하며 넘겨주므로, 로봇은 자기를 참조하는 mission/status보다 앞에 있어야 합니다.
+오류는 ScenarioError로 줄 번호와 함께 알려 줍니다.
+
+실행 (검증만):
+    python scenario.py fleet.jsonl
+"""
+import argparse
+import json
+import math
+import sys
+
+from robot_enums import MAX_ROBOT_ID_BYTES, ROLES, OPERATIONAL_STATUSES
+
+DEFAULT_BATTERY = 80
+
+
+class ScenarioError(ValueError):
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}" if line is not None else message)
+        self.line = line
+
+
+class ScenarioRobot:
+    def __init__(self, line, robot_id, x, y, heading, battery, role, status):
+        self.line = line
+        self.robot_id = robot_id
+        self.x = x
+        self.y = y
+        self.heading = heading
+        self.battery = battery
+        self.role = role
+        self.status = status
+
+
+class ScenarioMission:
+    def __init__(self, line, robot_id, at, speed, waypoints, then):
+        self.line = line
+        self.robot_id = robot_id
+        self.at = at
+        self.speed = speed
+        self.waypoints = waypoints
+        self.then = then
+
+
+class ScenarioStatus:
+    def __init__(self, line, robot_id, at, status, role, battery):
+        self.line = line
+        self.robot_id = robot_id
+        self.at = at
+        self.status = status
+        self.role = role
+        self.battery = battery
+
+
+class _Record:
+    """필드 검증 도우미 (오류에 줄 번호를 붙임)"""
+
+    def __init__(self, line, data):
+        self.line = line
+        self.data = data
+
+    def error(self, message):
+        return ScenarioError(self.line, message)
+
+    def number(self, key, default=None, minimum=None, maximum=None, positive=False):
+        value = self.data.get(key, default)
+        if value is None:
+            raise self.error(f"missing '{key}'")
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise self.error(f"'{key}' must be a number, got {value!r}")
+        if positive and value <= 0:
+            raise self.error(f"'{key}' must be positive, got {value!r}")
+        if minimum is not None and value < minimum:
+            raise self.error(f"'{key}' must be at least {minimum}, got {value!r}")
+        if maximum is not None and value > maximum:
+            raise self.error(f"'{key}' must be at most {maximum}, got {value!r}")
+        return float(value)
+
+    def string(self, key, required=True):
+        value = self.data.get(key)
+        if value is None and not required:
+            return None
+        if not isinstance(value, str) or not value:
+            raise self.error(f"'{key}' must be a non-empty string" if key in self.data else f"missing '{key}'")
+        return value
+
+    def choice(self, key, choices, default=None):
+        value = self.data.get(key, default)
+        if value is None:
+            return None
+        if value not in choices:
+            raise self.error(f"unknown {key} {value!r} (choose from {', '.join(choices)})")
+        return value
+
+    def robot(self, known):
+        robot_id = self.string("robot")
+        if robot_id not in known:
+            raise self.error(f"unknown robot {robot_id!r} (robots must be defined before they are used)")
+        return robot_id
+
+    def points(self, key):
+        value = self.data.get(key)
+        if not isinstance(value, list) or not value:
+            raise self.error(f"'{key}' must be a non-empty list of [x, y] points")
+        points = []
+        for point in value:
+            if (not isinstance(point, list) or len(point) != 2
+                    or not all(isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+                               for v in point)):
+                raise self.error(f"'{key}' must contain [x, y] number pairs, got {point!r}")
+            points.append((float(point[0]), float(point[1])))
+        return points
+
+
+def _parse_robot(record, known):
+    robot_id = record.string("id")
+    if robot_id in known:
+        raise record.error(f"duplicate robot {robot_id!r}")
+    if len(robot_id.encode()) > MAX_ROBOT_ID_BYTES:
+        raise record.error(f"robot id must be at most {MAX_ROBOT_ID_BYTES} bytes")
+    known.add(robot_id)
+    return ScenarioRobot(record.line, robot_id, record.number("x", 0.0), record.number("y", 0.0),
+                         record.number("heading", 0.0),
+                         record.number("battery", DEFAULT_BATTERY, minimum=0, maximum=100),
+                         record.choice("role", ROLES, "EMPTY"), record.choice("status", OPERATIONAL_STATUSES, "IDLE"))
+
+
+def _parse_mission(record, known):
+    return ScenarioMission(record.line, record.robot(known), record.number("at", 0.0, minimum=0),
+                           record.number("speed", positive=True), record.points("waypoints"),
+                           record.choice("then", OPERATIONAL_STATUSES, "IDLE"))
+
+
+def _parse_status(record, known):
+    status = ScenarioStatus(record.line, record.robot(known), record.number("at", 0.0, minimum=0),
+                            record.choice("status", OPERATIONAL_STATUSES), record.choice("role", ROLES),
+                            record.number("battery", minimum=0, maximum=100) if "battery" in record.data else None)
+    if status.status is None and status.role is None and status.battery is None:
+        raise record.error("status record must set at least one of 'status', 'role', 'battery'")
+    return status
+
+
+_PARSERS = {
+    "robot": _parse_robot,
+    "mission": _parse_mission,
+    "status": _parse_status,
+}
+
+
+def parse_event(data, known, line=None):
+    """파일 밖에서 받은 mission / status 레코드 하나 검증 (명령 토픽 등, known: 로봇 ID 집합 또는 dict)"""
+    if not isinstance(data, dict):
+        raise ScenarioError(line, "record must be a JSON object")
+    kind = data.get("type")
+    if kind not in ("mission", "status"):
+        raise ScenarioError(line, f"unknown record type {kind!r} (choose from mission, status)")
+    return _PARSERS[kind](_Record(line, data), known)
+
+
+def read_scenario(lines):
+    """줄 단위로 읽으면서 검증한 레코드를 하나씩 반환 (ScenarioRobot / ScenarioMission / ScenarioStatus)"""
+    known = set()
+    for number, text in enumerate(lines, 1):
+        text = text.strip()
+        if not text or text.startswith('#'):
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ScenarioError(number, f"invalid JSON: {e}") from None
+        if not isinstance(data, dict):
+            raise ScenarioError(number, "record must be a JSON object")
+        parser = _PARSERS.get(data.get("type"))
+        if parser is None:
+            raise ScenarioError(number, f"unknown record type {data.get('type')!r} "
+                                        f"(choose from {', '.join(_PARSERS)})")
+        yield parser(_Record(number, data), known)
+
+
+def open_scenario(path):
+    """파일을 바로 열고 read_scenario로 읽는 제너레이터를 반환 (다 읽거나 닫으면 파일도 닫힘)
+
+    파일이 없거나 읽을 수 없으면 첫 레코드를 읽을 때가 아니라 여기서 OSError가 납니다.
+    """
+    f = open(path, encoding='utf-8')
+
+    def records():
+        with f:
+            yield from read_scenario(f)
+
+    return records()
+
+
+class ScenarioPlayer:
+    """레코드를 batch_size개씩 읽어 target에 적용 (파일을 다 읽기 전에 먼저 읽은 로봇부터 발송 시작)
+
+    target은 add_robots(robots), start_mission(mission), apply_status(status)를 가진 객체 (LoadGenerator)이고,
+    at이 남은 mission/status는 스케줄러에 한 번 실행 작업으로 등록합니다.
+    """
+
+    def __init__(self, records, target, batch_size=1000, interval=0.01):
+        self.records = iter(records)
+        self.target = target
+        self.batch_size = batch_size
+        self.interval = interval
+        self.scheduler = None
+        self.started_at = None
+        self.error = None
+        self.finished = False
+        self.robots = 0
+        self.events = 0
+        self._task = None
+
+    def start(self, scheduler):
+        self.scheduler = scheduler
+        self.started_at = scheduler.clock()
+        self._task = scheduler.schedule(self.interval, self.load_batch)
+
+    def _fail(self, error):
+        self.error = error
+        self.finished = True
+        self.scheduler.stop()
+
+    def load_batch(self):
+        """다음 batch_size개 레코드 적용 (스케줄러 스레드)"""
+        robots = []
+        try:
+            for _ in range(self.batch_size):
+                record = next(self.records, None)
+                if record is None:
+                    self.finished = True
+                    break
+                if isinstance(record, ScenarioRobot):
+                    robots.append(record)
+                    continue
+                # 이벤트보다 앞에서 정의한 로봇을 먼저 등록
+                if robots:
+                    self._add_robots(robots)
+                    robots = []
+                self._schedule(record)
+        except ScenarioError as e:
+            self._fail(e)
+        except (OSError, UnicodeDecodeError) as e:
+            # 읽다가 난 입출력/인코딩 오류도 형식 오류처럼 멈추고 run()에서 다시 올림
+            self._fail(ScenarioError(None, f"read failed: {e}"))
+        if robots:
+            self._add_robots(robots)
+        if self.finished:
+            self._task.cancel()
+
+    def _add_robots(self, robots):
+        self.target.add_robots(robots)
+        self.robots += len(robots)
+
+    def _schedule(self, record):
+        self.events += 1
+        apply = self.target.start_mission if isinstance(record, ScenarioMission) else self.target.apply_status
+        delay = self.started_at + record.at - self.scheduler.clock()
+        if delay <= 0:
+            apply(record)
+        else:
+            self.scheduler.call_later(delay, apply, record)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시나리오 파일 검증")
+    parser.add_argument("path", help="시나리오 파일 (.jsonl)")
+    args = parser.parse_args()
+
+    counts = {"robot": 0, "mission": 0, "status": 0}
+    kinds = {ScenarioRobot: "robot", ScenarioMission: "mission", ScenarioStatus: "status"}
+    try:
+        for record in open_scenario(args.path):
+            counts[kinds[type(record)]] += 1
+    except (OSError, ScenarioError) as e:
+        print(f"{args.path}: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.path}: {counts['robot']} robots, {counts['mission']} missions, {counts['status']} status changes")
+
+
+if __name__ == "__main__":
+    main()
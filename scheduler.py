@@ -0,0 +1,210 @@
+"""절대 데드라인 기반으로 여러 주기 작업을 한 스레드에서 실행하는 틱 스케줄러"""
+import heapq
+import itertools
+import threading
+import time
+import traceback
+
+# 밀린 틱 처리 정책
+CATCH_UP = 'catch_up'  # 밀린 틱을 모두 바로 실행
+SKIP = 'skip'          # 밀린 틱은 건너뛰고 다음 데드라인에 맞춤
+
+
+class ScheduledTask:
+    def __init__(self, scheduler, period, callback, args, policy, deadline):
+        self.scheduler = scheduler
+        # None이면 한 번만 실행 (call_later)
+        self.period = period
+        self.callback = callback
+        self.args = args
+        self.policy = policy
+        self.deadline = deadline
+        self.cancelled = False
+
+        # 틱 통계
+        self.fired = 0
+        self.skipped = 0
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+
+    @property
+    def mean_lateness(self):
+        return self.total_lateness / self.fired if self.fired else 0.0
+
+    def cancel(self):
+        """작업 취소 (이미 실행 중인 틱은 끝까지 실행됨)"""
+        self.cancelled = True
+        self.scheduler._wakeup()
+
+
+class TickScheduler:
+    def __init__(self, clock=time.monotonic, policy=SKIP, max_catch_up=10, on_tick=None):
+        self.clock = clock
+        self.policy = policy
+        # CATCH_UP 정책에서 한 번에 몰아서 실행할 최대 틱 수 (초과분은 건너뜀)
+        self.max_catch_up = max_catch_up
+        # 틱마다 on_tick(task, lateness) 호출 (지연 측정용)
+        self.on_tick = on_tick
+
+        self._heap = []
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._stopped = False
+        self._thread = None
+        # 현재 실행 중인 작업 (콜백 안에서 자기 작업을 취소할 때 사용)
+        self.current_task = None
+        # 다음 데드라인을 기다리며 쉰 시간 누계 (초, 실제 시간 기준)
+        self.idle_seconds = 0.0
+
+    @property
+    def pending(self):
+        """등록된 작업 수 (취소 후 아직 정리되지 않은 작업 포함)"""
+        return len(self._heap)
+
+    def schedule(self, period, callback, *args, policy=None, delay=0.0):
+        """period초마다 callback(*args)를 실행하는 작업을 등록하고 반환"""
+        if period <= 0:
+            raise ValueError("period must be positive")
+
+        with self._condition:
+            deadline = self.clock() + delay
+            task = ScheduledTask(self, period, callback, args, policy or self.policy, deadline)
+            heapq.heappush(self._heap, (deadline, next(self._seq), task))
+            self._condition.notify()
+        return task
+
+    def call_later(self, delay, callback, *args):
+        """delay초 뒤에 callback(*args)를 한 번만 실행하는 작업을 등록하고 반환"""
+        with self._condition:
+            deadline = self.clock() + max(0.0, delay)
+            task = ScheduledTask(self, None, callback, args, SKIP, deadline)
+            heapq.heappush(self._heap, (deadline, next(self._seq), task))
+            self._condition.notify()
+        return task
+
+    def _wakeup(self):
+        with self._condition:
+            self._condition.notify()
+
+    def next_deadline(self):
+        """가장 빠른 데드라인 (취소된 작업은 정리, 없으면 None)"""
+        with self._condition:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def run_pending(self, now=None):
+        """데드라인이 지난 작업을 모두 실행하고 실행한 틱 수를 반환"""
+        if now is None:
+            now = self.clock()
+
+        fired = 0
+        while not self._stopped:
+            with self._condition:
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                deadline, _, task = heapq.heappop(self._heap)
+                if task.cancelled:
+                    continue
+
+            lateness = now - deadline
+            task.fired += 1
+            task.last_lateness = lateness
+            task.total_lateness += lateness
+            if lateness > task.max_lateness:
+                task.max_lateness = lateness
+            if self.on_tick:
+                self.on_tick(task, lateness)
+
+            self.current_task = task
+            try:
+                task.callback(*task.args)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.current_task = None
+            fired += 1
+
+            if not task.cancelled and task.period is not None:
+                self._reschedule(task, deadline, now)
+        return fired
+
+    def _reschedule(self, task, deadline, now):
+        """다음 데드라인 계산 (실행 시간과 무관하게 절대 시각 기준)"""
+        next_deadline = deadline + task.period
+        missed = int((now - next_deadline) // task.period) + 1 if next_deadline <= now else 0
+
+        if missed > 0:
+            if task.policy == SKIP:
+                # 지난 데드라인을 건너뛰고 now 이후 첫 데드라인으로 이동
+                task.skipped += missed
+                next_deadline += missed * task.period
+            elif missed > self.max_catch_up:
+                # 따라잡기 한도를 넘는 틱은 건너뜀
+                dropped = missed - self.max_catch_up
+                task.skipped += dropped
+                next_deadline += dropped * task.period
+
+        task.deadline = next_deadline
+        with self._condition:
+            heapq.heappush(self._heap, (next_deadline, next(self._seq), task))
+
+    def run(self):
+        """stop()이 호출될 때까지 현재 스레드에서 작업 실행"""
+        self._running = True
+        self._stopped = False
+        self._loop()
+
+    def _loop(self):
+        while self._running:
+            deadline = self.next_deadline()
+            with self._condition:
+                if not self._running:
+                    break
+                if deadline is None:
+                    started = time.perf_counter()
+                    self._condition.wait()
+                    self.idle_seconds += time.perf_counter() - started
+                    continue
+                timeout = deadline - self.clock()
+                if timeout > 0:
+                    started = time.perf_counter()
+                    self._condition.wait(timeout)
+                    self.idle_seconds += time.perf_counter() - started
+                    continue
+            self.run_pending()
+
+    def run_virtual(self, until=None):
+        """시뮬레이션 시계(clock=SimClock)로 실행: 기다리지 않고 다음 데드라인으로 시계를 옮김
+
+        작업이 없거나 stop()이 호출되거나 시뮬레이션 시간이 until을 넘으면 끝납니다.
+        """
+        self._running = True
+        self._stopped = False
+        while self._running:
+            deadline = self.next_deadline()
+            if deadline is None or (until is not None and deadline > until):
+                break
+            self.clock.advance_to(deadline)
+            self.run_pending(deadline)
+        self._running = False
+
+    def start(self):
+        """전용 스레드 하나에서 스케줄러 실행"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """스케줄러 종료 (같은 시각에 밀려 있던 나머지 틱도 실행하지 않음)"""
+        self._running = False
+        self._stopped = True
+        self._wakeup()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
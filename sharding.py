@@ -0,0 +1,175 @@
+"""로봇을 여러 워커 프로세스로 나눠 발송하는 샤드 모드
+
+각 워커는 자기 몫의 로봇에 대한 엔진, 틱 스케줄러, 발송 백엔드(MQTT 클라이언트)를 따로 가지므로
+GIL 하나와 paho 네트워크 루프 하나에 묶이지 않습니다.
+코디네이터는 시작/정지와 플릿 전체 상태 변경을 명령 큐로 전달하고, 끝나면 샤드별 측정값을 합칩니다.
+"""
+import multiprocessing
+import queue
+import time
+
+from fleet_snapshot import FLEET_SNAPSHOT_TOPIC
+from loadgen import LoadGenerator, format_report, merge_metrics
+from robot_enums import OPERATIONAL_STATUSES
+from transport import create_transport
+
+# 워커가 명령 큐를 확인하는 주기 (초)
+COMMAND_POLL_INTERVAL = 0.05
+# 워커 준비 / 종료 후 결과 전달을 기다리는 최대 시간 (초)
+WORKER_TIMEOUT = 60.0
+
+
+class ShardError(RuntimeError):
+    pass
+
+
+def shard_ranges(robots, shards):
+    """로봇 번호 0..robots-1을 shards개로 고르게 나눈 (first_id, count) 목록"""
+    base, extra = divmod(robots, shards)
+    ranges = []
+    first_id = 0
+    for shard in range(shards):
+        count = base + (1 if shard < extra else 0)
+        ranges.append((first_id, count))
+        first_id += count
+    return ranges
+
+
+def _worker(shard, first_id, count, config, commands, results, start_event):
+    """워커 프로세스 본체: 준비되면 알리고, 시작 신호를 받아 발송한 뒤 측정값을 돌려줌"""
+    try:
+        transport = create_transport(config["transport"], **config["transport_options"])
+        transport.connect()
+    except Exception as e:
+        results.put(("error", shard, f"{type(e).__name__}: {e}"))
+        return
+
+    try:
+        generator = LoadGenerator(transport, robots=count, hz=config["hz"], duration=config["duration"],
+                                  status_hz=config["status_hz"], binary=config["binary"],
+                                  seed=config["seed"] + shard, first_id=first_id,
+                                  max_pending=config["max_pending"], snapshot=config["snapshot"],
+                                  snapshot_topic=f"{FLEET_SNAPSHOT_TOPIC}/{shard}", commands=config["commands"])
+
+        def poll_commands():
+            while True:
+                try:
+                    command, args = commands.get_nowait()
+                except queue.Empty:
+                    return
+                if command == "stop":
+                    generator.scheduler.stop()
+                elif command == "operational_status":
+                    generator.operational_status = args[0]
+
+        results.put(("ready", shard, None))
+        start_event.wait()
+        generator.scheduler.schedule(COMMAND_POLL_INTERVAL, poll_commands)
+        generator.run()
+        results.put(("done", shard, generator.metrics()))
+    except Exception as e:
+        results.put(("error", shard, f"{type(e).__name__}: {e}"))
+    finally:
+        transport.disconnect()
+
+
+class ShardCoordinator:
+    """워커 프로세스를 띄우고 시작/정지/상태 변경을 전달한 뒤 측정값을 합침
+
+    transport: create_transport의 kind ('paho' / 'loopback' / 'null'), 워커마다 따로 만듦
+    snapshot이면 샤드마다 fleet/snapshot/{샤드 번호} 토픽으로 프레임을 보냄
+    commands면 샤드마다 robot/+/command를 구독하고 자기 로봇의 명령만 적용함
+    """
+
+    def __init__(self, shards, robots=100, hz=2.0, duration=10.0, status_hz=0.0, binary=False, max_pending=0,
+                 snapshot=False, transport="loopback", transport_options=None, seed=0, commands=False):
+        # 로봇보다 샤드가 많으면 빈 워커가 생기므로 줄임
+        self.shards = max(1, min(shards, robots))
+        self.robots = robots
+        self.duration = duration
+        self.config = {
+            "hz": hz,
+            "duration": duration,
+            "status_hz": status_hz,
+            "binary": binary,
+            "max_pending": max_pending,
+            "snapshot": snapshot,
+            "commands": commands,
+            "transport": transport,
+            "transport_options": transport_options or {},
+            "seed": seed,
+        }
+        # Windows와 동작을 맞추고 부모의 스레드/소켓을 물려받지 않도록 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._results = self._context.Queue()
+        self._start_event = self._context.Event()
+        self._processes = []
+        self._commands = []
+
+    def start(self):
+        """워커를 모두 띄우고 준비가 끝나면 동시에 시작"""
+        for shard, (first_id, count) in enumerate(shard_ranges(self.robots, self.shards)):
+            commands = self._context.Queue()
+            process = self._context.Process(
+                target=_worker, name=f"shard-{shard}", daemon=True,
+                args=(shard, first_id, count, self.config, commands, self._results, self._start_event))
+            process.start()
+            self._processes.append(process)
+            self._commands.append(commands)
+
+        self._wait("ready", WORKER_TIMEOUT)
+        self._start_event.set()
+
+    def broadcast(self, command, *args):
+        for commands in self._commands:
+            commands.put((command, args))
+
+    def set_operational_status(self, status):
+        """모든 샤드의 상태 메시지 운영 상태 변경"""
+        if status not in OPERATIONAL_STATUSES:
+            raise ValueError(f"unknown operational status: {status}")
+        self.broadcast("operational_status", status)
+
+    def stop(self):
+        """duration 전에 모든 샤드 정지 (결과는 join()으로 받음)"""
+        self.broadcast("stop")
+
+    def join(self):
+        """모든 샤드가 끝나길 기다려 합친 측정값 반환"""
+        results = self._wait("done", self.duration + WORKER_TIMEOUT)
+        for process in self._processes:
+            process.join()
+        return merge_metrics([results[shard] for shard in sorted(results)])
+
+    def run(self):
+        self.start()
+        return format_report(self.join())
+
+    def terminate(self):
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    def _wait(self, kind, timeout):
+        """모든 샤드에서 kind 메시지를 받을 때까지 대기 (샤드 번호 -> 내용)"""
+        deadline = time.monotonic() + timeout
+        received = {}
+        while len(received) < len(self._processes):
+            try:
+                message, shard, payload = self._results.get(timeout=0.5)
+            except queue.Empty:
+                dead = [process.name for shard, process in enumerate(self._processes)
+                        if shard not in received and not process.is_alive()]
+                if dead or time.monotonic() > deadline:
+                    self.terminate()
+                    reason = f"exited: {', '.join(dead)}" if dead else "timed out"
+                    raise ShardError(f"waiting for '{kind}' from shards, {reason}") from None
+                continue
+
+            if message == "error":
+                self.terminate()
+                raise ShardError(f"shard {shard} failed: {payload}")
+            if message == kind:
+                received[shard] = payload
+        return received
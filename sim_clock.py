@@ -0,0 +1,73 @@
+"""실제 시간과 분리된 시뮬레이션 시계 (데이터셋 생성용 가상 시간 모드)
+
+TickScheduler(clock=SimClock())로 만들고 run_virtual()로 실행하면 다음 데드라인까지 기다리지 않고
+시계를 바로 옮기므로 CPU가 허용하는 만큼 빠르게 시뮬레이션이 진행됩니다.
+speed를 주면 실제 시간의 speed배로 속도를 맞춥니다 (예: 60 = 1분을 1초에).
+"""
+import datetime
+import time
+
+from telemetry_encoder import format_timestamp_ms
+
+
+def parse_start_time(text):
+    """ISO 8601 문자열 (예: 2024-05-01T06:00:00Z)을 UTC epoch 초로 변환"""
+    value = datetime.datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+class SimClock:
+    """호출하면 (clock()) 시작 후 흐른 시뮬레이션 시간 (초)을 돌려줌
+
+    start_time: 시뮬레이션 시작 시각 (UTC epoch 초, 없으면 현재 시각을 밀리초로 자름)
+    speed: 실제 시간 대비 배속 (None 또는 0 = 최대한 빠르게)
+    """
+
+    def __init__(self, start_time=None, speed=None, wall_clock=time.monotonic, sleep=time.sleep):
+        if start_time is None:
+            start_time = int(time.time() * 1000) / 1000
+        self.start_time = start_time
+        self.speed = speed
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self._now = 0.0
+        self._wall_start = None
+        # 배속을 맞추느라 잠든 시간 누계 (초, 실제 시간)
+        self.paced_seconds = 0.0
+
+    def __call__(self):
+        return self._now
+
+    @property
+    def elapsed(self):
+        """시작 후 흐른 시뮬레이션 시간 (초)"""
+        return self._now
+
+    def time(self):
+        """현재 시뮬레이션 시각 (UTC epoch 초)"""
+        return self.start_time + self._now
+
+    def time_ms(self):
+        return int(round((self.start_time + self._now) * 1000))
+
+    def timestamp(self):
+        """밀리초 단위 ISO 8601 문자열 (예: 2024-05-01T06:00:00.500Z)"""
+        return format_timestamp_ms(self.time_ms())
+
+    def advance_to(self, now):
+        """시뮬레이션 시간을 now로 옮김 (speed가 있으면 실제 시간이 따라올 때까지 대기)"""
+        if now <= self._now:
+            return
+        if self.speed:
+            if self._wall_start is None:
+                self._wall_start = self.wall_clock() - self._now / self.speed
+            delay = self._wall_start + now / self.speed - self.wall_clock()
+            if delay > 0:
+                self.sleep(delay)
+                self.paced_seconds += delay
+        self._now = now
+
+    def advance(self, seconds):
+        self.advance_to(self._now + seconds)
@@ -0,0 +1,771 @@
+"""시뮬레이터 코어 (로봇 레지스트리, 플릿 엔진, 발송, 배터리, 지표) - tkinter를 쓰지 않음
+
+GUI (simulator_gui)와 헤드리스 실행이 같은 코어를 씁니다. 틱은 모두 스케줄러 스레드에서 실행되며,
+화면에 알릴 일은 on_* 콜백 속성으로 전달합니다 (GUI는 root.after로 UI 스레드에 넘김).
+
+헤드리스 실행 (디스플레이 없는 컨테이너 등):
+    python simulator_core.py --broker localhost:1883 --robot ROBOT-001 --end 100,50 --speed 1
+    python simulator_core.py --broker localhost:1883 --map greenhouse.map --start 1,1 --end 90,60
+"""
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from battery_model import CHARGING, ERROR, MOVING, BatteryModel
+from command_router import MISSION, CommandRouter
+from fleet_engine import FleetEngine
+from log_sink import LogSink
+from metrics import LATENESS_BUCKETS, MetricsExporter, MetricsRegistry, SamplingProfiler
+from publish_control import PublishController
+from publish_policy import PublishGate, PublishPolicy
+from robot_enums import OPERATIONAL_STATUSES
+from robot_registry import RobotRegistry
+from scheduler import TickScheduler
+from spatial_hash import SpatialHash, ProximityMonitor
+from telemetry_encoder import TelemetryEncoder
+from transport import TRANSPORTS, create_transport
+
+# 대기 중인 로그 링 버퍼 크기 (초과 시 오래된 줄부터 버림)
+LOG_BUFFER_SIZE = 5000
+
+# 위치 센서 분해능 (m) - 마지막 발송 위치에서 이보다 적게 움직이면 발송하지 않음
+POSITION_DEAD_BAND = 0.01
+
+# 처음 등록되어 있는 로봇
+DEFAULT_ROBOT_IDS = ['ROBOT-001', 'ROBOT-002', 'ROBOT-003']
+# 이 값(%) 미만이면 배터리 부족 로봇으로 집계
+LOW_BATTERY_THRESHOLD = 20
+# 이동 거리/작동 상태에 따라 전체 로봇 배터리를 계산하는 주기 (초)
+BATTERY_INTERVAL = 1.0
+
+# 런타임 지표 내보내기 (Prometheus 텍스트 파일 + simulator/$SYS/metrics 토픽)
+METRICS_INTERVAL = 5.0
+METRICS_FILE = "simulator_metrics.prom"
+
+# MQTT 발송 제한 (QoS 1, 2 인플라이트/대기열, 클라이언트에 쌓일 수 있는 최대 메시지 수)
+MQTT_MAX_INFLIGHT = 20
+MQTT_MAX_QUEUED = 1000
+PUBLISH_MAX_PENDING = 1000
+PUBLISH_FLUSH_INTERVAL = 0.1  # 보류한 메시지를 다시 보내 보는 주기 (초)
+
+# robot/+/command로 받은 명령을 적용하고 명령으로 이동 중인 로봇 위치를 발송하는 주기 (초)
+COMMAND_INTERVAL = 0.1
+
+# 충돌/근접 경고 거리 (m)
+PROXIMITY_COLLISION_RADIUS = 0.5
+PROXIMITY_NEAR_MISS_RADIUS = 1.5
+# 위치 틱마다 발송 / 로그하는 최대 근접 이벤트 수 (나머지는 overflow 이벤트 하나로 묶음)
+PROXIMITY_MAX_EVENTS = 100
+
+
+class SimulatorCore:
+    """콜백 속성 (모두 스케줄러 / MQTT 네트워크 스레드에서 호출됨)
+
+    on_connect(rc), on_disconnect(rc): 브로커 연결 / 끊김
+    on_position(robot_id, x, y, progress, lateness, suppressed): 위치 틱마다
+    on_mission_end(robot_id): 도착하거나 배터리 때문에 이동이 끝났을 때
+    on_status(count, lateness, suppressed): 상태 틱마다
+    on_battery(): 배터리 틱마다 (레지스트리 값이 바뀐 뒤)
+    """
+
+    def __init__(self, robot_ids=DEFAULT_ROBOT_IDS, metrics_file=None):
+        self.on_connect = None
+        self.on_disconnect = None
+        self.on_position = None
+        self.on_mission_end = None
+        self.on_status = None
+        self.on_battery = None
+
+        # MQTT 클라이언트 (connect 전에는 None)
+        self.transport = None
+        # 클라이언트 대기열이 밀리면 발송 속도를 낮추고 오래된 위치를 합치는 역압 제어
+        self.publish_controller = None
+        self.flush_task = None
+        # 발송 메시지 기록 (재생용, 선택)
+        self.recorder = None
+
+        # 위치 시뮬레이션 (한 번에 로봇 한 대)
+        self.mission_task = None
+        self.mission_robot = None
+        self.mission_position = (0.0, 0.0)
+        # 점유 격자 지도가 있으면 장애물을 돌아가는 경로로 이동 (load_map 전에는 None = 직선 이동)
+        self.path_planner = None
+
+        # 상태 정보 발송
+        self.status_task = None
+        self.status_count = 0
+
+        # 런타임 지표 (단계별 소요 시간, 틱 지연, 대기열 깊이)
+        self.metrics = MetricsRegistry()
+        self.stage_timers = {
+            stage: self.metrics.histogram("stage_seconds", "Time spent per simulator stage", {"stage": stage})
+            for stage in ("build", "encode", "publish", "proximity", "ui")
+        }
+        self.profiler = SamplingProfiler()
+
+        # 모든 로봇의 위치/상태 발송 틱을 한 스레드에서 실행하는 스케줄러
+        self.scheduler = TickScheduler(on_tick=self.observe_tick)
+        self.scheduler.start()
+
+        # 등록된 로봇과 로봇별 저장 위치/상태 (ID -> 슬롯, NumPy 열)
+        self.registry = RobotRegistry()
+        self.registry.add_many(robot_ids)
+
+        # 전체 로봇 이동을 일괄 계산하는 플릿 엔진
+        self.fleet_engine = FleetEngine(spatial_index=SpatialHash(cell_size=PROXIMITY_NEAR_MISS_RADIUS))
+        # 엔진 슬롯 -> 레지스트리 슬롯
+        self.registry_slots = np.array([], dtype=np.int64)
+        self.add_to_fleet_engine(self.registry.robot_ids)
+
+        # 배터리 모델 (지난 배터리 틱 이후 이동 거리로 소모량 계산)
+        self.battery_model = BatteryModel()
+        # 지난 배터리 틱의 엔진 누적 이동 거리 (미션 시작점으로 옮기는 것은 이동 거리에 넣지 않음)
+        self.battery_odometer = self.fleet_engine.odometer[:self.fleet_engine.count].copy()
+
+        # 로봇 간 충돌/근접 감시 (위치 틱마다 검사해서 fleet/proximity 토픽으로 발송)
+        self.proximity_monitor = ProximityMonitor(
+            self.fleet_engine.spatial_index, self.fleet_engine.robot_ids,
+            collision_radius=PROXIMITY_COLLISION_RADIUS, near_miss_radius=PROXIMITY_NEAR_MISS_RADIUS,
+            max_events=PROXIMITY_MAX_EVENTS
+        )
+
+        # robot/+/command로 받은 명령 (네트워크 스레드는 대기열에 넣기만 하고 명령 틱에서 한꺼번에 적용)
+        self.command_router = CommandRouter(self.fleet_engine.slots)
+        # 명령으로 이동 중인 로봇: 엔진 슬롯 -> [로봇 ID, 도착 후 작동 상태, 명령을 받은 시각 (첫 위치 발송 후 None)]
+        self.commanded = {}
+        self.command_latency = self.metrics.histogram(
+            "command_latency_seconds", "Time from receiving a mission command to publishing the robot's first position",
+            buckets=LATENESS_BUCKETS)
+
+        # 발송 메시지 인코더 (로봇별 템플릿, 초 단위 타임스탬프 캐시)
+        self.telemetry_encoder = TelemetryEncoder()
+
+        # 발송 정책 (위치: 데드밴드, 상태: start_status에서 설정)
+        self.position_gate = PublishGate(PublishPolicy(
+            on_change=True, dead_bands={'x': POSITION_DEAD_BAND, 'y': POSITION_DEAD_BAND}
+        ))
+        self.status_gate = PublishGate()
+
+        # 워커 스레드가 넣은 로그를 화면 (또는 표준 출력)이 주기적으로 묶어서 가져감
+        self.log_sink = LogSink(LOG_BUFFER_SIZE)
+        self.status_log_sink = LogSink(LOG_BUFFER_SIZE)
+
+        self.register_metrics()
+        self.metrics_exporter = MetricsExporter(self.metrics, path=metrics_file)
+        self.scheduler.schedule(METRICS_INTERVAL, self.metrics_exporter.export, delay=METRICS_INTERVAL)
+        self.scheduler.schedule(BATTERY_INTERVAL, self.run_battery_model, delay=BATTERY_INTERVAL)
+        self.scheduler.schedule(COMMAND_INTERVAL, self.run_commands)
+
+    def register_metrics(self):
+        """대기열 깊이 등 내보낼 때 읽는 지표 등록"""
+        metrics = self.metrics
+        metrics.counter("scheduler_idle_seconds_total", "Time the tick scheduler spent sleeping",
+                        fn=lambda: self.scheduler.idle_seconds)
+        metrics.gauge("scheduler_tasks", "Tasks registered in the tick scheduler",
+                      fn=lambda: self.scheduler.pending)
+        for name, sink in (("position", self.log_sink), ("status", self.status_log_sink)):
+            metrics.gauge("log_queue_lines", "Log lines waiting for the UI", {"log": name}, fn=lambda sink=sink: sink.pending)
+            metrics.counter("log_dropped_lines_total", "Log lines dropped from a full buffer", {"log": name},
+                            fn=lambda sink=sink: sink.dropped)
+        metrics.gauge("mqtt_pending_messages", "Messages accepted by the MQTT client but not yet sent",
+                      fn=lambda: self.transport.pending if self.transport else 0)
+        metrics.gauge("publish_deferred_messages", "Messages held back by backpressure",
+                      fn=lambda: self.publish_controller.held if self.publish_controller else 0)
+        metrics.gauge("publish_rate_ratio", "Publish rate relative to the configured interval",
+                      fn=lambda: self.publish_controller.rate if self.publish_controller else 1.0)
+        metrics.counter("published_messages_total", "Messages handed to the MQTT client",
+                        fn=lambda: self.publish_controller.sent if self.publish_controller else 0)
+        metrics.counter("publish_throttle_events_total", "Ticks skipped, messages deferred or rejected by backpressure",
+                        fn=lambda: self.publish_controller.throttle_events if self.publish_controller else 0)
+        router = self.command_router
+        for result in ("received", "applied", "unknown", "rejected", "dropped"):
+            metrics.counter("commands_total", "Commands received on robot/+/command by outcome", {"result": result},
+                            fn=lambda result=result: getattr(router, result))
+        metrics.gauge("command_queue_depth", "Commands waiting for the next command tick", fn=lambda: router.pending)
+        metrics.gauge("commanded_robots", "Robots moving on a mission command", fn=lambda: len(self.commanded))
+
+    def observe_tick(self, task, lateness):
+        """스케줄러 틱마다 작업 종류별 지연 기록 (스케줄러 스레드)"""
+        self.metrics.histogram("tick_lateness_seconds", "How late scheduler ticks ran after their deadline",
+                               {"task": task.callback.__name__}, buckets=LATENESS_BUCKETS).observe(lateness)
+
+    def log(self, message):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_sink.append(f"[{timestamp}] {message}\n")
+
+    def status_log(self, message):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.status_log_sink.append(f"[{timestamp}] {message}\n")
+
+    # 발송
+
+    def connect(self, transport):
+        """발송 백엔드 연결 (PahoTransport는 연결 결과를 on_connect로 알림)
+
+        연결하면 robot/+/command를 구독합니다 (PahoTransport는 재연결할 때도 다시 구독).
+        transport.connect()가 실패하면 (OSError 등) 예외를 그대로 올리고 이전 발송 상태를 바꾸지 않습니다.
+        """
+        if hasattr(transport, 'on_connect'):
+            transport.on_connect = self._handle_connect
+            transport.on_disconnect = self._handle_disconnect
+        transport.connect()
+
+        self.transport = transport
+        self.publish_controller = PublishController(transport, max_pending=PUBLISH_MAX_PENDING, on_publish=self.record)
+        if self.flush_task:
+            self.flush_task.cancel()
+        self.flush_task = self.scheduler.schedule(PUBLISH_FLUSH_INTERVAL, self.publish_controller.flush)
+        self.metrics_exporter.publish = self.publish
+        self.command_router.subscribe(transport)
+
+    def connect_mqtt(self, host, port):
+        from transport import PahoTransport
+
+        self.log(f"MQTT 브로커에 연결 중... ({host}:{port})")
+        self.connect(PahoTransport(host, port, max_inflight=MQTT_MAX_INFLIGHT, max_queued=MQTT_MAX_QUEUED))
+
+    def _handle_connect(self, rc):
+        if rc == 0:
+            self.log("MQTT 브로커에 연결되었습니다.")
+            self.status_log("MQTT 브로커에 연결되었습니다.")
+        else:
+            self.log(f"MQTT 연결 실패 (코드: {rc})")
+            self.status_log(f"MQTT 연결 실패 (코드: {rc})")
+        if self.on_connect:
+            self.on_connect(rc)
+
+    def _handle_disconnect(self, rc):
+        self.log("MQTT 브로커와 연결이 끊어졌습니다.")
+        self.status_log("MQTT 브로커와 연결이 끊어졌습니다.")
+        if self.on_disconnect:
+            self.on_disconnect(rc)
+
+    def publish(self, topic, payload, key=None):
+        """역압 제어를 거쳐 MQTT 발송 (key가 같은 보류 메시지는 새 메시지로 대체, 발송했으면 True)"""
+        return self.publish_controller.publish(topic, payload, key=key)
+
+    def record(self, topic, payload):
+        """실제로 발송한 메시지를 기록 (기록 중일 때만)"""
+        recorder = self.recorder
+        if recorder:
+            recorder.record(topic, payload)
+
+    def start_recording(self, path):
+        """발송 메시지 기록 시작 (파일을 만들 수 없으면 OSError)"""
+        from telemetry_recorder import TelemetryRecorder
+
+        self.recorder = TelemetryRecorder(path)
+        self.log(f"발송 메시지 기록 시작: {path}")
+
+    def stop_recording(self):
+        if self.recorder:
+            recorder, self.recorder = self.recorder, None
+            recorder.close()
+            self.log(f"발송 메시지 기록 종료: {recorder.path} ({recorder.records}건)")
+
+    def set_binary_payload(self, binary):
+        """페이로드 형식 (JSON / 바이너리) 변경"""
+        if binary:
+            from binary_codec import BinaryTelemetryEncoder
+
+            self.telemetry_encoder = BinaryTelemetryEncoder()
+            self.log("페이로드 형식: 바이너리")
+        else:
+            self.telemetry_encoder = TelemetryEncoder()
+            self.log("페이로드 형식: JSON")
+
+    # 로봇 등록
+
+    def add_to_fleet_engine(self, robot_ids):
+        slots = [self.fleet_engine.add_robot(robot_id) for robot_id in robot_ids]
+        registry_slots = np.empty(self.fleet_engine.count, dtype=np.int64)
+        registry_slots[:len(self.registry_slots)] = self.registry_slots
+        registry_slots[slots] = [self.registry.slot(robot_id) for robot_id in robot_ids]
+        self.registry_slots = registry_slots
+
+    def fleet_snapshot(self):
+        """엔진 슬롯 순서의 전체 로봇 위치 (N, 2), 방향, 작동 상태 코드 복사본 (지도 화면용, UI 스레드에서 호출)"""
+        engine = self.fleet_engine
+        registry_slots = self.registry_slots
+        # 로봇을 추가하는 중이면 엔진과 슬롯 매핑이 모두 갖춰진 로봇까지만
+        count = min(engine.count, len(registry_slots))
+        positions = engine.positions[:count].copy()
+        headings = engine.headings[:count].copy()
+        statuses = self.registry.status[registry_slots[:count]]
+        return positions, headings, statuses
+
+    def next_robot_ids(self, count):
+        """아직 쓰지 않은 ROBOT-004, ROBOT-005, ... count개"""
+        robot_ids = []
+        number = len(self.registry)
+        while len(robot_ids) < count:
+            number += 1
+            robot_id = f"ROBOT-{number:03d}"
+            if robot_id not in self.registry:
+                robot_ids.append(robot_id)
+        return robot_ids
+
+    def register_robots(self, robot_ids):
+        """레지스트리와 플릿 엔진에 로봇 추가 (위치는 첫 미션에서 정해지며 그 전에는 근접 검사에서 빠짐)"""
+        self.registry.add_many(robot_ids)
+        self.add_to_fleet_engine(robot_ids)
+        self.log(f"로봇 {len(robot_ids)}대 등록 (전체 {len(self.registry)}대)")
+
+    def low_battery_count(self):
+        return len(self.registry.select(battery_below=LOW_BATTERY_THRESHOLD))
+
+    # 위치 시뮬레이션
+
+    def load_map(self, path):
+        """점유 격자 지도 파일을 읽어 이후 미션의 경로 계획에 씀 (형식 오류는 ValueError, 파일 오류는 OSError)"""
+        from path_planner import PathPlanner, load_grid
+
+        grid = load_grid(path)
+        self.path_planner = PathPlanner(grid)
+        self.log(f"지도 불러옴: {path} ({grid.width}x{grid.height}칸, {grid.resolution} m/칸, "
+                 f"목적지 {len(grid.landmarks)}개)")
+        return grid
+
+    @property
+    def is_running(self):
+        return self.mission_task is not None
+
+    def start_mission(self, robot_id, start, end, speed, update_interval, waypoints=()):
+        """start -> (waypoints) -> end 이동을 시작하고 update_interval마다 위치 발송 (움직일 거리가 없으면 False)"""
+        if update_interval <= 0:
+            raise ValueError("update interval must be positive")
+
+        route = [tuple(start)] + list(waypoints) + [tuple(end)]
+        if self.path_planner:
+            from path_planner import PlanningError
+
+            started = time.perf_counter()
+            try:
+                route = self.path_planner.plan_route(route)
+            except PlanningError as e:
+                self.log(f"경로 계획 실패: {e}")
+                return False
+            self.log(f"경로 계획: 경유점 {len(route) - 2}개 ({(time.perf_counter() - started) * 1e3:.1f} ms)")
+
+        # 플릿 엔진에 이동 경로 등록 (거리/방향 계산은 엔진에서 일괄 처리)
+        if len(route) > 2:
+            slot = self.fleet_engine.start_route(robot_id, route, speed)
+        else:
+            slot = self.fleet_engine.start_mission(robot_id, start[0], start[1], end[0], end[1], speed)
+        if not self.fleet_engine.moving[slot]:
+            self.log("시작점과 도착점이 동일합니다.")
+            return False
+
+        # 새 이동은 첫 위치부터 발송
+        self.position_gate.reset(robot_id)
+        if self.publish_controller:
+            self.publish_controller.reset(f"robot/{robot_id}/position")
+
+        # 스케줄러에 위치 발송 틱 등록 (절대 데드라인 기준으로 주기 유지)
+        self.mission_robot = robot_id
+        self.mission_position = (float(start[0]), float(start[1]))
+        self.mission_task = self.scheduler.schedule(update_interval, self.run_simulation, robot_id, slot,
+                                                    update_interval)
+        self.log(f"시뮬레이션 시작: {robot_id}")
+        return True
+
+    def run_simulation(self, robot_id, slot, update_interval):
+        """위치 발송 틱 (스케줄러 스레드에서 update_interval마다 호출)"""
+        task = self.scheduler.current_task
+        if task is not self.mission_task:
+            task.cancel()
+            return
+
+        timers = self.stage_timers
+        with timers['build'].time():
+            topic = f"robot/{robot_id}/position"
+            arrived = not self.fleet_engine.moving[slot]
+            current_x, current_y = self.fleet_engine.positions[slot]
+            current_x = float(current_x)
+            current_y = float(current_y)
+            heading = float(self.fleet_engine.headings[slot])
+            self.mission_position = (current_x, current_y)
+
+            # 역압으로 발송 속도를 낮췄거나 데드밴드 안에서 움직였으면 발송 생략 (도착점은 항상 발송)
+            values = {'x': current_x, 'y': current_y, 'heading': heading}
+            should_publish = (self.transport and self.publish_controller.admit(topic, update_interval, force=arrived)
+                              and self.position_gate.should_publish(robot_id, values, force=arrived))
+
+        if should_publish:
+            # 메시지 생성 (한 번만 직렬화해서 발송과 로그에 같이 사용)
+            with timers['encode'].time():
+                payload = self.telemetry_encoder.position(robot_id, current_x, current_y, heading)
+
+            # MQTT 메시지 발송 (대기열이 가득 차면 보류, 보류 중인 이전 위치는 대체)
+            with timers['publish'].time():
+                sent = self.publish(topic, payload, key=topic)
+            if sent:
+                self.log(f"발송: {self.telemetry_encoder.format_log(payload)}")
+
+        # 충돌/근접 검사
+        with timers['proximity'].time():
+            events = self.proximity_monitor.check()
+        if events and self.transport:
+            self.proximity_monitor.publish(self.publish, events)
+            for event in events:
+                self.log(f"근접 경고: {event}")
+
+        if self.on_position:
+            self.on_position(robot_id, current_x, current_y, self.fleet_engine.progress(slot), task.last_lateness,
+                             self.position_gate.suppressed[robot_id])
+
+        if arrived:
+            # 도착점 메시지까지 발송했으면 종료
+            self.log("시뮬레이션 완료: 도착점 도달")
+            self.end_mission()
+        else:
+            # 다음 위치 계산
+            self.fleet_engine.step(update_interval, slots=slot)
+
+    def stop_mission(self):
+        """이동 중지 후 마지막 위치를 레지스트리에 저장하고 (robot_id, x, y) 반환 (이동 중이 아니면 None)"""
+        robot_id = self.mission_robot
+        if self.mission_task:
+            self.mission_task.cancel()
+            self.mission_task = None
+        if robot_id is None:
+            return None
+        self.mission_robot = None
+
+        x, y = self.mission_position
+        self.fleet_engine.stop_mission(robot_id)
+        self.registry.update(robot_id, x=x, y=y,
+                             heading=float(self.fleet_engine.headings[self.fleet_engine.slots[robot_id]]))
+        self.log(f"시뮬레이션 정지 - {robot_id} 위치 저장됨: X={x:.2f}, Y={y:.2f}")
+        return robot_id, x, y
+
+    def end_mission(self):
+        """도착 / 배터리 부족으로 이동이 끝남 (on_mission_end로 알림)"""
+        robot_id = self.mission_robot
+        self.stop_mission()
+        if robot_id is not None and self.on_mission_end:
+            self.on_mission_end(robot_id)
+
+    # 상태 발송
+
+    def start_status(self, robot_id, interval, on_change=False, heartbeat=30.0):
+        """interval마다 robot_id의 상태 발송 (on_change면 값이 바뀌었거나 heartbeat초가 지났을 때만)"""
+        if self.status_task:
+            self.status_task.cancel()
+        # 발송 정책 설정 (변경 시에만 전송하더라도 heartbeat초마다 한 번은 전송)
+        if on_change:
+            self.status_gate.policy = PublishPolicy(on_change=True, heartbeat=heartbeat)
+        else:
+            self.status_gate.policy = PublishPolicy()
+        self.status_gate.reset(robot_id)
+
+        # 스케줄러에 상태 발송 틱 등록
+        self.status_count = 0
+        self.status_task = self.scheduler.schedule(interval, self.run_status_publishing, robot_id)
+        self.status_log(f"상태 전송 시작: {robot_id}")
+
+    def run_status_publishing(self, robot_id):
+        """상태 발송 틱 (스케줄러 스레드에서 interval마다 호출)"""
+        task = self.scheduler.current_task
+        if task is not self.status_task:
+            task.cancel()
+            return
+
+        topic = f"robot/{robot_id}/status"
+
+        # 현재 값 읽기 (UI에서 바꾼 값과 배터리 모델이 바꾼 값 모두 레지스트리에 있음)
+        state = self.registry.get(robot_id)
+        battery_level = state['battery']
+        role = state['role']
+        operational_status = state['operational_status']
+
+        # 값이 그대로면 발송 생략 (변경 시에만 전송 설정일 때)
+        timers = self.stage_timers
+        with timers['build'].time():
+            values = {'battery_level': battery_level, 'role': role, 'operational_status': operational_status}
+            should_publish = (self.transport and self.publish_controller.admit(topic, task.period)
+                              and self.status_gate.should_publish(robot_id, values))
+
+        if should_publish:
+            # 메시지 생성 (한 번만 직렬화해서 발송과 로그에 같이 사용)
+            with timers['encode'].time():
+                payload = self.telemetry_encoder.status(robot_id, battery_level, role, operational_status)
+
+            # MQTT 메시지 발송
+            with timers['publish'].time():
+                sent = self.publish(topic, payload, key=topic)
+            if sent:
+                self.status_count += 1
+                self.status_log(f"발송: {self.telemetry_encoder.format_log(payload)}")
+
+        if self.on_status:
+            self.on_status(self.status_count, task.last_lateness, self.status_gate.suppressed[robot_id])
+
+    def stop_status(self, robot_id):
+        if self.status_task:
+            self.status_task.cancel()
+            self.status_task = None
+        self.status_log(f"상태 전송 정지 - {robot_id} 상태 저장됨")
+
+    # 배터리
+
+    def run_battery_model(self):
+        """배터리 틱: 지난 틱 이후 이동 거리와 작동 상태로 전체 로봇 배터리 계산 (스케줄러 스레드)"""
+        engine = self.fleet_engine
+        registry = self.registry
+        registry_slots = self.registry_slots
+        # 로봇을 추가하는 중이면 엔진과 슬롯 매핑이 모두 갖춰진 로봇까지만
+        odometer = engine.odometer[:min(engine.count, len(registry_slots))].copy()
+        previous = self.battery_odometer
+        if len(previous) < len(odometer):
+            # 지난 틱 이후 등록한 로봇은 0 m부터
+            previous = np.concatenate((previous, np.zeros(len(odometer) - len(previous))))
+        self.battery_odometer = odometer
+
+        count = len(registry.ids)
+        distances = np.zeros(count)
+        distances[registry_slots[:len(odometer)]] = odometer - previous
+        changed = self.battery_model.step(registry.battery[:count], registry.role[:count], registry.status[:count],
+                                          distances, BATTERY_INTERVAL)
+
+        for slot in changed.tolist():
+            robot_id = registry.ids[slot]
+            status = registry.status[slot]
+            self.status_log(f"배터리 {registry.battery[slot]:.1f}% - {robot_id} 상태 변경: "
+                            f"{OPERATIONAL_STATUSES[status]}")
+            # 충전하러 가거나 멈춘 로봇은 이동 중지
+            if robot_id == self.mission_robot and status in (CHARGING, ERROR):
+                self.log(f"{robot_id} 배터리 부족으로 이동 중지 ({OPERATIONAL_STATUSES[status]})")
+                self.end_mission()
+            elif status in (CHARGING, ERROR) and engine.slots.get(robot_id) in self.commanded:
+                self.log(f"{robot_id} 배터리 부족으로 명령 이동 중지 ({OPERATIONAL_STATUSES[status]})")
+                self.stop_commanded(engine.slots[robot_id])
+        if self.on_battery:
+            self.on_battery()
+
+    # 명령 수신
+
+    def run_commands(self):
+        """명령 틱: 받은 명령을 한꺼번에 적용하고 명령으로 이동 중인 로봇을 움직여 위치 발송 (스케줄러 스레드)"""
+        if self.command_router.pending:
+            self.apply_commands(self.command_router.drain())
+        if self.commanded:
+            self.step_commanded(COMMAND_INTERVAL)
+
+    def apply_commands(self, commands):
+        """받은 순서대로 적용 (같은 로봇의 이동 명령은 마지막 것만, 나중에 온 작동 상태 변경이 앞선 이동 명령을 대체)"""
+        missions = {}
+        for slot, kind, record, received_at in commands:
+            if kind == MISSION:
+                missions[slot] = (record, received_at)
+                continue
+            if record.status is not None:
+                missions.pop(slot, None)
+            self.apply_status_command(slot, record)
+        for slot, (mission, received_at) in missions.items():
+            self.start_commanded(slot, mission, received_at)
+
+    def apply_status_command(self, slot, status):
+        robot_id = status.robot_id
+        self.registry.update(robot_id, battery=status.battery, role=status.role, operational_status=status.status)
+        changes = ", ".join(f"{name}={value}" for name, value in
+                            (("status", status.status), ("role", status.role), ("battery", status.battery))
+                            if value is not None)
+        self.status_log(f"명령: {robot_id} {changes}")
+        # 이동 외의 작동 상태로 바꾸면 이동 중지
+        if status.status is not None and status.status != OPERATIONAL_STATUSES[MOVING]:
+            if robot_id == self.mission_robot:
+                self.end_mission()
+            elif slot in self.commanded:
+                self.stop_commanded(slot)
+
+    def start_commanded(self, slot, mission, received_at):
+        """현재 위치에서 waypoints를 차례로 지나는 이동 시작 (화면에서 시작한 같은 로봇의 이동은 대체)"""
+        robot_id = mission.robot_id
+        if robot_id == self.mission_robot:
+            self.end_mission()
+        registry_slot = self.registry.slot(robot_id)
+        if self.registry.status[registry_slot] in (CHARGING, ERROR):
+            self.log(f"명령 무시: {robot_id} {OPERATIONAL_STATUSES[self.registry.status[registry_slot]]} 상태")
+            return
+
+        engine = self.fleet_engine
+        if engine.placed[slot]:
+            start = tuple(engine.positions[slot].tolist())
+        else:
+            start = (float(self.registry.x[registry_slot]), float(self.registry.y[registry_slot]))
+        route = [start] + list(mission.waypoints)
+        if self.path_planner:
+            from path_planner import PlanningError
+
+            try:
+                route = self.path_planner.plan_route(route)
+            except PlanningError as e:
+                self.log(f"명령 경로 계획 실패: {robot_id}: {e}")
+                return
+        if len(route) > 2:
+            engine.start_route(robot_id, route, mission.speed)
+        else:
+            engine.start_mission(robot_id, start[0], start[1], route[1][0], route[1][1], mission.speed)
+
+        self.position_gate.reset(robot_id)
+        if self.publish_controller:
+            self.publish_controller.reset(f"robot/{robot_id}/position")
+        self.registry.update(robot_id, operational_status=OPERATIONAL_STATUSES[MOVING])
+        self.commanded[slot] = [robot_id, mission.then, received_at]
+        self.log(f"명령 이동 시작: {robot_id} (경유점 {len(route) - 1}개, {mission.speed} m/s)")
+
+    def step_commanded(self, dt):
+        """명령으로 이동 중인 로봇의 현재 위치를 발송하고 (도착점은 항상 발송) dt초만큼 일괄 이동"""
+        engine = self.fleet_engine
+        encoder = self.telemetry_encoder
+        timers = self.stage_timers
+        arrived = []
+        for slot, entry in list(self.commanded.items()):
+            robot_id, then, received_at = entry
+            if robot_id == self.mission_robot:
+                # 화면에서 같은 로봇의 이동을 새로 시작함
+                del self.commanded[slot]
+                continue
+            done = not engine.moving[slot]
+            x, y = engine.positions[slot].tolist()
+            heading = float(engine.headings[slot])
+            topic = f"robot/{robot_id}/position"
+            with timers['build'].time():
+                values = {'x': x, 'y': y, 'heading': heading}
+                should_publish = (self.transport and self.publish_controller.admit(topic, dt, force=done)
+                                  and self.position_gate.should_publish(robot_id, values, force=done))
+            if should_publish:
+                with timers['encode'].time():
+                    payload = encoder.position(robot_id, x, y, heading)
+                with timers['publish'].time():
+                    sent = self.publish(topic, payload, key=topic)
+                if sent and received_at is not None:
+                    self.command_latency.observe(self.command_router.clock() - received_at)
+                    entry[2] = None
+            if done:
+                arrived.append(slot)
+
+        for slot in arrived:
+            robot_id, then, _ = self.commanded.pop(slot)
+            x, y = engine.positions[slot].tolist()
+            self.registry.update(robot_id, x=x, y=y, heading=float(engine.headings[slot]), operational_status=then)
+            self.log(f"명령 이동 완료: {robot_id} ({x:.2f}, {y:.2f}) -> {then}")
+
+        # 화면에서 시작한 이동이 있으면 그 틱에서 전체 로봇의 근접 검사를 함
+        if not self.mission_task:
+            with timers['proximity'].time():
+                events = self.proximity_monitor.check()
+            if events and self.transport:
+                self.proximity_monitor.publish(self.publish, events)
+                for event in events:
+                    self.log(f"근접 경고: {event}")
+
+        if self.commanded:
+            engine.step(dt, slots=np.fromiter(self.commanded, dtype=np.int64, count=len(self.commanded)))
+
+    def stop_commanded(self, slot):
+        """명령 이동을 현재 위치에서 중지하고 위치를 레지스트리에 저장"""
+        robot_id, _, _ = self.commanded.pop(slot)
+        engine = self.fleet_engine
+        engine.stop_mission(robot_id)
+        x, y = engine.positions[slot].tolist()
+        self.registry.update(robot_id, x=x, y=y, heading=float(engine.headings[slot]))
+        self.log(f"명령 이동 중지 - {robot_id} 위치 저장됨: X={x:.2f}, Y={y:.2f}")
+
+    def shutdown(self):
+        self.stop_mission()
+        self.scheduler.stop()
+        self.stop_recording()
+        if self.transport:
+            self.transport.disconnect()
+
+
+def add_metrics_argument(parser):
+    """지표 파일 내보내기 옵션 (지정하지 않으면 파일을 쓰지 않음)"""
+    parser.add_argument("--metrics-file", metavar="PATH", nargs="?", const=METRICS_FILE,
+                        help=f"지표를 Prometheus 텍스트 파일로 주기적으로 저장 (경로 생략 시 {METRICS_FILE})")
+
+
+def _point(text):
+    x, y = text.split(',')
+    return float(x), float(y)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GUI 없이 로봇 한 대의 이동을 시뮬레이션하고 발송")
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default="paho")
+    parser.add_argument("--broker", default="localhost:1883", help="paho 백엔드의 브로커 host:port")
+    parser.add_argument("--robot", default=DEFAULT_ROBOT_IDS[0], help="로봇 ID")
+    parser.add_argument("--start", type=_point, default=(0.0, 0.0), help="시작점 x,y")
+    parser.add_argument("--end", type=_point, default=(100.0, 50.0), help="도착점 x,y")
+    parser.add_argument("--waypoints", type=_point, nargs="*", default=[], help="경유점 x,y ...")
+    parser.add_argument("--speed", type=float, default=1.0, help="속도 (m/s)")
+    parser.add_argument("--interval", type=float, default=0.5, help="위치 발송 주기 (초)")
+    parser.add_argument("--status-interval", type=float, default=0.0, help="상태 발송 주기 (초, 0 = 발송 안 함)")
+    parser.add_argument("--binary", action="store_true", help="바이너리 페이로드 사용")
+    parser.add_argument("--output", metavar="PATH", help="--transport file의 기록 파일")
+    parser.add_argument("--map", metavar="PATH", help="점유 격자 지도 파일 (장애물을 돌아가는 경로로 이동)")
+    add_metrics_argument(parser)
+    args = parser.parse_args(argv)
+
+    core = SimulatorCore(robot_ids=[args.robot], metrics_file=args.metrics_file)
+    if args.map:
+        try:
+            core.load_map(args.map)
+        except (OSError, ValueError) as e:
+            print(f"지도 오류: {args.map}: {e}", file=sys.stderr)
+            core.shutdown()
+            return 1
+    if args.binary:
+        core.set_binary_payload(True)
+
+    connected = []
+    core.on_connect = connected.append
+    try:
+        if args.transport == "paho":
+            host, _, port = args.broker.partition(':')
+            core.connect_mqtt(host, int(port or 1883))
+        else:
+            options = {"path": args.output} if args.transport == "file" else {}
+            core.connect(create_transport(args.transport, **options))
+            connected.append(0)
+    except (OSError, TypeError) as e:
+        print(f"연결 오류: {e}", file=sys.stderr)
+        core.shutdown()
+        return 1
+
+    def drain_logs():
+        for sink in (core.log_sink, core.status_log_sink):
+            lines = sink.drain(1000)
+            if lines:
+                sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+
+    try:
+        while not connected:
+            time.sleep(0.05)
+            drain_logs()
+        if connected[0] != 0:
+            return 1
+        if not core.start_mission(args.robot, args.start, args.end, args.speed, args.interval, args.waypoints):
+            return 1
+        if args.status_interval > 0:
+            core.start_status(args.robot, args.status_interval)
+        while core.is_running:
+            time.sleep(0.1)
+            drain_logs()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        core.shutdown()
+        drain_logs()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,708 @@
+"""로봇 위치 시뮬레이터 화면 (tkinter)
+
+시뮬레이션, 인코딩, 발송은 모두 simulator_core.SimulatorCore에 있고 이 모듈은 입력과 표시만 담당합니다.
+코어는 스케줄러 / MQTT 스레드에서 on_* 콜백을 부르므로 root.after로 UI 스레드에 넘겨서 위젯을 바꿉니다.
+"""
+import os
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from datetime import datetime
+
+from fleet_map import MAP_FPS, STATUS_COLORS, FleetMap
+from robot_enums import ROLES, OPERATIONAL_STATUSES
+from simulator_core import LOW_BATTERY_THRESHOLD, SimulatorCore, add_metrics_argument
+
+# 로그 위젯 갱신 설정
+LOG_FLUSH_INTERVAL_MS = 100   # 위젯 갱신 주기 (초당 최대 10회)
+LOG_BATCH_SIZE = 500          # 한 번 갱신할 때 옮기는 최대 줄 수
+LOG_MAX_LINES = 1000          # 위젯에 남겨 둘 최대 줄 수
+
+# 프로파일링 버튼을 눌렀을 때 스택을 수집하는 시간 (초)
+PROFILE_WINDOW = 10.0
+
+
+class RobotSimulator:
+    def __init__(self, root, core=None):
+        self.root = root
+        self.root.title("로봇 위치 시뮬레이터")
+        self.root.geometry("800x700")
+
+        # 시뮬레이션 코어 (스케줄러, 레지스트리, 플릿 엔진, 발송)
+        self.core = core or SimulatorCore()
+        self.core.on_connect = lambda rc: self.root.after(0, self.on_mqtt_connect, rc)
+        self.core.on_disconnect = lambda rc: self.root.after(0, self.on_mqtt_disconnect, rc)
+        self.core.on_position = lambda *args: self.root.after(0, self.update_ui, *args)
+        self.core.on_mission_end = lambda robot_id: self.root.after(0, self.on_mission_end, robot_id)
+        self.core.on_status = lambda *args: self.root.after(0, self.update_status_count, *args)
+        self.core.on_battery = lambda: self.root.after(0, self.refresh_battery_ui)
+
+        self.setup_ui()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_logs)
+        # 창을 닫으면 기록 파일을 닫고 브로커 연결을 끊은 뒤 종료
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """지도 갱신을 멈추고 코어를 정리 (미션 / 스케줄러 정지, 기록 파일과 색인 저장, 연결 해제)한 뒤 창을 닫음"""
+        self.fleet_map.stop()
+        # 정리하는 동안 다른 스레드에서 오는 코어 알림은 받지 않음 (닫힌 창에 after 호출 방지)
+        for name in ('on_connect', 'on_disconnect', 'on_position', 'on_mission_end', 'on_status', 'on_battery'):
+            setattr(self.core, name, None)
+        self.core.shutdown()
+        self.root.destroy()
+
+    def refresh_battery_ui(self):
+        """선택한 로봇의 배터리/작동 상태 표시를 레지스트리 값으로 맞춤"""
+        registry = self.core.registry
+        with self.core.stage_timers['ui'].time():
+            robot_id = self.status_robot_id_combobox.get()
+            if robot_id in registry:
+                state = registry.get(robot_id)
+                if int(float(self.battery_scale.get())) != state['battery']:
+                    self.battery_scale.set(state['battery'])
+                if self.operational_status_combobox.get() != state['operational_status']:
+                    self.operational_status_combobox.set(state['operational_status'])
+            self.update_low_battery_count()
+
+    def setup_ui(self):
+        # 탭 컨트롤 생성
+        notebook = ttk.Notebook(self.root)
+        notebook.pack(fill='both', expand=True, padx=10, pady=10)
+
+        # 탭 1: 위치 시뮬레이션
+        position_tab = ttk.Frame(notebook)
+        notebook.add(position_tab, text="위치 시뮬레이션")
+
+        # 탭 2: 상태 정보
+        status_tab = ttk.Frame(notebook)
+        notebook.add(status_tab, text="상태 정보")
+
+        # 탭 3: 플릿 지도
+        map_tab = ttk.Frame(notebook)
+        notebook.add(map_tab, text="플릿 지도")
+
+        # 위치 시뮬레이션 탭 UI 설정
+        self.setup_position_tab(position_tab)
+
+        # 상태 정보 탭 UI 설정
+        self.setup_status_tab(status_tab)
+
+        # 플릿 지도 탭 UI 설정 (지도 탭이 열려 있을 때만 그림)
+        self.setup_map_tab(map_tab, lambda: notebook.select() == str(map_tab))
+
+    def setup_position_tab(self, parent):
+        # 메인 프레임
+        main_frame = ttk.Frame(parent, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # MQTT 브로커 설정
+        mqtt_frame = ttk.LabelFrame(main_frame, text="MQTT 브로커 설정", padding="10")
+        mqtt_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(mqtt_frame, text="브로커 주소:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.broker_entry = ttk.Entry(mqtt_frame, width=30)
+        self.broker_entry.insert(0, "localhost")
+        self.broker_entry.grid(row=0, column=1, padx=5)
+
+        ttk.Label(mqtt_frame, text="포트:").grid(row=0, column=2, sticky=tk.W, padx=5)
+        self.port_entry = ttk.Entry(mqtt_frame, width=10)
+        self.port_entry.insert(0, "1883")
+        self.port_entry.grid(row=0, column=3, padx=5)
+
+        self.connect_btn = ttk.Button(mqtt_frame, text="브로커 연결", command=self.connect_mqtt)
+        self.connect_btn.grid(row=0, column=4, padx=5)
+
+        self.connection_status = ttk.Label(mqtt_frame, text="● 연결 안됨", foreground="red")
+        self.connection_status.grid(row=0, column=5, padx=5)
+
+        # 바이너리 페이로드 (대역폭이 좁은 환경용, 수신 측은 binary_codec.decode 사용)
+        self.binary_payload_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(mqtt_frame, text="바이너리 페이로드", variable=self.binary_payload_var,
+                        command=self.on_payload_format_changed).grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5)
+
+        # 발송 메시지 기록 (python telemetry_recorder.py <파일>로 재생)
+        self.record_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(mqtt_frame, text="발송 메시지 기록", variable=self.record_var,
+                        command=self.on_record_changed).grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=5)
+
+        # 발송 제어 상태 (발송 속도, 클라이언트 대기 메시지, 역압으로 건너뛰거나 보류한 횟수)
+        ttk.Label(mqtt_frame, text="발송 제어:").grid(row=2, column=0, sticky=tk.W, padx=5)
+        self.publish_control_label = ttk.Label(mqtt_frame, text="-")
+        self.publish_control_label.grid(row=2, column=1, columnspan=5, sticky=tk.W, padx=5)
+
+        # 샘플링 프로파일러 (PROFILE_WINDOW초 동안 스택을 모아 접힌 스택 파일로 저장)
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_check = ttk.Checkbutton(mqtt_frame, text=f"프로파일링 ({PROFILE_WINDOW:.0f}초)",
+                                             variable=self.profile_var, command=self.on_profile_changed)
+        self.profile_check.grid(row=1, column=4, columnspan=2, sticky=tk.W, padx=5)
+
+        # 로봇 설정 프레임
+        robot_frame = ttk.LabelFrame(main_frame, text="로봇 설정", padding="10")
+        robot_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        # 로봇 ID
+        ttk.Label(robot_frame, text="로봇 ID:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.robot_id_combobox = ttk.Combobox(robot_frame, width=18, values=self.core.registry.robot_ids, state='readonly')
+        self.robot_id_combobox.set("ROBOT-001")
+        self.robot_id_combobox.grid(row=0, column=1, padx=5, pady=5)
+        self.robot_id_combobox.bind('<<ComboboxSelected>>', self.on_robot_id_changed)
+
+        # 로봇 일괄 등록
+        self.register_count_entry = ttk.Entry(robot_frame, width=8)
+        self.register_count_entry.insert(0, "100")
+        self.register_count_entry.grid(row=0, column=2, padx=5, pady=5)
+        ttk.Button(robot_frame, text="로봇 일괄 등록", command=self.on_register_robots).grid(row=0, column=3, padx=5, pady=5)
+
+        # 시작점
+        ttk.Label(robot_frame, text="시작점 X:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.start_x_entry = ttk.Entry(robot_frame, width=20)
+        self.start_x_entry.insert(0, "0")
+        self.start_x_entry.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Label(robot_frame, text="시작점 Y:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.start_y_entry = ttk.Entry(robot_frame, width=20)
+        self.start_y_entry.insert(0, "0")
+        self.start_y_entry.grid(row=2, column=1, padx=5, pady=5)
+
+        # 도착점
+        ttk.Label(robot_frame, text="도착점 X:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.end_x_entry = ttk.Entry(robot_frame, width=20)
+        self.end_x_entry.insert(0, "100")
+        self.end_x_entry.grid(row=3, column=1, padx=5, pady=5)
+
+        ttk.Label(robot_frame, text="도착점 Y:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.end_y_entry = ttk.Entry(robot_frame, width=20)
+        self.end_y_entry.insert(0, "50")
+        self.end_y_entry.grid(row=4, column=1, padx=5, pady=5)
+
+        # 속도
+        ttk.Label(robot_frame, text="속도 (m/s):").grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
+        self.speed_entry = ttk.Entry(robot_frame, width=20)
+        self.speed_entry.insert(0, "1.0")
+        self.speed_entry.grid(row=5, column=1, padx=5, pady=5)
+
+        # 업데이트 주기
+        ttk.Label(robot_frame, text="업데이트 주기 (초):").grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+        self.update_interval_entry = ttk.Entry(robot_frame, width=20)
+        self.update_interval_entry.insert(0, "0.5")
+        self.update_interval_entry.grid(row=6, column=1, padx=5, pady=5)
+
+        # 경유점 (선택)
+        ttk.Label(robot_frame, text="경유점 (x,y; x,y ...):").grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
+        self.waypoints_entry = ttk.Entry(robot_frame, width=40)
+        self.waypoints_entry.grid(row=7, column=1, padx=5, pady=5)
+
+        # 점유 격자 지도 (불러오면 장애물을 돌아가는 경로로 이동)
+        ttk.Button(robot_frame, text="지도 불러오기", command=self.on_load_map).grid(row=8, column=0, sticky=tk.W, padx=5, pady=5)
+        self.map_label = ttk.Label(robot_frame, text="지도 없음 (직선 이동)")
+        self.map_label.grid(row=8, column=1, sticky=tk.W, padx=5, pady=5)
+
+        # 제어 버튼
+        control_frame = ttk.Frame(main_frame)
+        control_frame.grid(row=2, column=0, columnspan=2, pady=10)
+
+        self.start_btn = ttk.Button(control_frame, text="시뮬레이션 시작", command=self.start_simulation, state=tk.DISABLED)
+        self.start_btn.grid(row=0, column=0, padx=5)
+
+        self.stop_btn = ttk.Button(control_frame, text="시뮬레이션 정지", command=self.stop_simulation, state=tk.DISABLED)
+        self.stop_btn.grid(row=0, column=1, padx=5)
+
+        # 현재 상태
+        status_frame = ttk.LabelFrame(main_frame, text="현재 상태", padding="10")
+        status_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(status_frame, text="현재 위치:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.current_position_label = ttk.Label(status_frame, text="X: 0.0, Y: 0.0")
+        self.current_position_label.grid(row=0, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(status_frame, text="진행률:").grid(row=1, column=0, sticky=tk.W, padx=5)
+        self.progress_label = ttk.Label(status_frame, text="0%")
+        self.progress_label.grid(row=1, column=1, sticky=tk.W, padx=5)
+
+        self.progress_bar = ttk.Progressbar(status_frame, length=400, mode='determinate')
+        self.progress_bar.grid(row=2, column=0, columnspan=2, pady=5)
+
+        ttk.Label(status_frame, text="틱 지연:").grid(row=3, column=0, sticky=tk.W, padx=5)
+        self.tick_lateness_label = ttk.Label(status_frame, text="0.0 ms")
+        self.tick_lateness_label.grid(row=3, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(status_frame, text="억제 횟수:").grid(row=4, column=0, sticky=tk.W, padx=5)
+        self.position_suppressed_label = ttk.Label(status_frame, text="0")
+        self.position_suppressed_label.grid(row=4, column=1, sticky=tk.W, padx=5)
+
+        # 로그 영역
+        log_frame = ttk.LabelFrame(main_frame, text="메시지 로그", padding="10")
+        log_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=15, width=90, wrap=tk.WORD)
+        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # 로그 클리어 버튼
+        ttk.Button(log_frame, text="로그 지우기", command=self.clear_log).grid(row=1, column=0, pady=5)
+
+        self.log_dropped_label = ttk.Label(log_frame, text="버린 로그: 0줄")
+        self.log_dropped_label.grid(row=2, column=0, sticky=tk.W)
+
+        # Grid 가중치 설정
+        parent.columnconfigure(0, weight=1)
+        parent.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+
+    def setup_status_tab(self, parent):
+        # 메인 프레임
+        main_frame = ttk.Frame(parent, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # MQTT 연결 상태 표시
+        status_info_frame = ttk.LabelFrame(main_frame, text="MQTT 연결 상태", padding="10")
+        status_info_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(status_info_frame, text="상태 정보를 전송하려면 먼저 '위치 시뮬레이션' 탭에서 MQTT 브로커에 연결하세요.").grid(row=0, column=0, padx=5, pady=5)
+
+        # 로봇 상태 설정 프레임
+        robot_status_frame = ttk.LabelFrame(main_frame, text="로봇 상태 설정", padding="10")
+        robot_status_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        # 로봇 ID
+        ttk.Label(robot_status_frame, text="로봇 ID:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.status_robot_id_combobox = ttk.Combobox(robot_status_frame, width=27, values=self.core.registry.robot_ids,
+                                                     state='readonly')
+        self.status_robot_id_combobox.set("ROBOT-001")
+        self.status_robot_id_combobox.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
+        self.status_robot_id_combobox.bind('<<ComboboxSelected>>', self.on_status_robot_id_changed)
+
+        # 배터리 레벨
+        ttk.Label(robot_status_frame, text="배터리 레벨 (%):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        battery_frame = ttk.Frame(robot_status_frame)
+        battery_frame.grid(row=1, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
+
+        self.battery_scale = ttk.Scale(battery_frame, from_=0, to=100, orient=tk.HORIZONTAL, length=200)
+        self.battery_scale.set(80)
+        self.battery_scale.grid(row=0, column=0, padx=(0, 10))
+
+        self.battery_value_label = ttk.Label(battery_frame, text="80%")
+        self.battery_value_label.grid(row=0, column=1)
+
+        self.battery_scale.config(command=self.on_battery_changed)
+
+        # Role
+        ttk.Label(robot_status_frame, text="역할 (Role):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.role_combobox = ttk.Combobox(robot_status_frame, width=27, values=ROLES, state='readonly')
+        self.role_combobox.set("EMPTY")
+        self.role_combobox.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
+        self.role_combobox.bind('<<ComboboxSelected>>', self.on_role_changed)
+
+        # Operational Status
+        ttk.Label(robot_status_frame, text="작동 상태:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.operational_status_combobox = ttk.Combobox(robot_status_frame, width=27, values=OPERATIONAL_STATUSES,
+                                                        state='readonly')
+        self.operational_status_combobox.set("IDLE")
+        self.operational_status_combobox.grid(row=3, column=1, padx=5, pady=5, sticky=tk.W)
+        self.operational_status_combobox.bind('<<ComboboxSelected>>', self.on_operational_status_changed)
+
+        # 전송 주기
+        ttk.Label(robot_status_frame, text="전송 주기 (초):").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.status_interval_entry = ttk.Entry(robot_status_frame, width=30)
+        self.status_interval_entry.insert(0, "2.0")
+        self.status_interval_entry.grid(row=4, column=1, padx=5, pady=5, sticky=tk.W)
+
+        # 변경 시에만 전송 (값이 그대로면 하트비트 주기마다만 전송)
+        self.status_on_change_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(robot_status_frame, text="변경 시에만 전송", variable=self.status_on_change_var).grid(row=5, column=1, padx=5, pady=5, sticky=tk.W)
+
+        ttk.Label(robot_status_frame, text="최대 무전송 시간 (초):").grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+        self.status_heartbeat_entry = ttk.Entry(robot_status_frame, width=30)
+        self.status_heartbeat_entry.insert(0, "30")
+        self.status_heartbeat_entry.grid(row=6, column=1, padx=5, pady=5, sticky=tk.W)
+
+        # 제어 버튼
+        control_frame = ttk.Frame(main_frame)
+        control_frame.grid(row=2, column=0, columnspan=2, pady=10)
+
+        self.status_start_btn = ttk.Button(control_frame, text="상태 전송 시작", command=self.start_status_publishing, state=tk.DISABLED)
+        self.status_start_btn.grid(row=0, column=0, padx=5)
+
+        self.status_stop_btn = ttk.Button(control_frame, text="상태 전송 정지", command=self.stop_status_publishing, state=tk.DISABLED)
+        self.status_stop_btn.grid(row=0, column=1, padx=5)
+
+        # 현재 상태 표시
+        current_status_frame = ttk.LabelFrame(main_frame, text="현재 전송 상태", padding="10")
+        current_status_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
+
+        ttk.Label(current_status_frame, text="전송 상태:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        self.status_sending_label = ttk.Label(current_status_frame, text="정지", foreground="red")
+        self.status_sending_label.grid(row=0, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(current_status_frame, text="전송 횟수:").grid(row=1, column=0, sticky=tk.W, padx=5)
+        self.status_count_label = ttk.Label(current_status_frame, text="0")
+        self.status_count_label.grid(row=1, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(current_status_frame, text="틱 지연:").grid(row=2, column=0, sticky=tk.W, padx=5)
+        self.status_lateness_label = ttk.Label(current_status_frame, text="0.0 ms")
+        self.status_lateness_label.grid(row=2, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(current_status_frame, text="억제 횟수:").grid(row=3, column=0, sticky=tk.W, padx=5)
+        self.status_suppressed_label = ttk.Label(current_status_frame, text="0")
+        self.status_suppressed_label.grid(row=3, column=1, sticky=tk.W, padx=5)
+
+        ttk.Label(current_status_frame, text=f"배터리 {LOW_BATTERY_THRESHOLD}% 미만:").grid(row=4, column=0, sticky=tk.W, padx=5)
+        self.low_battery_label = ttk.Label(current_status_frame, text="0대")
+        self.low_battery_label.grid(row=4, column=1, sticky=tk.W, padx=5)
+
+        # 로그 영역
+        log_frame = ttk.LabelFrame(main_frame, text="메시지 로그", padding="10")
+        log_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
+        self.status_log_text = scrolledtext.ScrolledText(log_frame, height=15, width=90, wrap=tk.WORD)
+        self.status_log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # 로그 클리어 버튼
+        ttk.Button(log_frame, text="로그 지우기", command=self.clear_status_log).grid(row=1, column=0, pady=5)
+
+        self.status_log_dropped_label = ttk.Label(log_frame, text="버린 로그: 0줄")
+        self.status_log_dropped_label.grid(row=2, column=0, sticky=tk.W)
+
+        # Grid 가중치 설정
+        parent.columnconfigure(0, weight=1)
+        parent.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+
+    def setup_map_tab(self, parent, is_visible):
+        parent.columnconfigure(0, weight=1)
+        parent.rowconfigure(1, weight=1)
+
+        # 작동 상태 색 범례
+        legend_frame = ttk.Frame(parent, padding="5")
+        legend_frame.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        for column, status in enumerate(OPERATIONAL_STATUSES):
+            tk.Label(legend_frame, text=f"■ {status}", fg=STATUS_COLORS[status]).grid(row=0, column=column, padx=3)
+
+        # 로봇 위치 / 방향 (삼각형 꼭짓점이 진행 방향) / 작동 상태 색
+        self.map_canvas = tk.Canvas(parent, background="white", highlightthickness=0)
+        self.map_canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # 프레임 시간 (스냅샷 + 바뀐 항목 갱신)
+        self.map_frame_label = ttk.Label(parent, text="-")
+        self.map_frame_label.grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+
+        self.fleet_map = FleetMap(self.map_canvas, self.core.fleet_snapshot, is_visible=is_visible,
+                                  on_frame=self.on_map_frame)
+        self.fleet_map.start()
+
+    def on_map_frame(self, elapsed, updated, robots):
+        """지도 프레임 시간 표시 (최근 프레임 기준)"""
+        self.core.stage_timers['ui'].observe(elapsed)
+        frame_times = sorted(self.fleet_map.frame_times)
+        median = frame_times[len(frame_times) // 2]
+        self.map_frame_label.config(
+            text=f"프레임 {elapsed * 1000:.1f} ms  (중앙값 {median * 1000:.1f} ms, 최대 {frame_times[-1] * 1000:.1f} ms)  "
+                 f"갱신 {updated} / {robots}대  {MAP_FPS} FPS 고정")
+
+    def connect_mqtt(self):
+        try:
+            broker = self.broker_entry.get()
+            port = int(self.port_entry.get())
+            self.core.connect_mqtt(broker, port)
+
+        except Exception as e:
+            messagebox.showerror("연결 오류", f"MQTT 브로커 연결 실패:\n{str(e)}")
+            self.log_message(f"연결 오류: {str(e)}")
+
+    def on_profile_changed(self):
+        """프로파일링 시작 (PROFILE_WINDOW초 후 자동 종료, 파일 저장)"""
+        profiler = self.core.profiler
+        if not self.profile_var.get() or profiler.running:
+            return
+        path = datetime.now().strftime("profile_%Y%m%d_%H%M%S.folded")
+        self.profile_check.config(state=tk.DISABLED)
+        self.log_message(f"프로파일링 시작 ({PROFILE_WINDOW:.0f}초)")
+        profiler.profile_window(PROFILE_WINDOW, path,
+                                on_done=lambda path, samples: self.root.after(0, self.on_profile_done, path, samples))
+
+    def on_profile_done(self, path, samples):
+        self.profile_var.set(False)
+        self.profile_check.config(state=tk.NORMAL)
+        self.log_message(f"프로파일 저장: {path} (샘플 {samples}개, flamegraph.pl로 변환)")
+
+    def update_publish_control_label(self):
+        controller = self.core.publish_controller
+        if controller:
+            self.publish_control_label.config(
+                text=f"속도 {controller.rate * 100:.0f}%  대기 {controller.pending}  "
+                     f"억제 {controller.throttle_events}  (합침 {controller.coalesced})")
+
+    def on_record_changed(self):
+        """발송 메시지 기록 켜기/끄기"""
+        if self.record_var.get():
+            path = datetime.now().strftime("telemetry_%Y%m%d_%H%M%S.rec")
+            try:
+                self.core.start_recording(path)
+            except OSError as e:
+                self.record_var.set(False)
+                messagebox.showerror("기록 오류", f"기록 파일을 만들 수 없습니다:\n{str(e)}")
+        else:
+            self.core.stop_recording()
+
+    def on_load_map(self):
+        """점유 격자 지도 파일 선택"""
+        path = filedialog.askopenfilename(title="지도 파일", filetypes=[("지도 파일", "*.map *.txt"), ("모든 파일", "*")])
+        if not path:
+            return
+        try:
+            grid = self.core.load_map(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("지도 오류", f"지도 파일을 읽을 수 없습니다:\n{str(e)}")
+            return
+        self.map_label.config(text=f"{os.path.basename(path)} ({grid.width}x{grid.height}칸)")
+        # 플릿 지도는 격자 지도 범위로 맞춤
+        x0, y0 = grid.origin
+        self.fleet_map.set_bounds((x0, y0, x0 + grid.width * grid.resolution, y0 + grid.height * grid.resolution))
+
+    def on_mqtt_connect(self, rc):
+        if rc == 0:
+            self.connection_status.config(text="● 연결됨", foreground="green")
+            self.start_btn.config(state=tk.NORMAL)
+            self.status_start_btn.config(state=tk.NORMAL)
+            self.connect_btn.config(state=tk.DISABLED)
+        else:
+            self.connection_status.config(text="● 연결 실패", foreground="red")
+
+    def on_mqtt_disconnect(self, rc):
+        self.connection_status.config(text="● 연결 안됨", foreground="red")
+        self.start_btn.config(state=tk.DISABLED)
+        self.status_start_btn.config(state=tk.DISABLED)
+        self.connect_btn.config(state=tk.NORMAL)
+
+    def on_robot_id_changed(self, event):
+        """위치 시뮬레이션 탭에서 로봇 ID 변경 시 호출"""
+        # 선택된 로봇의 저장된 위치 값으로 UI 업데이트
+        robot_id = self.robot_id_combobox.get()
+        position = self.core.registry.get(robot_id)
+
+        # 시작점 업데이트
+        self.set_start_point(position['x'], position['y'])
+
+        self.log_message(f"로봇 {robot_id} 선택됨 - 저장된 위치: X={position['x']:.2f}, Y={position['y']:.2f}")
+
+    def on_status_robot_id_changed(self, event):
+        """상태 정보 탭에서 로봇 ID 변경 시 호출"""
+        # 선택된 로봇의 저장된 상태 값으로 UI 업데이트
+        robot_id = self.status_robot_id_combobox.get()
+        state = self.core.registry.get(robot_id)
+
+        # 배터리, role, operational_status 업데이트
+        self.battery_scale.set(state['battery'])
+        self.battery_value_label.config(text=f"{state['battery']}%")
+        self.role_combobox.set(state['role'])
+        self.operational_status_combobox.set(state['operational_status'])
+
+        self.status_log_message(f"로봇 {robot_id} 선택됨 - 배터리: {state['battery']}%, 역할: {state['role']}, 상태: {state['operational_status']}")
+
+    def on_battery_changed(self, value):
+        """배터리 레벨 변경 시 호출"""
+        battery_level = int(float(value))
+        self.battery_value_label.config(text=f"{battery_level}%")
+
+        # 현재 로봇의 배터리 상태 저장 (배터리 모델이 줄인 소수점 아래 값은 슬라이더를 움직였을 때만 덮어씀)
+        registry = self.core.registry
+        robot_id = self.status_robot_id_combobox.get()
+        if robot_id in registry and registry.get(robot_id)['battery'] != battery_level:
+            registry.update(robot_id, battery=battery_level)
+            self.update_low_battery_count()
+
+    def on_role_changed(self, event):
+        """역할 변경 시 호출"""
+        robot_id = self.status_robot_id_combobox.get()
+        self.core.registry.update(robot_id, role=self.role_combobox.get())
+
+    def on_operational_status_changed(self, event):
+        """작동 상태 변경 시 호출"""
+        robot_id = self.status_robot_id_combobox.get()
+        self.core.registry.update(robot_id, operational_status=self.operational_status_combobox.get())
+
+    def on_register_robots(self):
+        """입력한 수만큼 로봇을 새로 등록 (ROBOT-004, ROBOT-005, ...)"""
+        try:
+            count = int(self.register_count_entry.get())
+        except ValueError:
+            messagebox.showerror("입력 오류", "등록할 로봇 수를 숫자로 입력해주세요.")
+            return
+        if count <= 0:
+            return
+        self.register_robots(self.core.next_robot_ids(count))
+
+    def register_robots(self, robot_ids):
+        """코어에 로봇을 추가하고 로봇 ID 목록 갱신"""
+        self.core.register_robots(robot_ids)
+        robot_ids = self.core.registry.robot_ids
+        self.robot_id_combobox.config(values=robot_ids)
+        self.status_robot_id_combobox.config(values=robot_ids)
+        self.update_low_battery_count()
+
+    def update_low_battery_count(self):
+        self.low_battery_label.config(text=f"{self.core.low_battery_count()}대")
+
+    def on_payload_format_changed(self):
+        """페이로드 형식 (JSON / 바이너리) 변경 시 호출"""
+        self.core.set_binary_payload(self.binary_payload_var.get())
+
+    def start_simulation(self):
+        try:
+            robot_id = self.robot_id_combobox.get()
+            start_x = float(self.start_x_entry.get())
+            start_y = float(self.start_y_entry.get())
+            end_x = float(self.end_x_entry.get())
+            end_y = float(self.end_y_entry.get())
+            speed = float(self.speed_entry.get())
+            update_interval = float(self.update_interval_entry.get())
+            waypoints = self.parse_waypoints(self.waypoints_entry.get())
+
+            if not robot_id:
+                messagebox.showwarning("입력 오류", "로봇 ID를 입력해주세요.")
+                return
+
+            if update_interval <= 0:
+                messagebox.showerror("입력 오류", "업데이트 주기는 0보다 커야 합니다.")
+                return
+
+            if self.core.start_mission(robot_id, (start_x, start_y), (end_x, end_y), speed, update_interval,
+                                       waypoints):
+                self.start_btn.config(state=tk.DISABLED)
+                self.stop_btn.config(state=tk.NORMAL)
+
+        except ValueError as e:
+            messagebox.showerror("입력 오류", "숫자 값을 올바르게 입력해주세요.")
+
+    def parse_waypoints(self, text):
+        """'x,y; x,y' 형식의 경유점 문자열을 [(x, y), ...]로 변환"""
+        waypoints = []
+        for item in text.split(';'):
+            if not item.strip():
+                continue
+            x, y = item.split(',')
+            waypoints.append((float(x), float(y)))
+        return waypoints
+
+    def update_ui(self, robot_id, x, y, progress, lateness=0.0, suppressed=0):
+        with self.core.stage_timers['ui'].time():
+            self.current_position_label.config(text=f"X: {x:.2f}, Y: {y:.2f}")
+            self.progress_bar['value'] = progress
+            self.progress_label.config(text=f"{progress:.1f}%")
+            self.tick_lateness_label.config(text=f"{lateness * 1000:.1f} ms")
+            self.position_suppressed_label.config(text=str(suppressed))
+            self.update_publish_control_label()
+
+    def stop_simulation(self):
+        stopped = self.core.stop_mission()
+        self.simulation_stopped()
+        if stopped:
+            # 현재 위치를 시작점으로 업데이트
+            robot_id, x, y = stopped
+            self.set_start_point(x, y)
+
+    def on_mission_end(self, robot_id):
+        """도착 / 배터리 부족으로 코어가 이동을 끝냈을 때 (위치는 코어가 레지스트리에 저장함)"""
+        self.simulation_stopped()
+        position = self.core.registry.get(robot_id)
+        self.set_start_point(position['x'], position['y'])
+
+    def simulation_stopped(self):
+        self.start_btn.config(state=tk.NORMAL)
+        self.stop_btn.config(state=tk.DISABLED)
+
+    def set_start_point(self, x, y):
+        self.start_x_entry.delete(0, tk.END)
+        self.start_x_entry.insert(0, f"{x:.2f}")
+        self.start_y_entry.delete(0, tk.END)
+        self.start_y_entry.insert(0, f"{y:.2f}")
+
+    def log_message(self, message):
+        self.core.log(message)
+
+    def flush_logs(self):
+        """대기 중인 로그를 위젯에 한 번에 반영 (UI 스레드에서 주기적으로 실행)"""
+        with self.core.stage_timers['ui'].time():
+            self.flush_log_widget(self.core.log_sink, self.log_text, self.log_dropped_label)
+            self.flush_log_widget(self.core.status_log_sink, self.status_log_text, self.status_log_dropped_label)
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_logs)
+
+    def flush_log_widget(self, sink, text_widget, dropped_label):
+        lines = sink.drain(LOG_BATCH_SIZE)
+        if lines:
+            text_widget.insert(tk.END, "".join(lines))
+
+            # 오래된 줄 정리
+            line_count = int(text_widget.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                text_widget.delete('1.0', f"{line_count - LOG_MAX_LINES + 1}.0")
+            text_widget.see(tk.END)
+
+        dropped_label.config(text=f"버린 로그: {sink.dropped}줄")
+
+    def clear_log(self):
+        self.log_text.delete(1.0, tk.END)
+
+    def start_status_publishing(self):
+        try:
+            robot_id = self.status_robot_id_combobox.get()
+            interval = float(self.status_interval_entry.get())
+            heartbeat = float(self.status_heartbeat_entry.get())
+
+            if not robot_id:
+                messagebox.showwarning("입력 오류", "로봇 ID를 입력해주세요.")
+                return
+
+            if not self.core.transport:
+                messagebox.showwarning("연결 오류", "먼저 MQTT 브로커에 연결해주세요.")
+                return
+
+            self.status_start_btn.config(state=tk.DISABLED)
+            self.status_stop_btn.config(state=tk.NORMAL)
+            self.status_sending_label.config(text="전송 중", foreground="green")
+
+            # 변경 시에만 전송하더라도 heartbeat초마다 한 번은 전송
+            self.core.start_status(robot_id, interval, on_change=self.status_on_change_var.get(), heartbeat=heartbeat)
+
+        except ValueError:
+            messagebox.showerror("입력 오류", "전송 주기와 최대 무전송 시간은 숫자로 입력해주세요.")
+
+    def update_status_count(self, count, lateness=0.0, suppressed=0):
+        with self.core.stage_timers['ui'].time():
+            self.status_count_label.config(text=str(count))
+            self.status_lateness_label.config(text=f"{lateness * 1000:.1f} ms")
+            self.status_suppressed_label.config(text=str(suppressed))
+            self.update_publish_control_label()
+
+    def stop_status_publishing(self):
+        self.status_start_btn.config(state=tk.NORMAL)
+        self.status_stop_btn.config(state=tk.DISABLED)
+        self.status_sending_label.config(text="정지", foreground="red")
+
+        # 현재 로봇의 상태를 레지스트리에 저장
+        robot_id = self.status_robot_id_combobox.get()
+        self.core.registry.update(robot_id, role=self.role_combobox.get(),
+                                  operational_status=self.operational_status_combobox.get())
+        self.core.stop_status(robot_id)
+
+    def status_log_message(self, message):
+        self.core.status_log(message)
+
+    def clear_status_log(self):
+        self.status_log_text.delete(1.0, tk.END)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="로봇 위치 시뮬레이터 GUI")
+    add_metrics_argument(parser)
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    app = RobotSimulator(root, core=SimulatorCore(metrics_file=args.metrics_file))
+    root.mainloop()
@@ -0,0 +1,260 @@
+"""균일 격자 공간 해시 (근접 검색, 최근접 로봇, 충돌/근접 경고)"""
+import json
+import math
+import time
+
+import numpy as np
+
+# 격자 좌표 (cx, cy)를 하나의 정수 키로 묶을 때 사용하는 값
+_KEY_OFFSET = 1 << 20
+_KEY_STRIDE = 1 << 21
+
+PROXIMITY_TOPIC = "fleet/proximity"
+
+
+def _cell_keys(cells):
+    return (cells[:, 0] + _KEY_OFFSET) * _KEY_STRIDE + (cells[:, 1] + _KEY_OFFSET)
+
+
+class SpatialHash:
+    def __init__(self, cell_size=2.0, capacity=64):
+        self.cell_size = float(cell_size)
+        # 격자 키 -> 슬롯 집합 (로봇이 다른 칸으로 옮겨 갈 때만 갱신)
+        self.cells = {}
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.keys = np.full(capacity, -1, dtype=np.int64)
+
+    def _grow(self, size):
+        capacity = len(self.keys)
+        while capacity < size:
+            capacity *= 2
+        positions = np.zeros((capacity, 2), dtype=np.float64)
+        positions[:len(self.positions)] = self.positions
+        keys = np.full(capacity, -1, dtype=np.int64)
+        keys[:len(self.keys)] = self.keys
+        self.positions = positions
+        self.keys = keys
+
+    def _cells(self, positions):
+        return np.floor(positions / self.cell_size).astype(np.int64)
+
+    def update(self, slots, positions):
+        """slots 로봇의 위치를 positions (N, 2)로 갱신"""
+        slots = np.atleast_1d(np.asarray(slots, dtype=np.int64))
+        if slots.size == 0:
+            return
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if slots.max() >= len(self.keys):
+            self._grow(int(slots.max()) + 1)
+
+        self.positions[slots] = positions
+        new_keys = _cell_keys(self._cells(positions))
+        old_keys = self.keys[slots]
+
+        # 칸이 바뀐 로봇만 격자 집합을 옮김
+        changed = np.flatnonzero(new_keys != old_keys)
+        for slot, old_key, new_key in zip(slots[changed].tolist(), old_keys[changed].tolist(),
+                                          new_keys[changed].tolist()):
+            if old_key >= 0:
+                members = self.cells[old_key]
+                members.discard(slot)
+                if not members:
+                    del self.cells[old_key]
+            self.cells.setdefault(new_key, set()).add(slot)
+        self.keys[slots] = new_keys
+
+    def remove(self, slot):
+        key = int(self.keys[slot])
+        if key >= 0:
+            members = self.cells[key]
+            members.discard(slot)
+            if not members:
+                del self.cells[key]
+            self.keys[slot] = -1
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _ring(self, cx, cy, ring):
+        """(cx, cy)에서 ring칸 떨어진 테두리 칸들의 슬롯"""
+        if ring == 0:
+            offsets = [(0, 0)]
+        else:
+            offsets = [(dx, dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+            offsets += [(dx, dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+        found = []
+        for dx, dy in offsets:
+            members = self.cells.get((cx + dx + _KEY_OFFSET) * _KEY_STRIDE + (cy + dy + _KEY_OFFSET))
+            if members:
+                found.extend(members)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """(x, y)에서 radius 이내의 슬롯 배열 (거리순 아님)"""
+        cx, cy = self._cell(x, y)
+        reach = int(math.ceil(radius / self.cell_size))
+        candidates = []
+        for ring in range(reach + 1):
+            candidates.extend(self._ring(cx, cy, ring))
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+
+        candidates = np.asarray(candidates, dtype=np.int64)
+        deltas = self.positions[candidates] - (x, y)
+        return candidates[np.einsum('ij,ij->i', deltas, deltas) <= radius * radius]
+
+    def nearest(self, x, y, exclude=None, max_radius=None):
+        """(x, y)에서 가장 가까운 슬롯과 거리 (없으면 (None, inf))"""
+        if not self.cells:
+            return None, math.inf
+
+        cx, cy = self._cell(x, y)
+        max_ring = None if max_radius is None else int(math.ceil(max_radius / self.cell_size))
+        best_slot, best_distance = None, math.inf
+        ring = 0
+        while max_ring is None or ring <= max_ring:
+            # 빈 칸이 많으면 테두리를 계속 넓히는 것보다 전체를 한 번에 계산하는 편이 빠름
+            if (2 * ring + 1) ** 2 > 4 * len(self.cells):
+                best_slot, best_distance = self._nearest_all(x, y, exclude)
+                break
+
+            for slot in self._ring(cx, cy, ring):
+                if slot == exclude:
+                    continue
+                px, py = self.positions[slot]
+                distance = math.hypot(px - x, py - y)
+                if distance < best_distance:
+                    best_slot, best_distance = slot, distance
+
+            # ring칸 바깥의 점은 최소 ring * cell_size 이상 떨어져 있음
+            if best_distance <= ring * self.cell_size:
+                break
+            ring += 1
+
+        if best_slot is None or (max_radius is not None and best_distance > max_radius):
+            return None, math.inf
+        return best_slot, best_distance
+
+    def _nearest_all(self, x, y, exclude):
+        slots = np.flatnonzero(self.keys >= 0)
+        if exclude is not None:
+            slots = slots[slots != exclude]
+        if slots.size == 0:
+            return None, math.inf
+        deltas = self.positions[slots] - (x, y)
+        distances = np.hypot(deltas[:, 0], deltas[:, 1])
+        index = int(np.argmin(distances))
+        return int(slots[index]), float(distances[index])
+
+    def close_pairs(self, radius):
+        """거리가 radius 이하인 슬롯 쌍 (a, b, distance) 배열 (a < b)
+
+        점유된 칸을 정렬해 이웃 칸끼리만 비교하므로 로봇 수에 거의 선형입니다.
+        """
+        slots = np.flatnonzero(self.keys >= 0)
+        if slots.size < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+
+        keys = self.keys[slots]
+        order = np.argsort(keys, kind='stable')
+        sorted_slots = slots[order]
+        unique_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+        reach = int(math.ceil(radius / self.cell_size))
+        # 자기 칸 + 절반의 이웃 칸만 보면 모든 쌍을 한 번씩 확인
+        offsets = [(0, dy) for dy in range(0, reach + 1)]
+        offsets += [(dx, dy) for dx in range(1, reach + 1) for dy in range(-reach, reach + 1)]
+
+        result_a, result_b = [], []
+        for dx, dy in offsets:
+            neighbour_keys = unique_keys + dx * _KEY_STRIDE + dy
+            index = np.searchsorted(unique_keys, neighbour_keys)
+            index[index >= len(unique_keys)] = 0
+            matched = np.flatnonzero(unique_keys[index] == neighbour_keys)
+            if matched.size == 0:
+                continue
+
+            a_start, a_count = starts[matched], counts[matched]
+            b_start, b_count = starts[index[matched]], counts[index[matched]]
+            pair_counts = a_count * b_count
+            group = np.repeat(np.arange(matched.size), pair_counts)
+            local = np.arange(group.size) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+            ia = local // b_count[group]
+            ib = local % b_count[group]
+            if dx == 0 and dy == 0:
+                keep = ia < ib
+                group, ia, ib = group[keep], ia[keep], ib[keep]
+            result_a.append(sorted_slots[a_start[group] + ia])
+            result_b.append(sorted_slots[b_start[group] + ib])
+
+        if not result_a:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+
+        a = np.concatenate(result_a)
+        b = np.concatenate(result_b)
+        deltas = self.positions[a] - self.positions[b]
+        distances = np.sqrt(np.einsum('ij,ij->i', deltas, deltas))
+        close = distances <= radius
+        a, b, distances = a[close], b[close], distances[close]
+        swap = a > b
+        a[swap], b[swap] = b[swap], a[swap]
+        return a, b, distances
+
+
+class ProximityMonitor:
+    """매 틱 가까운 로봇 쌍을 찾아 새로 발생한 충돌/근접 이벤트를 만듦"""
+
+    def __init__(self, spatial_hash, robot_ids, collision_radius=0.5, near_miss_radius=1.5, max_events=None):
+        self.spatial_hash = spatial_hash
+        # 슬롯 -> 로봇 ID 목록 (엔진의 robot_ids를 그대로 참조)
+        self.robot_ids = robot_ids
+        self.collision_radius = collision_radius
+        self.near_miss_radius = near_miss_radius
+        # 한 틱에 만드는 최대 이벤트 수 (None = 제한 없음), 넘는 이벤트는 'overflow' 이벤트 하나로 묶음
+        self.max_events = max_events
+        # 현재 가까이 있는 쌍 -> 단계 ('collision' / 'near_miss')
+        self.active = {}
+        self.collisions = 0
+        self.near_misses = 0
+
+    def check(self):
+        """새로 발생했거나 단계가 올라간 이벤트 목록"""
+        a, b, distances = self.spatial_hash.close_pairs(self.near_miss_radius)
+
+        events = []
+        limit = len(distances) if self.max_events is None else self.max_events
+        overflow = {'collision': 0, 'near_miss': 0}
+        current = {}
+        for slot_a, slot_b, distance in zip(a.tolist(), b.tolist(), distances.tolist()):
+            level = 'collision' if distance <= self.collision_radius else 'near_miss'
+            pair = (slot_a, slot_b)
+            current[pair] = level
+            previous = self.active.get(pair)
+            if previous == level or previous == 'collision':
+                continue
+            if level == 'collision':
+                self.collisions += 1
+            else:
+                self.near_misses += 1
+            if len(events) >= limit:
+                overflow[level] += 1
+                continue
+            events.append({
+                "type": level,
+                "robots": [self.robot_ids[slot_a], self.robot_ids[slot_b]],
+                "distance": round(distance, 3),
+            })
+        self.active = current
+        if overflow['collision'] or overflow['near_miss']:
+            events.append({"type": "overflow", "collisions": overflow['collision'],
+                           "near_misses": overflow['near_miss']})
+        return events
+
+    def publish(self, publish, events, timestamp=None):
+        """이벤트를 PROXIMITY_TOPIC으로 발송 (publish(topic, payload))"""
+        if timestamp is None:
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for event in events:
+            publish(PROXIMITY_TOPIC, json.dumps(dict(event, timestamp=timestamp)))
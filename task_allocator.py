@@ -0,0 +1,211 @@
+"""필드 작업을 가장 가까운 IDLE 로봇에게 배정하는 작업 배정기
+
+작업 (Task)은 농장 좌표, 역할, 작업 시간을 가지며 submit()으로 어느 스레드에서나 넣을 수 있습니다.
+allocate()는 위치 틱마다 (스케줄러 스레드) IDLE이고 배터리가 min_battery 이상인 로봇으로 KD 트리를 다시 만들고
+대기 중인 작업을 배정합니다. 배정할 로봇이 없는 작업은 대기열에 남아 다음 틱에 다시 시도합니다.
+
+- nearest: 들어온 순서대로 남은 로봇 중 가장 가까운 로봇 (작업마다 트리 검색 한 번)
+- optimal: batch_size개씩 묶어 작업마다 candidates개의 최근접 로봇을 후보로 모으고,
+  이동 거리 합이 최소가 되도록 한 번에 배정 (작업이 몰려 들어올 때 탐욕 배정의 먼 이동을 줄임)
+"""
+import collections
+import math
+import time
+from array import array
+
+import numpy as np
+
+from battery_model import IDLE
+from kd_tree import KDTree
+
+NEAREST = "nearest"
+OPTIMAL = "optimal"
+MODES = (NEAREST, OPTIMAL)
+
+
+class Task:
+    def __init__(self, task_id, x, y, role="EMPTY", duration=60.0):
+        self.task_id = task_id
+        self.x = x
+        self.y = y
+        self.role = role
+        # 도착 후 WORKING 상태로 머무는 시간 (초, 시뮬레이션 시간)
+        self.duration = duration
+        self.submitted_at = None
+
+
+def assign_min_cost(cost):
+    """행마다 서로 다른 열 하나씩, 비용 합이 최소인 배정의 행별 열 번호 배열 (행 수 <= 열 수)
+
+    최단 증가 경로 방식의 헝가리안 알고리즘이며 열 방향 계산은 배열 연산입니다.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    rows, columns = cost.shape
+    if rows > columns:
+        raise ValueError("cost matrix needs at least as many columns as rows")
+    u = np.zeros(rows)
+    v = np.zeros(columns)
+    row_of_column = np.full(columns, -1, dtype=np.int64)
+    column_of_row = np.full(rows, -1, dtype=np.int64)
+
+    for current in range(rows):
+        shortest = np.full(columns, np.inf)
+        path = np.full(columns, -1, dtype=np.int64)
+        visited = np.zeros(columns, dtype=bool)
+        visited_rows = []
+        row = current
+        minimum = 0.0
+        sink = -1
+        while sink < 0:
+            visited_rows.append(row)
+            reduced = minimum + cost[row] - u[row] - v
+            better = ~visited & (reduced < shortest)
+            shortest[better] = reduced[better]
+            path[better] = row
+            remaining = np.where(visited, np.inf, shortest)
+            column = int(remaining.argmin())
+            minimum = float(remaining[column])
+            if minimum == np.inf:
+                raise ValueError("cost matrix is infeasible")
+            visited[column] = True
+            if row_of_column[column] < 0:
+                sink = column
+            else:
+                row = int(row_of_column[column])
+
+        # 쌍대 변수 갱신 후 경로를 따라 배정을 뒤집음
+        u[current] += minimum
+        for row in visited_rows[1:]:
+            u[row] += minimum - shortest[column_of_row[row]]
+        v[visited] -= minimum - shortest[visited]
+        column = sink
+        while True:
+            row = int(path[column])
+            row_of_column[column] = row
+            column_of_row[row], column = column, column_of_row[row]
+            if row == current:
+                break
+    return column_of_row
+
+
+class TaskAllocator:
+    def __init__(self, mode=NEAREST, min_battery=30.0, batch_size=256, candidates=8, leaf_size=32,
+                 clock=time.monotonic):
+        if mode not in MODES:
+            raise ValueError(f"unknown allocation mode: {mode} (choose from {', '.join(MODES)})")
+        self.mode = mode
+        self.min_battery = min_battery
+        self.batch_size = batch_size
+        self.candidates = candidates
+        self.leaf_size = leaf_size
+        # 작업 대기 시간을 재는 시계 (가상 시간 모드에서는 SimClock)
+        self.clock = clock
+        # append (submit)와 popleft / appendleft (allocate)는 각각 한 스레드만 호출
+        self._queue = collections.deque()
+
+        # 통계
+        self.submitted = 0
+        self.assigned = 0
+        self.distance = 0.0
+        # 작업별 대기 시간 (submit -> 배정, clock 기준 초), allocate 호출별 소요 시간 (실제 초)
+        self.wait = array('d')
+        self.allocation_seconds = array('d')
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    def submit(self, task):
+        task.submitted_at = self.clock()
+        self._queue.append(task)
+        self.submitted += 1
+
+    def allocate(self, positions, statuses, battery):
+        """대기 중인 작업을 배정하고 (작업, 슬롯, 이동 거리) 목록 반환 (로봇 상태는 호출하는 쪽에서 바꿈)
+
+        positions (N, 2), statuses, battery는 슬롯 순서의 배열입니다.
+        """
+        if not self._queue:
+            return []
+        started = time.perf_counter()
+        eligible = np.flatnonzero((statuses == IDLE) & (battery >= self.min_battery))
+        if eligible.size == 0:
+            return []
+        points = positions[eligible]
+        tree = KDTree(points, self.leaf_size)
+        tasks = [self._queue.popleft() for _ in range(len(self._queue))]
+
+        if self.mode == NEAREST:
+            assigned, unassigned = self._nearest(tree, tasks)
+        else:
+            assigned, unassigned = [], []
+            for first in range(0, len(tasks), self.batch_size):
+                batch_assigned, batch_unassigned = self._optimal(tree, points, tasks[first:first + self.batch_size])
+                assigned.extend(batch_assigned)
+                unassigned.extend(batch_unassigned)
+        # 배정하지 못한 작업은 들어온 순서대로 대기열 앞에 되돌림
+        self._queue.extendleft(reversed(unassigned))
+
+        self.allocation_seconds.append(time.perf_counter() - started)
+        now = self.clock()
+        result = []
+        for task, index, distance in assigned:
+            self.wait.append(now - task.submitted_at)
+            self.distance += distance
+            result.append((task, int(eligible[index]), distance))
+        self.assigned += len(result)
+        return result
+
+    def _nearest(self, tree, tasks):
+        assigned = []
+        for i, task in enumerate(tasks):
+            if not len(tree):
+                return assigned, tasks[i:]
+            index, distance = tree.nearest(task.x, task.y)
+            index = int(index[0])
+            tree.remove(index)
+            assigned.append((task, index, float(distance[0])))
+        return assigned, []
+
+    def _optimal(self, tree, points, tasks):
+        # 후보 로봇 -> 열 번호, 작업마다 (열 번호 배열, 거리 배열)
+        columns = {}
+        nearest = []
+        for task in tasks:
+            index, distance = tree.nearest(task.x, task.y, k=self.candidates)
+            nearest.append(([columns.setdefault(i, len(columns)) for i in index.tolist()], distance))
+        if not columns:
+            return [], tasks
+
+        # 작업 × 후보 로봇 비용: 자기 후보가 아닌 로봇은 후보 거리를 모두 더한 것보다 큰 값으로 두어
+        # 후보만으로 다 배정할 수 없을 때만 고르게 함 (로봇이 작업보다 적으면 로봇마다 작업 하나를 고름)
+        # 작업이 로봇들의 범위 밖에 있어도 성립하도록 로봇 좌표 범위가 아니라 실제 후보 거리로 정함
+        far = len(tasks) * max(float(distance.max()) for _, distance in nearest if len(distance)) + 1.0
+        cost = np.full((len(tasks), len(columns)), far)
+        for row, (candidates, distance) in enumerate(nearest):
+            cost[row, candidates] = distance
+        columns = np.fromiter(columns, dtype=np.int64, count=len(columns))
+        if len(tasks) <= len(columns):
+            pairs = enumerate(assign_min_cost(cost).tolist())
+        else:
+            pairs = ((row, column) for column, row in enumerate(assign_min_cost(cost.T).tolist()))
+
+        assigned = []
+        taken = set()
+        for row, column in pairs:
+            index = int(columns[column])
+            tree.remove(index)
+            taken.add(row)
+            task = tasks[row]
+            x, y = points[index].tolist()
+            assigned.append((task, index, math.hypot(x - task.x, y - task.y)))
+        assigned.sort(key=lambda item: item[0].submitted_at)
+        return assigned, [task for row, task in enumerate(tasks) if row not in taken]
+
+    def stats(self):
+        return {
+            "submitted": self.submitted,
+            "assigned": self.assigned,
+            "pending": self.pending,
+            "distance": self.distance,
+        }
@@ -0,0 +1,94 @@
+"""위치/상태 메시지를 한 번만 직렬화하는 템플릿 기반 인코더
+
+출력 바이트는 기존 json.dumps(message)와 동일합니다.
+"""
+import json
+import time
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def format_timestamp_ms(timestamp_ms):
+    """UTC epoch 밀리초를 2024-05-01T06:00:00.500Z 형식으로"""
+    seconds, millis = divmod(timestamp_ms, 1000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{millis:03d}Z"
+
+
+class TimestampCache:
+    """초 단위 UTC 타임스탬프 문자열을 초가 바뀔 때만 다시 만듦"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._cached = (None, "")
+
+    def get(self):
+        second = int(self.clock())
+        cached_second, text = self._cached
+        if second != cached_second:
+            text = time.strftime(TIMESTAMP_FORMAT, time.gmtime(second))
+            self._cached = (second, text)
+        return text
+
+
+class MillisecondTimestampCache:
+    """밀리초 단위 UTC 타임스탬프 (초 부분은 초가 바뀔 때만 다시 만듦, 시뮬레이션 시계용)"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._cached = (None, "")
+
+    def get(self):
+        second, millis = divmod(int(round(self.clock() * 1000)), 1000)
+        cached_second, text = self._cached
+        if second != cached_second:
+            text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached = (second, text)
+        return f"{text}.{millis:03d}Z"
+
+
+class TelemetryEncoder:
+    def __init__(self, timestamp_cache=None):
+        self.timestamps = timestamp_cache or TimestampCache()
+        # 로봇별로 미리 만들어 둔 고정 부분 (변하는 값만 채워 넣음)
+        self._prefixes = {}
+        # role / operational_status 값별 JSON 문자열
+        self._strings = {}
+
+    def _prefix(self, robot_id):
+        prefix = self._prefixes.get(robot_id)
+        if prefix is None:
+            prefix = '{"robot_id": %s, "timestamp": "' % json.dumps(robot_id)
+            self._prefixes[robot_id] = prefix
+        return prefix
+
+    def _json_string(self, value):
+        encoded = self._strings.get(value)
+        if encoded is None:
+            encoded = json.dumps(value)
+            self._strings[value] = encoded
+        return encoded
+
+    def position(self, robot_id, x, y, heading, timestamp=None):
+        """위치 메시지 바이트 (x, y, heading은 파이썬 float)"""
+        prefix = self._prefix(robot_id)
+        if timestamp is None:
+            timestamp = self.timestamps.get()
+        return (
+            f'{prefix}{timestamp}", "position": {{"x": {round(x, 2)!r}, "y": {round(y, 2)!r}, "z": 0}}, '
+            f'"heading": {heading!r}}}'
+        ).encode()
+
+    def status(self, robot_id, battery_level, role, operational_status, timestamp=None):
+        """상태 메시지 바이트 (battery_level은 int)"""
+        prefix = self._prefix(robot_id)
+        if timestamp is None:
+            timestamp = self.timestamps.get()
+        return (
+            f'{prefix}{timestamp}", "battery_level": {battery_level}, '
+            f'"role": {self._json_string(role)}, '
+            f'"operational_status": {self._json_string(operational_status)}}}'
+        ).encode()
+
+    def format_log(self, payload):
+        """로그에 표시할 문자열"""
+        return payload.decode()
@@ -0,0 +1,258 @@
+"""발송한 텔레메트리를 바이너리 파일로 기록하고 mmap으로 재생
+
+파일 형식 (리틀 엔디언):
+    헤더 (16바이트): magic b'RSTL', version(u8), 예약(3바이트), 기록 시작 UTC epoch(f64)
+    레코드: kind(u8) offset_us(u64) topic_id(u16) length(u32) + payload
+        kind 0: 토픽 정의 (payload = 토픽 문자열, topic_id 할당)
+        kind 1: 메시지
+
+기록을 닫을 때 <파일>.idx 에 토픽 목록과 시간 -> 파일 위치 색인(JSON)을 함께 저장합니다.
+색인에는 기록 파일의 크기와 기록 시작 시각을 같이 적어 두고, 읽을 때 파일과 맞지 않으면 다시 만듭니다.
+"""
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+
+MAGIC = b'RSTL'
+FORMAT_VERSION = 1
+
+KIND_TOPIC = 0
+KIND_MESSAGE = 1
+
+_FILE_HEADER = struct.Struct('<4sB3xd')
+_RECORD_HEADER = struct.Struct('<BQHI')
+
+# 색인 간격 (마이크로초)
+INDEX_INTERVAL_US = 1_000_000
+
+
+class RecordFormatError(ValueError):
+    pass
+
+
+def index_path(path):
+    return f"{path}.idx"
+
+
+class TelemetryRecorder:
+    """clock: 레코드 시각 기준 (시뮬레이션 시계도 가능), started_at: 헤더에 적을 기록 시작 UTC epoch (기본 현재 시각)"""
+
+    def __init__(self, path, clock=time.monotonic, started_at=None):
+        self.path = path
+        self.clock = clock
+        self._file = open(path, 'wb')
+        # 같은 경로의 이전 기록 색인은 새 기록과 맞지 않으므로 지움 (닫을 때 새로 씀)
+        try:
+            os.remove(index_path(path))
+        except FileNotFoundError:
+            pass
+        self._lock = threading.Lock()
+        self._start = clock()
+        self._topics = {}
+        self._index = []
+        self._next_index_us = 0
+        self.records = 0
+        self.bytes_written = _FILE_HEADER.size
+        self.started_at = time.time() if started_at is None else started_at
+        self._file.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION, self.started_at))
+
+    def record(self, topic, payload):
+        """발송한 메시지 한 건 기록 (여러 스레드에서 호출 가능)"""
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        with self._lock:
+            if self._file is None:
+                return
+            offset_us = max(0, int((self.clock() - self._start) * 1_000_000))
+
+            if offset_us >= self._next_index_us:
+                self._index.append((offset_us, self.bytes_written))
+                self._next_index_us = (offset_us // INDEX_INTERVAL_US + 1) * INDEX_INTERVAL_US
+
+            topic_id = self._topics.get(topic)
+            if topic_id is None:
+                topic_id = len(self._topics)
+                if topic_id > 0xFFFF:
+                    raise RecordFormatError("too many topics")
+                self._topics[topic] = topic_id
+                encoded = topic.encode()
+                self._write(KIND_TOPIC, offset_us, topic_id, encoded)
+
+            self._write(KIND_MESSAGE, offset_us, topic_id, payload)
+            self.records += 1
+
+    def _write(self, kind, offset_us, topic_id, payload):
+        self._file.write(_RECORD_HEADER.pack(kind, offset_us, topic_id, len(payload)))
+        self._file.write(payload)
+        self.bytes_written += _RECORD_HEADER.size + len(payload)
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            _write_index(self.path, list(self._topics), self._index, self.bytes_written, self.started_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _write_index(path, topics, index, size, started_at):
+    """size / started_at: 색인을 만든 기록 파일의 크기와 헤더의 기록 시작 시각 (읽을 때 같은 파일인지 확인)"""
+    with open(index_path(path), 'w', encoding='utf-8') as f:
+        json.dump({"version": FORMAT_VERSION, "size": size, "started_at": started_at,
+                   "topics": topics, "index": index}, f)
+
+
+class TelemetryReader:
+    """기록 파일을 mmap으로 열어 복사 없이 레코드를 읽음
+
+    돌려주는 payload는 memoryview이며 close() 전까지만 유효합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size < _FILE_HEADER.size:
+            # 빈 파일은 mmap할 수 없고 헤더도 읽을 수 없음
+            self._file.close()
+            raise RecordFormatError(f"record file is shorter than its header: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        magic, version, self.started_at = _FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise RecordFormatError(f"not a telemetry record file: {path}")
+        if version != FORMAT_VERSION:
+            raise RecordFormatError(f"unsupported record format version: {version}")
+
+        self.topics, self._index = self._load_index()
+        self._index_offsets = [offset_us for offset_us, _ in self._index]
+
+    def _load_index(self):
+        try:
+            with open(index_path(self.path), encoding='utf-8') as f:
+                data = json.load(f)
+            # 다른 기록 (같은 경로에 다시 기록)이나 닫히기 전 기록의 색인이면 쓰지 않음
+            if (data.get("version") == FORMAT_VERSION and data.get("size") == len(self._mmap)
+                    and data.get("started_at") == self.started_at):
+                return data["topics"], [tuple(entry) for entry in data["index"]]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        # 색인이 없거나 맞지 않으면 (기록 중 종료 등) 레코드 헤더만 훑어서 다시 만듦
+        topics, index = [], []
+        next_index_us = 0
+        for position, kind, offset_us, topic_id, start, end in self._scan(_FILE_HEADER.size):
+            if offset_us >= next_index_us:
+                index.append((offset_us, position))
+                next_index_us = (offset_us // INDEX_INTERVAL_US + 1) * INDEX_INTERVAL_US
+            if kind == KIND_TOPIC:
+                topics.append(bytes(self._view[start:end]).decode())
+        try:
+            _write_index(self.path, topics, index, len(self._mmap), self.started_at)
+        except OSError:
+            pass
+        return topics, index
+
+    def _scan(self, position):
+        size = len(self._mmap)
+        header_size = _RECORD_HEADER.size
+        unpack_from = _RECORD_HEADER.unpack_from
+        while position + header_size <= size:
+            kind, offset_us, topic_id, length = unpack_from(self._mmap, position)
+            start = position + header_size
+            end = start + length
+            if end > size:
+                # 기록 도중 끊긴 마지막 레코드는 무시
+                break
+            yield position, kind, offset_us, topic_id, start, end
+            position = end
+
+    @property
+    def duration(self):
+        """마지막 색인 지점까지의 길이 (초)"""
+        return self._index_offsets[-1] / 1_000_000 if self._index_offsets else 0.0
+
+    def seek(self, start_seconds):
+        """start_seconds 직전 색인 지점의 파일 위치"""
+        i = bisect.bisect_right(self._index_offsets, int(start_seconds * 1_000_000)) - 1
+        return self._index[i][1] if i >= 0 else _FILE_HEADER.size
+
+    def messages(self, start_seconds=0.0):
+        """(offset 초, 토픽, payload memoryview)를 순서대로 반환"""
+        start_us = int(start_seconds * 1_000_000)
+        topics = self.topics
+        view = self._view
+        for _, kind, offset_us, topic_id, start, end in self._scan(self.seek(start_seconds)):
+            if kind != KIND_MESSAGE or offset_us < start_us:
+                continue
+            yield offset_us / 1_000_000, topics[topic_id], view[start:end]
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 아직 참조 중인 payload가 있으면 가비지 컬렉션 때 닫힘
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def replay(reader, publish, speed=1.0, start_seconds=0.0, clock=time.monotonic, sleep=time.sleep):
+    """기록된 메시지를 publish(topic, payload)로 다시 발송하고 발송 건수를 반환
+
+    speed: 1.0 = 실제 속도, N = N배속, None 또는 0 = 최대한 빠르게
+    """
+    count = 0
+    began = clock()
+    for offset, topic, payload in reader.messages(start_seconds):
+        if speed:
+            delay = (offset - start_seconds) / speed - (clock() - began)
+            if delay > 0:
+                sleep(delay)
+        publish(topic, payload)
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록한 텔레메트리를 MQTT 브로커로 재생")
+    parser.add_argument("path", help="기록 파일 (.rec)")
+    parser.add_argument("--broker", default="localhost")
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0 = 최대한 빠르게)")
+    parser.add_argument("--start", type=float, default=0.0, help="재생 시작 위치 (초)")
+    args = parser.parse_args()
+
+    from transport import PahoTransport
+
+    transport = PahoTransport(args.broker, args.port)
+    transport.connect()
+    try:
+        with TelemetryReader(args.path) as reader:
+            print(f"{args.path}: {os.path.getsize(args.path)} bytes, {reader.duration:.1f}s, "
+                  f"{len(reader.topics)} topics")
+            count = replay(reader, transport.publish, speed=args.speed, start_seconds=args.start)
+            print(f"replayed {count} messages")
+    finally:
+        transport.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""배터리 틱: 이동 거리는 엔진이 실제로 움직인 거리만"""
+import pytest
+
+from simulator_core import SimulatorCore
+
+
+@pytest.fixture
+def core():
+    core = SimulatorCore(metrics_file=None)
+    core.scheduler.stop()
+    yield core
+    core.shutdown()
+
+
+def battery(core, robot_id):
+    return float(core.registry.battery[core.registry.slot(robot_id)])
+
+
+def idle_drain(core):
+    """움직이지 않은 로봇 (ROBOT-002)의 한 틱 소모량"""
+    before = battery(core, "ROBOT-002")
+    core.run_battery_model()
+    return before - battery(core, "ROBOT-002")
+
+
+def test_mission_start_is_not_driven_distance(core):
+    before = battery(core, "ROBOT-001")
+    core.fleet_engine.start_mission("ROBOT-001", 500.0, 500.0, 501.0, 500.0, 1.0)
+    idle = idle_drain(core)
+    assert before - battery(core, "ROBOT-001") == pytest.approx(idle)
+
+
+def test_route_start_is_not_driven_distance(core):
+    before = battery(core, "ROBOT-001")
+    core.fleet_engine.start_route("ROBOT-001", [(300.0, 0.0), (300.0, 10.0)], 1.0, start_distance=5.0)
+    idle = idle_drain(core)
+    assert before - battery(core, "ROBOT-001") == pytest.approx(idle)
+
+
+def test_driven_distance_drains_battery(core):
+    engine = core.fleet_engine
+    engine.start_mission("ROBOT-001", 500.0, 500.0, 600.0, 500.0, 1.0)
+    core.run_battery_model()
+    for _ in range(10):
+        engine.step(1.0)
+    assert engine.odometer[engine.slots["ROBOT-001"]] == pytest.approx(10.0)
+
+    before = battery(core, "ROBOT-001")
+    idle = idle_drain(core)
+    assert before - battery(core, "ROBOT-001") > idle
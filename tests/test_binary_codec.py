@@ -0,0 +1,89 @@
+"""binary_codec 인코딩 -> 디코딩 왕복과 잘못된 페이로드 처리"""
+import random
+import struct
+
+import pytest
+
+import binary_codec
+from robot_enums import ROLES, OPERATIONAL_STATUSES
+
+SAMPLES = 1000
+
+
+def test_position_round_trip():
+    """위치는 float32 정밀도 (0.01 m), 방향은 0.01도 단위까지 같아야 함"""
+    rng = random.Random(0)
+    for _ in range(SAMPLES):
+        x = round(rng.uniform(-500, 500), 2)
+        y = round(rng.uniform(-500, 500), 2)
+        heading = round(rng.uniform(0, 360), 2) % 360
+        timestamp_ms = rng.randrange(1_600_000_000_000, 1_900_000_000_000)
+
+        payload = binary_codec.encode_position(x, y, heading, timestamp_ms)
+        assert len(payload) == binary_codec.POSITION_SIZE
+        message = binary_codec.decode(payload, "ROBOT-001")
+        assert message["robot_id"] == "ROBOT-001"
+        assert abs(message["position"]["x"] - x) <= 0.01
+        assert abs(message["position"]["y"] - y) <= 0.01
+        assert message["position"]["z"] == 0
+        assert abs(message["heading"] - heading) < 1e-9
+
+
+def test_status_round_trip():
+    rng = random.Random(1)
+    for _ in range(SAMPLES):
+        battery_level = rng.randrange(0, 101)
+        role = rng.choice(ROLES)
+        operational_status = rng.choice(OPERATIONAL_STATUSES)
+
+        payload = binary_codec.encode_status(battery_level, role, operational_status, 1_700_000_000_000)
+        assert len(payload) == binary_codec.STATUS_SIZE
+        message = binary_codec.decode(payload, "ROBOT-002")
+        assert message["robot_id"] == "ROBOT-002"
+        assert message["battery_level"] == battery_level
+        assert message["role"] == role
+        assert message["operational_status"] == operational_status
+
+
+def test_timestamp_round_trip():
+    """JSON 메시지와 같은 ISO 8601 UTC 문자열"""
+    payload = binary_codec.encode_position(1.0, 2.0, 90.0, 1_700_000_000_123)
+    assert binary_codec.decode(payload)["timestamp"] == "2023-11-14T22:13:20.123Z"
+
+
+def test_encoder_matches_module_functions():
+    encoder = binary_codec.BinaryTelemetryEncoder(clock=lambda: 1_700_000_000.0)
+    assert encoder.position("ROBOT-001", 1.5, 2.5, 45.0) == binary_codec.encode_position(1.5, 2.5, 45.0,
+                                                                                         1_700_000_000_000)
+    assert encoder.status("ROBOT-001", 80, ROLES[0], OPERATIONAL_STATUSES[0]) == binary_codec.encode_status(
+        80, ROLES[0], OPERATIONAL_STATUSES[0], 1_700_000_000_000)
+
+
+def test_version_byte():
+    payload = binary_codec.encode_position(1.0, 2.0, 90.0, 1_700_000_000_000)
+    assert payload[0] == binary_codec.WIRE_VERSION
+    with pytest.raises(binary_codec.DecodeError, match="wire version"):
+        binary_codec.decode(bytes([binary_codec.WIRE_VERSION + 1]) + payload[1:])
+
+
+def test_unknown_enum_code_decodes_as_unknown():
+    payload = struct.pack('<BBQBBB', binary_codec.WIRE_VERSION, binary_codec.KIND_STATUS, 0, 50,
+                          binary_codec.UNKNOWN_CODE, binary_codec.UNKNOWN_CODE)
+    message = binary_codec.decode(payload)
+    assert message["role"] == "UNKNOWN"
+    assert message["operational_status"] == "UNKNOWN"
+
+
+@pytest.mark.parametrize("payload", [
+    b"",
+    b"\x01",
+    bytes([binary_codec.WIRE_VERSION, binary_codec.KIND_POSITION]) + bytes(7),
+    binary_codec.encode_position(1.0, 2.0, 90.0, 0)[:-1],
+    binary_codec.encode_position(1.0, 2.0, 90.0, 0) + b"\x00",
+    binary_codec.encode_status(50, "EMPTY", "IDLE", 0)[:-1],
+    binary_codec.encode_status(50, "EMPTY", "IDLE", 0) + b"\x00",
+    bytes([binary_codec.WIRE_VERSION, 9]) + bytes(18),
+])
+def test_malformed_payload_raises_decode_error(payload):
+    with pytest.raises(binary_codec.DecodeError):
+        binary_codec.decode(payload)
@@ -0,0 +1,98 @@
+"""명령 구독: robot/{id}/command로 받은 명령을 명령 틱에서 적용"""
+import json
+
+import pytest
+
+from simulator_core import COMMAND_INTERVAL, SimulatorCore
+from transport import LoopbackTransport
+
+
+@pytest.fixture
+def core():
+    core = SimulatorCore(metrics_file=None)
+    core.scheduler.stop()
+    core.connect(LoopbackTransport())
+    yield core
+    core.shutdown()
+
+
+def send(core, robot_id, command):
+    core.transport.publish(f"robot/{robot_id}/command", json.dumps(command))
+
+
+def positions(core, robot_id):
+    published = []
+    core.transport.subscribe(f"robot/{robot_id}/position", lambda topic, payload: published.append(json.loads(payload)["position"]))
+    return published
+
+
+def state(core, robot_id):
+    return core.registry.get(robot_id)
+
+
+def test_status_command_updates_registry(core):
+    send(core, "ROBOT-002", {"type": "status", "status": "WORKING", "role": "WATERING", "battery": 55})
+    assert state(core, "ROBOT-002")["operational_status"] != "WORKING"
+
+    core.run_commands()
+    assert state(core, "ROBOT-002")["operational_status"] == "WORKING"
+    assert state(core, "ROBOT-002")["role"] == "WATERING"
+    assert state(core, "ROBOT-002")["battery"] == 55
+    assert core.command_router.applied == 1
+
+
+def test_mission_command_moves_and_publishes(core):
+    published = positions(core, "ROBOT-003")
+    send(core, "ROBOT-003", {"type": "mission", "speed": 10.0, "waypoints": [[1.0, 0.0]], "then": "WORKING"})
+
+    core.run_commands()
+    assert state(core, "ROBOT-003")["operational_status"] == "MOVING"
+    assert published and published[0]["x"] == pytest.approx(0.0)
+    assert core.command_latency.count == 1
+
+    for _ in range(int(1.0 / (10.0 * COMMAND_INTERVAL)) + 2):
+        core.run_commands()
+    assert not core.commanded
+    assert published[-1]["x"] == pytest.approx(1.0)
+    assert state(core, "ROBOT-003")["x"] == pytest.approx(1.0)
+    assert state(core, "ROBOT-003")["operational_status"] == "WORKING"
+
+
+def test_later_status_replaces_mission(core):
+    send(core, "ROBOT-001", {"type": "mission", "speed": 1.0, "waypoints": [[5.0, 5.0]]})
+    send(core, "ROBOT-001", {"type": "status", "status": "PAUSE"})
+
+    core.run_commands()
+    assert not core.commanded
+    assert state(core, "ROBOT-001")["operational_status"] == "PAUSE"
+
+
+def test_status_command_stops_commanded_robot(core):
+    send(core, "ROBOT-001", {"type": "mission", "speed": 1.0, "waypoints": [[50.0, 0.0]]})
+    core.run_commands()
+    core.run_commands()
+    send(core, "ROBOT-001", {"type": "status", "status": "STOP"})
+
+    core.run_commands()
+    slot = core.fleet_engine.slots["ROBOT-001"]
+    assert not core.commanded and not core.fleet_engine.moving[slot]
+    assert state(core, "ROBOT-001")["x"] == pytest.approx(float(core.fleet_engine.positions[slot][0]))
+
+
+def test_charging_robot_ignores_mission(core):
+    core.registry.update("ROBOT-002", operational_status="CHARGING")
+    send(core, "ROBOT-002", {"type": "mission", "speed": 1.0, "waypoints": [[5.0, 5.0]]})
+
+    core.run_commands()
+    assert not core.commanded
+
+
+def test_bad_and_unknown_commands_are_counted(core):
+    send(core, "ROBOT-001", {"type": "mission", "speed": -1, "waypoints": [[5.0, 5.0]]})
+    send(core, "ROBOT-999", {"type": "status", "status": "IDLE"})
+    core.transport.publish("robot/ROBOT-001/command", b"not json")
+
+    core.run_commands()
+    assert core.command_router.rejected == 2
+    assert core.command_router.unknown == 1
+    assert not core.commanded
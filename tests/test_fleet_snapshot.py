@@ -0,0 +1,57 @@
+"""플릿 스냅샷: 로봇 ID 길이 제한과 잘못된 프레임"""
+import numpy as np
+import pytest
+
+from fleet_snapshot import FleetSnapshotDecoder, FleetSnapshotEncoder, SnapshotFanout
+from loadgen import LoadGenerator
+from robot_enums import MAX_ROBOT_ID_BYTES
+from robot_registry import RobotRegistry
+from transport import NullTransport
+
+
+class Recorder(NullTransport):
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, topic, payload, qos=0):
+        self.published.append(topic)
+        return super().publish(topic, payload, qos)
+
+
+def test_keyframe_round_trip_at_id_limit():
+    robot_ids = ["R" * MAX_ROBOT_ID_BYTES, "로봇-1"]
+    encoder = FleetSnapshotEncoder(robot_ids)
+    decoder = FleetSnapshotDecoder()
+    decoder.decode(encoder.encode(np.array([[1.0, 2.0], [3.0, 4.0]]), [0.0, 90.0], 0))
+    assert decoder.robot_ids == robot_ids
+
+
+def test_registry_rejects_long_ids():
+    registry = RobotRegistry()
+    with pytest.raises(ValueError, match="robot id"):
+        registry.add_many(["ROBOT-001", "R" * (MAX_ROBOT_ID_BYTES + 1)])
+    # 한 대라도 잘못되면 아무것도 등록하지 않음
+    assert len(registry) == 0
+    with pytest.raises(ValueError):
+        registry.add("가" * 86)
+
+
+def test_loadgen_rejects_long_ids_at_registration():
+    generator = LoadGenerator(NullTransport(), robots=0, snapshot=True)
+    with pytest.raises(ValueError, match="robot id"):
+        generator._add(["R" * 300], [(0.0, 0.0)], [0], [0], [80.0], False)
+
+
+def test_fanout_drops_malformed_frames():
+    transport = Recorder()
+    fanout = SnapshotFanout(transport)
+    encoder = FleetSnapshotEncoder(["ROBOT-001"])
+    keyframe = encoder.encode(np.array([[1.0, 2.0]]), [0.0], 0)
+
+    for bad in (b"", keyframe[:-1], keyframe[:20] + b"\x02\xff\xfe" + keyframe[31:], b"\x01\x09" + keyframe[2:]):
+        fanout.on_frame("fleet/snapshot", bad)
+    assert fanout.errors == 4 and transport.published == []
+
+    fanout.on_frame("fleet/snapshot", keyframe)
+    assert transport.published == ["robot/ROBOT-001/position"]
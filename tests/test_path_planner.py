@@ -0,0 +1,68 @@
+"""점유 격자 직선 통과 검사와 경로 계획"""
+import numpy as np
+import pytest
+
+from path_planner import OccupancyGrid, PathPlanner, PlanningError
+
+
+def anti_diagonal_wall(size=20):
+    """칸 (x, size - 1 - x)를 막아 꼭짓점끼리만 맞닿은 대각선 벽 (왼쪽 아래와 오른쪽 위가 갈라짐)"""
+    blocked = np.zeros((size, size), dtype=bool)
+    for x in range(size):
+        blocked[size - 1 - x, x] = True
+    return OccupancyGrid(blocked)
+
+
+def segment_cells(grid, start, end, samples=20000):
+    """선분 위 촘촘한 점들의 칸 (검사 결과 비교용)"""
+    t = np.linspace(0.0, 1.0, samples)
+    x = np.floor(start[0] + (end[0] - start[0]) * t).astype(int)
+    y = np.floor(start[1] + (end[1] - start[1]) * t).astype(int)
+    return set(zip(x.tolist(), y.tolist()))
+
+
+def test_line_through_diagonal_wall_corner_is_blocked():
+    grid = anti_diagonal_wall()
+    assert not grid.line_of_sight((0.5, 0.5), (19.5, 19.5))
+    # 꼭짓점을 비켜 가도 대각선 벽을 넘으면 막힘
+    assert not grid.line_of_sight((0.5, 0.7), (19.5, 19.2))
+
+
+def test_plan_does_not_cut_through_diagonal_wall():
+    planner = PathPlanner(anti_diagonal_wall())
+    with pytest.raises(PlanningError):
+        planner.plan((0.5, 0.5), (19.5, 19.5))
+
+
+def test_corner_crossing_needs_both_side_cells_free():
+    blocked = np.zeros((4, 4), dtype=bool)
+    grid = OccupancyGrid(blocked)
+    assert grid.line_of_sight((0.5, 0.5), (3.5, 3.5))
+    # 꼭짓점 (2, 2)의 옆 칸 하나만 막혀도 A*처럼 지나갈 수 없음
+    blocked[1, 2] = True
+    grid = OccupancyGrid(blocked)
+    assert not grid.line_of_sight((0.5, 0.5), (3.5, 3.5))
+    assert not grid.line_of_sight((3.5, 3.5), (0.5, 0.5))
+
+
+def test_line_along_wall_edge_is_blocked():
+    blocked = np.zeros((4, 6), dtype=bool)
+    blocked[1, 2] = True
+    grid = OccupancyGrid(blocked)
+    # y = 2 격자선을 따라 가면 막힌 칸 (2, 1)의 윗변에 닿음
+    assert not grid.line_of_sight((0.5, 2.0), (5.5, 2.0))
+    assert grid.line_of_sight((0.5, 2.5), (5.5, 2.5))
+
+
+def test_matches_dense_sampling_away_from_corners():
+    rng = np.random.default_rng(0)
+    blocked = rng.random((30, 30)) < 0.1
+    grid = OccupancyGrid(blocked)
+    for _ in range(500):
+        start, end = rng.uniform(0, 30, (2, 2)).tolist()
+        expected = all(not blocked[y, x] for x, y in segment_cells(grid, start, end))
+        # 칸을 아주 조금 걸치는 선분은 촘촘한 표본도 놓칠 수 있으므로 표본이 막혔다고 본 경우는 반드시 일치
+        if not expected:
+            assert not grid.line_of_sight(start, end)
+    assert not grid.line_of_sight((-0.5, 1.0), (5.0, 5.0))
+    assert not grid.line_of_sight((1.0, 1.0), (30.0, 5.0))
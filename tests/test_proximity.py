@@ -0,0 +1,73 @@
+"""충돌/근접 감시: 위치가 정해진 로봇만 검사"""
+import time
+
+import pytest
+
+from fleet_engine import FleetEngine
+from simulator_core import SimulatorCore
+from spatial_hash import ProximityMonitor, SpatialHash
+
+
+@pytest.fixture
+def core():
+    core = SimulatorCore(metrics_file=None)
+    yield core
+    core.shutdown()
+
+
+def test_fresh_core_reports_no_events(core):
+    """기본 로봇은 좌표 없이 (0, 0)에 등록되지만 충돌로 보지 않음"""
+    assert core.fleet_engine.count == 3
+    assert core.proximity_monitor.check() == []
+
+
+def test_registered_robots_are_not_indexed(core):
+    core.register_robots(core.next_robot_ids(500))
+    assert core.fleet_engine.count == 503
+    assert not core.fleet_engine.placed[:core.fleet_engine.count].any()
+    assert core.proximity_monitor.check() == []
+
+
+def test_placed_robots_are_checked():
+    engine = FleetEngine(spatial_index=SpatialHash(cell_size=1.5))
+    monitor = ProximityMonitor(engine.spatial_index, engine.robot_ids)
+    engine.add_robot("ROBOT-001")
+    engine.add_robot("ROBOT-002")
+    engine.add_robot("ROBOT-003", 10.0, 10.0)
+    assert monitor.check() == []
+
+    # 미션을 시작하면 위치가 정해져 검사 대상이 됨
+    engine.start_mission("ROBOT-001", 10.3, 10.0, 20.0, 10.0, 1.0)
+    assert monitor.check() == [{"type": "collision", "robots": ["ROBOT-001", "ROBOT-003"], "distance": 0.3}]
+
+    # 좌표 없이 등록된 로봇도 이동을 시작하면 첫 스텝부터 검사
+    engine.start_missions([engine.slots["ROBOT-002"]], [(10.0, 11.0)], 1.0)
+    engine.step(0.5)
+    assert engine.placed[engine.slots["ROBOT-002"]]
+
+
+def test_bulk_registration_stays_cheap(core):
+    """일괄 등록한 로봇 수천 대가 (0, 0)에 겹쳐 틱마다 수백만 쌍을 만들지 않음"""
+    core.register_robots(core.next_robot_ids(3000))
+    started = time.perf_counter()
+    for _ in range(10):
+        assert core.proximity_monitor.check() == []
+    assert time.perf_counter() - started < 1.0
+
+
+def test_events_per_tick_are_capped():
+    engine = FleetEngine(spatial_index=SpatialHash(cell_size=1.5))
+    monitor = ProximityMonitor(engine.spatial_index, engine.robot_ids, max_events=100)
+    for i in range(60):
+        engine.add_robot(f"ROBOT-{i:03d}", 0.0, 0.0)
+    engine.add_robot("ROBOT-FAR", 1.0, 0.0)
+
+    events = monitor.check()
+    assert len(events) == 101
+    overflow = events[-1]
+    assert overflow["type"] == "overflow"
+    # 60대끼리 충돌 1770쌍 + 1 m 떨어진 1대와의 근접 60쌍
+    assert len(events) - 1 + overflow["collisions"] + overflow["near_misses"] == 1770 + 60
+    assert monitor.collisions == 1770 and monitor.near_misses == 60
+    # 이미 알린 쌍은 다음 틱에 다시 만들지 않음
+    assert monitor.check() == []
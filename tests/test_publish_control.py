@@ -0,0 +1,59 @@
+"""발송 역압 제어: 연결이 끊긴 동안의 보류 메시지 처리"""
+from publish_control import PublishController
+from transport import PublishResult
+
+
+class FlakyTransport:
+    """connected가 False이면 모든 발송을 거부하는 백엔드"""
+
+    def __init__(self):
+        self.connected = True
+        self.pending = 0
+        self.attempts = 0
+        self.published = []
+
+    def publish(self, topic, payload, qos=0):
+        self.attempts += 1
+        if not self.connected:
+            return PublishResult(4)
+        self.published.append((topic, payload))
+        return PublishResult(0)
+
+
+def test_outage_counts_each_rejected_message_once():
+    transport = FlakyTransport()
+    controller = PublishController(transport)
+    transport.connected = False
+
+    assert not controller.publish("robot/ROBOT-001/position", "a", key="robot/ROBOT-001/position")
+    assert controller.rejected == 1 and controller.held == 1
+
+    # 끊긴 동안의 주기적인 flush는 다시 보내 보지 않음
+    for _ in range(50):
+        assert controller.flush() == 1
+    assert transport.attempts == 1
+    assert controller.rejected == 1
+
+    # 연결이 돌아오면 보류한 메시지를 보냄
+    transport.connected = True
+    assert controller.flush() == 0
+    assert transport.published == [("robot/ROBOT-001/position", "a")]
+    assert controller.sent == 1 and controller.rejected == 1
+
+
+def test_retry_rejected_again_is_not_recounted():
+    transport = FlakyTransport()
+    controller = PublishController(transport)
+    transport.connected = False
+    controller.publish("t", "a", key="t")
+
+    # 연결된 것으로 보이지만 클라이언트가 계속 거부하는 경우에도 메시지당 한 번
+    transport.publish = lambda topic, payload, qos=0: PublishResult(4)
+    transport.connected = True
+    for _ in range(5):
+        controller.flush()
+    assert controller.rejected == 1 and controller.held == 1
+
+    # 같은 key의 새 메시지는 다른 메시지이므로 거부되면 다시 셈
+    controller.publish("t", "b", key="t")
+    assert controller.rejected == 2 and controller.coalesced == 1
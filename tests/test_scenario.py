@@ -0,0 +1,56 @@
+"""시나리오 파일: 없거나 읽다가 실패한 파일을 조용히 넘기지 않음"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scenario import ScenarioError, ScenarioPlayer, open_scenario
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeTask:
+    def cancel(self):
+        pass
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.stopped = False
+
+    def clock(self):
+        return 0.0
+
+    def schedule(self, interval, callback, delay=None):
+        return FakeTask()
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_missing_file_fails_on_open(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_scenario(tmp_path / "missing.jsonl")
+
+
+def test_read_error_stops_player():
+    def records():
+        raise OSError("disk gone")
+        yield
+
+    scheduler = FakeScheduler()
+    player = ScenarioPlayer(records(), target=None)
+    player.start(scheduler)
+    player.load_batch()
+
+    assert isinstance(player.error, ScenarioError)
+    assert player.finished and scheduler.stopped
+
+
+def test_loadgen_exits_on_missing_scenario(tmp_path):
+    result = subprocess.run([sys.executable, "loadgen.py", "--scenario", str(tmp_path / "missing.jsonl"),
+                             "--duration", "1", "--transport", "null"],
+                            cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode != 0
+    assert "missing.jsonl" in result.stderr
@@ -0,0 +1,63 @@
+"""SimulatorCore 발송 백엔드 연결과 지표 파일"""
+import argparse
+
+import pytest
+
+import simulator_core
+from simulator_core import SimulatorCore
+from transport import NullTransport
+
+
+class RefusedTransport(NullTransport):
+    """브로커에 연결할 수 없는 발송 백엔드"""
+
+    def connect(self):
+        raise ConnectionRefusedError("connection refused")
+
+
+@pytest.fixture
+def core():
+    core = SimulatorCore(metrics_file=None)
+    yield core
+    core.shutdown()
+
+
+def test_failed_connect_leaves_core_disconnected(core):
+    with pytest.raises(ConnectionRefusedError):
+        core.connect(RefusedTransport())
+    assert core.transport is None
+    assert core.publish_controller is None
+    assert core.flush_task is None
+
+
+def test_failed_reconnect_keeps_previous_transport(core):
+    transport = NullTransport()
+    core.connect(transport)
+    controller, flush_task = core.publish_controller, core.flush_task
+    with pytest.raises(ConnectionRefusedError):
+        core.connect(RefusedTransport())
+    assert core.transport is transport
+    assert core.publish_controller is controller
+    assert core.flush_task is flush_task and not flush_task.cancelled
+
+
+def test_metrics_file_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    core = SimulatorCore()
+    core.metrics_exporter.export()
+    core.shutdown()
+    assert list(tmp_path.iterdir()) == []
+
+    path = tmp_path / "metrics.prom"
+    core = SimulatorCore(metrics_file=str(path))
+    core.metrics_exporter.export()
+    core.shutdown()
+    assert "robot_simulator_stage_seconds" in path.read_text()
+
+
+def test_metrics_file_argument():
+    parser = argparse.ArgumentParser()
+    simulator_core.add_metrics_argument(parser)
+    assert parser.parse_args([]).metrics_file is None
+    assert parser.parse_args(["--metrics-file"]).metrics_file == simulator_core.METRICS_FILE
+    assert parser.parse_args(["--metrics-file", "out.prom"]).metrics_file == "out.prom"
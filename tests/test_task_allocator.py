@@ -0,0 +1,34 @@
+"""작업 배정: 로봇 범위 밖의 작업도 후보 로봇에게 배정"""
+import numpy as np
+import pytest
+
+from battery_model import IDLE
+from task_allocator import OPTIMAL, Task, TaskAllocator
+
+
+def allocate(allocator, positions, tasks):
+    for task in tasks:
+        allocator.submit(task)
+    count = len(positions)
+    return {task.task_id: (slot, distance)
+            for task, slot, distance in allocator.allocate(np.array(positions), np.full(count, IDLE),
+                                                           np.full(count, 100.0))}
+
+
+def test_optimal_prefers_candidates_for_tasks_outside_the_fleet():
+    # 로봇은 x 0~2에 모여 있고 작업은 양쪽으로 1000 m 밖 (각 작업의 후보는 가장 가까운 로봇 하나)
+    allocator = TaskAllocator(mode=OPTIMAL, candidates=1)
+    assigned = allocate(allocator, [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0)],
+                        [Task("EAST", 1000.0, 0.0), Task("WEST", -1000.0, 0.0)])
+
+    assert assigned["EAST"] == (2, pytest.approx(998.0))
+    assert assigned["WEST"] == (0, pytest.approx(1000.0))
+    assert allocator.distance == pytest.approx(1998.0)
+
+
+def test_optimal_matches_nearest_when_candidates_do_not_overlap():
+    positions = [(0.0, 0.0), (10.0, 0.0), (20.0, 0.0)]
+    tasks = [Task("A", 1.0, 0.0), Task("B", 11.0, 0.0), Task("C", 19.0, 0.0)]
+    assigned = allocate(TaskAllocator(mode=OPTIMAL), positions, tasks)
+
+    assert {task_id: slot for task_id, (slot, _) in assigned.items()} == {"A": 0, "B": 1, "C": 2}
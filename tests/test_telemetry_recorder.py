@@ -0,0 +1,75 @@
+"""텔레메트리 기록 / 재생 색인"""
+import os
+
+import pytest
+
+from telemetry_recorder import RecordFormatError, TelemetryReader, TelemetryRecorder, index_path
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def record(path, topics, close=True):
+    clock = Clock()
+    recorder = TelemetryRecorder(str(path), clock=clock)
+    for i, topic in enumerate(topics):
+        clock.now = i * 0.5
+        recorder.record(topic, f"payload-{i}")
+    if close:
+        recorder.close()
+    else:
+        recorder._file.flush()
+    return recorder
+
+
+def read(path):
+    with TelemetryReader(str(path)) as reader:
+        return reader.topics, [(offset, topic, bytes(payload).decode()) for offset, topic, payload in reader.messages()]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "run.rec"
+    record(path, ["a/topic", "b/topic", "a/topic"])
+    assert os.path.exists(index_path(str(path)))
+    topics, messages = read(path)
+    assert topics == ["a/topic", "b/topic"]
+    assert messages == [(0.0, "a/topic", "payload-0"), (0.5, "b/topic", "payload-1"), (1.0, "a/topic", "payload-2")]
+
+
+def test_rerecording_drops_old_index(tmp_path):
+    """같은 경로에 다시 기록하고 닫지 않아도 이전 기록의 색인을 쓰지 않음"""
+    path = tmp_path / "run.rec"
+    record(path, ["a/topic", "b/topic"])
+    recorder = record(path, ["c/other"], close=False)
+    assert not os.path.exists(index_path(str(path)))
+    try:
+        topics, messages = read(path)
+    finally:
+        recorder.close()
+    assert topics == ["c/other"]
+    assert messages == [(0.0, "c/other", "payload-0")]
+
+
+def test_mismatched_index_is_rebuilt(tmp_path):
+    """다른 기록의 색인이 남아 있으면 (크기 / 시작 시각이 다르면) 레코드를 훑어 다시 만듦"""
+    old = tmp_path / "old.rec"
+    path = tmp_path / "run.rec"
+    record(old, ["a/topic", "b/topic"])
+    record(path, ["c/other", "c/other", "d/other"])
+    os.replace(index_path(str(old)), index_path(str(path)))
+    topics, messages = read(path)
+    assert topics == ["c/other", "d/other"]
+    assert [topic for _, topic, _ in messages] == ["c/other", "c/other", "d/other"]
+
+
+def test_file_shorter_than_header_raises_format_error(tmp_path):
+    for content in (b"", b"RSTL\x01"):
+        path = tmp_path / "short.rec"
+        path.write_bytes(content)
+        with pytest.raises(RecordFormatError, match="shorter than its header"):
+            TelemetryReader(str(path))
@@ -0,0 +1,77 @@
+"""여러 경유점을 잇는 경로 (누적 거리 테이블 기반 위치/방향 계산)"""
+import bisect
+
+import numpy as np
+
+
+class Trajectory:
+    def __init__(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) == 0:
+            raise ValueError("trajectory needs at least one point")
+
+        # 연속된 중복 경유점 제거 (길이 0인 구간 방지)
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.any(np.diff(points, axis=0) != 0, axis=1)
+        self.points = points[keep]
+
+        # 구간별 길이, 단위 방향 벡터, 방향각과 누적 거리를 한 번만 계산
+        deltas = np.diff(self.points, axis=0)
+        self.segment_lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        self.directions = deltas / self.segment_lengths[:, None] if len(deltas) else deltas
+        angles = np.degrees(np.arctan2(deltas[:, 1], deltas[:, 0]))
+        self.headings = np.round(np.mod(angles, 360.0), 2)
+        self.cumulative = np.concatenate(([0.0], np.cumsum(self.segment_lengths)))
+        self.length = float(self.cumulative[-1])
+
+        # 스칼라 조회용 (한 점씩 계산할 때는 파이썬 리스트가 더 빠름)
+        self._cumulative_list = self.cumulative.tolist()
+        self._points_list = self.points.tolist()
+        self._directions_list = self.directions.tolist()
+        self._headings_list = self.headings.tolist()
+
+    @property
+    def segment_count(self):
+        return len(self.segment_lengths)
+
+    @property
+    def start(self):
+        return tuple(self.points[0])
+
+    @property
+    def end(self):
+        return tuple(self.points[-1])
+
+    def sample(self, distance):
+        """출발점에서 distance만큼 이동한 위치와 방향각 (x, y, heading)"""
+        if self.segment_count == 0:
+            x, y = self._points_list[0]
+            return x, y, 0.0
+
+        if distance >= self.length:
+            x, y = self._points_list[-1]
+            return x, y, self._headings_list[-1]
+
+        index = min(max(bisect.bisect_right(self._cumulative_list, distance) - 1, 0), self.segment_count - 1)
+        offset = max(distance, 0.0) - self._cumulative_list[index]
+        x, y = self._points_list[index]
+        dx, dy = self._directions_list[index]
+        return x + dx * offset, y + dy * offset, self._headings_list[index]
+
+    def sample_many(self, distances):
+        """여러 이동 거리에 대한 위치 (N, 2)와 방향각 (N,) 배열"""
+        distances = np.asarray(distances, dtype=np.float64)
+        if self.segment_count == 0:
+            return np.broadcast_to(self.points[0], (len(distances), 2)).copy(), np.zeros(len(distances))
+
+        distances = np.clip(distances, 0.0, self.length)
+        indices = np.searchsorted(self.cumulative, distances, side='right') - 1
+        np.clip(indices, 0, self.segment_count - 1, out=indices)
+
+        offsets = distances - self.cumulative[indices]
+        positions = self.points[indices] + self.directions[indices] * offsets[:, None]
+
+        # 끝점은 오차 없이 마지막 경유점으로 맞춤
+        finished = distances >= self.length
+        positions[finished] = self.points[-1]
+        return positions, self.headings[indices]
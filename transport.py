@@ -0,0 +1,240 @@
+"""발송 백엔드 (paho MQTT / 프로세스 내부 루프백 브로커 / 바이트만 세는 null / 기록 파일)
+
+모든 백엔드는 같은 인터페이스를 가지며 create_transport(kind)로 만듭니다.
+publish()는 paho와 같이 rc 속성(0 = 성공)을 가진 결과를 돌려줍니다.
+"""
+import time
+
+
+class PublishResult:
+    def __init__(self, rc=0):
+        self.rc = rc
+
+
+_SUCCESS = PublishResult(0)
+
+
+def topic_matches(pattern, topic):
+    """MQTT 토픽 필터 (+, # 와일드카드) 일치 여부"""
+    return _match_levels(pattern.split('/'), topic.split('/'))
+
+
+def _match_levels(pattern_levels, topic_levels):
+    for i, level in enumerate(pattern_levels):
+        if level == '#':
+            return True
+        if i >= len(topic_levels):
+            return False
+        if level != '+' and level != topic_levels[i]:
+            return False
+    return len(pattern_levels) == len(topic_levels)
+
+
+class Transport:
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    @property
+    def pending(self):
+        """받아 두고 아직 내보내지 못한 메시지 수 (동기 백엔드는 항상 0)"""
+        return 0
+
+    @property
+    def connected(self):
+        """지금 발송할 수 있는지 (브로커가 없는 백엔드는 항상 True)"""
+        return True
+
+    def publish(self, topic, payload, qos=0):
+        raise NotImplementedError
+
+    def publish_batch(self, messages, qos=0):
+        """(topic, payload) 목록을 발송하고 성공 건수를 반환"""
+        publish = self.publish
+        return sum(1 for topic, payload in messages if publish(topic, payload, qos).rc == 0)
+
+    def subscribe(self, pattern, callback):
+        """pattern에 맞는 메시지마다 callback(topic, payload) 호출"""
+        raise NotImplementedError
+
+
+class NullTransport(Transport):
+    """아무 데도 보내지 않고 건수와 바이트만 셈 (시뮬레이터 자체 오버헤드 측정용)"""
+
+    def publish(self, topic, payload, qos=0):
+        self.messages += 1
+        self.bytes += len(payload)
+        return _SUCCESS
+
+    def publish_batch(self, messages, qos=0):
+        count = 0
+        size = 0
+        for _, payload in messages:
+            count += 1
+            size += len(payload)
+        self.messages += count
+        self.bytes += size
+        return count
+
+    def subscribe(self, pattern, callback):
+        pass
+
+
+class LoopbackTransport(Transport):
+    """프로세스 내부 브로커 (구독자 콜백을 발송한 스레드에서 바로 호출)"""
+
+    def __init__(self):
+        super().__init__()
+        self._subscriptions = []
+        # 토픽 -> 일치하는 콜백 목록 (구독이 바뀌면 비움)
+        self._routes = {}
+
+    def subscribe(self, pattern, callback):
+        self._subscriptions.append((pattern.split('/'), callback))
+        self._routes = {}
+
+    def unsubscribe(self, callback):
+        self._subscriptions = [(levels, cb) for levels, cb in self._subscriptions if cb is not callback]
+        self._routes = {}
+
+    def _callbacks(self, topic):
+        callbacks = self._routes.get(topic)
+        if callbacks is None:
+            levels = topic.split('/')
+            callbacks = [cb for pattern, cb in self._subscriptions if _match_levels(pattern, levels)]
+            self._routes[topic] = callbacks
+        return callbacks
+
+    def publish(self, topic, payload, qos=0):
+        self.messages += 1
+        self.bytes += len(payload)
+        for callback in self._callbacks(topic):
+            callback(topic, payload)
+        return _SUCCESS
+
+
+class FileTransport(Transport):
+    """브로커 대신 기록 파일(telemetry_recorder 형식)에 씀 (telemetry_recorder.py로 나중에 재생)
+
+    clock에 시뮬레이션 시계를 주면 레코드 시각도 시뮬레이션 시간 기준이 됩니다.
+    """
+
+    def __init__(self, path, clock=time.monotonic, started_at=None):
+        super().__init__()
+        from telemetry_recorder import TelemetryRecorder
+
+        self.path = path
+        self.recorder = TelemetryRecorder(path, clock=clock, started_at=started_at)
+
+    def disconnect(self):
+        self.recorder.close()
+
+    def publish(self, topic, payload, qos=0):
+        self.recorder.record(topic, payload)
+        self.messages += 1
+        self.bytes += len(payload)
+        return _SUCCESS
+
+    def subscribe(self, pattern, callback):
+        pass
+
+
+class PahoTransport(Transport):
+    """paho-mqtt 클라이언트
+
+    on_connect(rc) / on_disconnect(rc) 콜백은 paho 네트워크 스레드에서 호출됩니다.
+    max_inflight / max_queued는 QoS 1, 2 메시지에 대한 paho 제한이며 (0 = 제한 없음),
+    QoS 0 메시지의 쌓임은 pending으로 확인합니다.
+    """
+
+    def __init__(self, host="localhost", port=1883, keepalive=60, client_id="", max_inflight=20, max_queued=0):
+        super().__init__()
+        import paho.mqtt.client as mqtt
+
+        self.host = host
+        self.port = port
+        self.keepalive = keepalive
+        self.client = mqtt.Client(client_id=client_id)
+        self.client.max_inflight_messages_set(max_inflight)
+        self.client.max_queued_messages_set(max_queued)
+        self.on_connect = None
+        self.on_disconnect = None
+        self._patterns = []
+        # 발송 스레드가 올리는 수락 건수와 네트워크 스레드가 올리는 완료 건수 (각자 한 스레드만 씀)
+        self._accepted = 0
+        self._completed = 0
+        self.client.on_connect = self._handle_connect
+        self.client.on_disconnect = self._handle_disconnect
+        self.client.on_publish = self._handle_publish
+
+    def _handle_connect(self, client, userdata, flags, rc):
+        # 재연결 시 구독 복구, 끊기 전에 쌓여 있던 QoS 0 패킷은 paho가 버리므로 대기 건수도 비움
+        if rc == 0:
+            self._completed = self._accepted
+            for pattern in self._patterns:
+                client.subscribe(pattern)
+        if self.on_connect:
+            self.on_connect(rc)
+
+    def _handle_disconnect(self, client, userdata, rc):
+        if self.on_disconnect:
+            self.on_disconnect(rc)
+
+    def _handle_publish(self, client, userdata, mid):
+        # QoS 0은 소켓에 쓴 시점, QoS 1/2는 브로커 응답을 받은 시점
+        self._completed += 1
+
+    @property
+    def pending(self):
+        return max(0, self._accepted - self._completed)
+
+    @property
+    def connected(self):
+        return self.client.is_connected()
+
+    def connect(self):
+        self.client.connect(self.host, self.port, self.keepalive)
+        self.client.loop_start()
+
+    def disconnect(self):
+        self.client.loop_stop()
+        self.client.disconnect()
+
+    def publish(self, topic, payload, qos=0):
+        if isinstance(payload, memoryview):
+            payload = payload.tobytes()
+        result = self.client.publish(topic, payload, qos)
+        if result.rc == 0:
+            self._accepted += 1
+            self.messages += 1
+            self.bytes += len(payload)
+        return result
+
+    def subscribe(self, pattern, callback):
+        self.client.message_callback_add(pattern, lambda client, userdata, message: callback(message.topic, message.payload))
+        self._patterns.append(pattern)
+        if self.client.is_connected():
+            self.client.subscribe(pattern)
+
+
+TRANSPORTS = {
+    'paho': PahoTransport,
+    'loopback': LoopbackTransport,
+    'null': NullTransport,
+    'file': FileTransport,
+}
+
+
+def create_transport(kind, **options):
+    """kind ('paho' / 'loopback' / 'null' / 'file')에 맞는 발송 백엔드 생성"""
+    try:
+        factory = TRANSPORTS[kind]
+    except KeyError:
+        raise ValueError(f"unknown transport: {kind} (choose from {', '.join(TRANSPORTS)})") from None
+    return factory(**options)